@@ -2,50 +2,120 @@ from __future__ import annotations
 import streamlit as st
 import sys
 import os
+import uuid
 
 # Streamlit Cloud에서 모듈 경로 문제 해결
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from services import metrics
+
+rerun = metrics.start_rerun("app")
+
 from ui.components import (
-    page_header, left_panel, right_panel, show_ai_feedback, show_okr_evaluation
+    debug_panel, inject_styles, page_header, left_panel, poll_ai_feedback, right_panel, saved_progress,
+    show_okr_evaluation,
 )
-from services.ai_validator import validate_okr
 from config.settings import settings
 
-# CSS 로드
-css_path = os.path.join(os.path.dirname(__file__), "ui", "styles.css")
-with open(css_path, "r", encoding="utf-8") as f:
-    st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+metrics.start_prometheus_server()
+
+# CSS 로드 (파일은 프로세스당 한 번만 읽음)
+with metrics.phase("css"):
+    inject_styles()
 
 page_header()
 
+# 무거운 모듈(SQLAlchemy, pydantic 등)은 헤더를 먼저 그린 뒤 불러옴 (OpenAI SDK는 첫 호출 때)
+with metrics.phase("imports"):
+    from services.ai_validator import progress_review_prompt
+    from services.okr_service import (
+        autosave_draft, daily_feedback, draft_stats, load_draft, objective_progress, read_cache_stats,
+        record_daily_progress,
+    )
+    from services.validation_jobs import job_queue
+
 # 세션 상태 초기화
 if 'ai_feedback' not in st.session_state:
     st.session_state.ai_feedback = ""
+# 초안 작성자 키: URL(?draft=)에 남겨 같은 주소로 다시 열면 이 세션의 초안을 이어서 불러온다
+if 'draft_session_id' not in st.session_state:
+    st.session_state.draft_session_id = st.query_params.get("draft") or uuid.uuid4().hex
+    st.query_params["draft"] = st.session_state.draft_session_id
+session_id = st.session_state.draft_session_id
+
+
+def take_validation_result(job) -> None:
+    """끝난 검증 작업의 결과를 세션에 한 번만 옮긴다 (LLM 측정값은 다음 전체 rerun에 붙임)."""
+    if st.session_state.get("validation_job_id") == job.id:
+        del st.session_state["validation_job_id"]
+        st.session_state.ai_feedback = job.text
+        st.session_state.validation_llm_calls = job.llm_calls
+
+
+# 백그라운드 검증이 끝났으면 결과를 세션에 반영
+job_id = st.session_state.get("validation_job_id")
+if job_id:
+    job = job_queue.get(job_id)
+    if job is None:
+        del st.session_state["validation_job_id"]
+    elif job.done:
+        take_validation_result(job)
+    job_id = st.session_state.get("validation_job_id")
+metrics.attach_llm_calls(rerun, st.session_state.pop("validation_llm_calls", []))
 
 # 좌우 분할 레이아웃
 col1, col2 = st.columns([1, 1], gap="large")
 
 # 좌측 패널: OKR 설정
-with col1:
+with col1, metrics.phase("left_panel"):
     objective, krs, start_date, end_date, progress_percentage = left_panel()
 
 # 우측 패널: 달력 및 수행내역
-with col2:
-    calendar_date, progress_content, should_validate = right_panel(ai_feedback=st.session_state.ai_feedback)
+with col2, metrics.phase("right_panel"):
+    calendar_date, progress_content, should_validate, feedback_slot, history_slot = right_panel(
+        ai_feedback=st.session_state.ai_feedback,
+        load_draft=lambda day: load_draft(session_id, objective, krs, start_date, end_date, day),
+    )
+
+# 입력 중인 수행내역은 초안 버퍼에만 넣음 (DB 저장은 백그라운드에서 모아서)
+autosave_draft(session_id, objective, krs, start_date, end_date, calendar_date, progress_content)
 
-# AI 검증 처리
+# AI 검증 처리: 수행내역을 저장하고 작업 큐에 넣은 뒤 바로 반환 (결과는 DailyProgress에 저장됨)
 if should_validate and progress_content.strip():
-    with st.spinner("AI가 수행내역을 검증 중입니다..."):
+    with metrics.phase("validation"):
         # 수행내역 검증을 위한 간단한 프롬프트 구성
-        user_prompt = f"다음 수행내역이 OKR 목표 달성에 기여하는지 평가해주세요: {progress_content}"
-        st.session_state.ai_feedback = validate_okr(objective, krs, progress_content, user_prompt, model=settings.openai_model)
-    
-    # 페이지 새로고침하여 AI 검증 결과 표시
-    st.rerun()
+        user_prompt = progress_review_prompt(progress_content)
+        dp_id = record_daily_progress(
+            objective, krs, start_date, end_date, calendar_date, progress_content, session_id=session_id,
+        )
+        job = job_queue.submit(
+            objective, krs, progress_content, user_prompt, model=settings.openai_model, daily_progress_id=dp_id,
+        )
+        job_id = st.session_state.validation_job_id = job.id
 
-# OKR 진행 평가 표시 (좌측 하단)
-with col1:
-    show_okr_evaluation(objective, krs, progress_percentage)
+# 선택한 날짜의 저장된 수행내역/검증 결과 (저장된 구조에서 다시 그림, 모델 호출 없음)
+with history_slot, metrics.phase("saved_progress"):
+    saved_progress(daily_feedback(objective, start_date, end_date, calendar_date))
+
+# 진행 중인 검증은 응답 버퍼를 주기적으로 표시 (fragment만 rerun, 화면은 계속 조작 가능)
+if job_id:
+    with col2:
+        poll_ai_feedback(
+            feedback_slot, lambda job_id=job_id: job_queue.get(job_id), take_validation_result,
+            settings.ai_job_poll_seconds,
+        )
+
+# OKR 진행 평가 표시 (좌측 하단): 저장된 OKR이면 KR 업데이트로 계산된 롤업, 아니면 슬라이더 값
+with col1, metrics.phase("show_okr_evaluation"):
+    rollup = objective_progress(objective, start_date, end_date)
+    if rollup is None:
+        show_okr_evaluation(objective, krs, progress_percentage)
+    else:
+        show_okr_evaluation(objective, krs, rollup.progress, rollup.status)
 
 st.caption("Made with Streamlit · OpenAI")
+
+metrics.finish_rerun(rerun)
+# ?debug=1 또는 METRICS_DEBUG_PANEL=1 일 때만 표시
+if settings.metrics_debug_panel or st.query_params.get("debug") == "1":
+    debug_panel(rerun, read_cache_stats(), draft_stats())
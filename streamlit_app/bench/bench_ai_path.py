@@ -0,0 +1,185 @@
+"""AI 검증 경로 벤치마크: 로컬 스텁 서버를 상대로 validate_okr 경로의 지연시간/처리량 측정 (오프라인)
+
+실행: python streamlit_app/bench/bench_ai_path.py --requests 200 --concurrency 8 --latency-ms 200 [--stream]
+      [--forbidden-model gpt-5-nano] [--rate-limit-ratio 0.1] [--slow-ratio 0.05 --hedge] [--rate 20]
+"""
+from __future__ import annotations
+import argparse
+import hashlib
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.stub_openai import STUB_API_KEY, StubConfig, StubOpenAIServer, add_arguments, config_from_args
+
+OBJECTIVE = "큐런 베타 서비스를 대학생 취준생 대상 1000명에게 배포하고 사용성 피드백을 받는다"
+UNTHROTTLED_RATE = 100_000.0
+KEY_RESULTS = ["인천대 학생 300명 배포", "수원대 학생 300명 배포", "취준생 커뮤니티 400명 배포"]
+
+
+def percentile(values: List[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(p / 100 * (len(ordered) - 1))))]
+
+
+def summarize(values: List[float]) -> dict:
+    """초 단위 값 목록을 ms 단위 p50/p95/p99/max로 요약"""
+    return {
+        "p50_ms": round(percentile(values, 50) * 1000, 1),
+        "p95_ms": round(percentile(values, 95) * 1000, 1),
+        "p99_ms": round(percentile(values, 99) * 1000, 1),
+        "max_ms": round(max(values, default=0.0) * 1000, 1),
+        "mean_ms": round(statistics.fmean(values) * 1000, 1) if values else 0.0,
+    }
+
+
+@contextmanager
+def stub_environment(server: StubOpenAIServer, rate_per_second: Optional[float] = None) -> Iterator[None]:
+    """검증 서비스가 스텁 서버를 쓰도록 환경변수를 바꾸고 끝나면 되돌린다.
+
+    공용 요청 리미터는 rate_per_second(기본: 사실상 제한 없음)로 바꿔 호출 경로 자체를 측정한다.
+    """
+    from services import ai_validator
+    from services.rate_limit import shared_limiter
+
+    saved = {key: os.environ.get(key) for key in ("OPENAI_API_KEY", "OPENAI_BASE_URL")}
+    os.environ["OPENAI_API_KEY"] = STUB_API_KEY
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    ai_validator.model_registry.clear()
+    limiter = shared_limiter()
+    saved_rate = (limiter.rate, limiter.capacity) if limiter is not None else None
+    if limiter is not None:
+        limiter.set_rate(rate_per_second or UNTHROTTLED_RATE)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        ai_validator.model_registry.clear()
+        if limiter is not None and saved_rate is not None:
+            limiter.set_rate(*saved_rate)
+
+
+_TAG_LETTERS = str.maketrans("0123456789", "ghijklmnop")
+
+
+def _notes(run_id: str, i: int) -> str:
+    # 실행/요청마다 내용을 달리해 응답 캐시 적중 없이 실제 호출 경로를 측정
+    # 숫자만 다르면 유사 수행내역으로 재사용되므로 요청마다 다른 영문 태그를 붙인다
+    tag = hashlib.sha256(f"{run_id}-{i}".encode("utf-8")).hexdigest().translate(_TAG_LETTERS)
+    return f"[{tag}] 인천대 커뮤니티에 모집 글 게시, 신청 {i % 50}명. 수원대 교수님께 안내 메일 발송."
+
+
+def run(
+    requests: int,
+    concurrency: int,
+    stream: bool = False,
+    config: Optional[StubConfig] = None,
+    model: Optional[str] = None,
+    hedge: bool = False,
+    rate_per_second: Optional[float] = None,
+) -> dict:
+    """스텁 서버를 띄우고 requests건을 concurrency개 스레드로 검증해 결과를 dict로 반환한다.
+
+    hedge=True면 느린 요청 헤지(AI_HEDGE_ENABLED)를 켜고 측정한다 (응답 시간 표본은 새로 모음).
+    """
+    from services import metrics
+    from services.ai_validator import run_validation, validate_okr_stream
+    from services.resilience import LatencyTracker, hedging
+
+    config = config or StubConfig()
+    run_id = uuid.uuid4().hex[:8]
+    latencies: List[float] = []
+    ttfts: List[float] = []
+    models: Dict[str, int] = {}
+    outcome = {"ok": 0, "failed": 0, "cached": 0, "attempts": 0}
+
+    def _one(i: int) -> None:
+        # 스레드별 측정값(LLMCallMetrics)으로 성공 여부/실제 모델을 확인
+        measured = metrics.start_rerun("bench_ai_path")
+        started = time.perf_counter()
+        if stream:
+            first: Optional[float] = None
+            for _ in validate_okr_stream(OBJECTIVE, KEY_RESULTS, _notes(run_id, i), model=model):
+                if first is None:
+                    first = time.perf_counter() - started
+                    ttfts.append(first)
+        else:
+            run_validation(OBJECTIVE, KEY_RESULTS, _notes(run_id, i), model=model)
+        latencies.append(time.perf_counter() - started)
+        call = measured.llm_calls[-1]
+        outcome["ok" if call.ok else "failed"] += 1
+        outcome["cached"] += int(call.cached)
+        outcome["attempts"] += call.attempts
+        used = call.model or "none"
+        models[used] = models.get(used, 0) + 1
+
+    saved_hedge = hedging.enabled
+    hedging.enabled, hedging.latencies = hedge, LatencyTracker()
+    try:
+        with StubOpenAIServer(config) as server, stub_environment(server, rate_per_second):
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+                list(pool.map(_one, range(requests)))
+            elapsed = time.perf_counter() - started
+            stats = vars(server.stats).copy()
+    finally:
+        hedging.enabled = saved_hedge
+
+    result = {
+        "requests": requests,
+        "concurrency": concurrency,
+        "stream": stream,
+        "hedge": hedge,
+        "rate_per_second": rate_per_second,
+        "stub": {
+            "latency_ms": config.latency_ms,
+            "ttft_ms": config.ttft_ms,
+            "forbidden_models": sorted(config.forbidden_models),
+            "rate_limit_ratio": config.rate_limit_ratio,
+            "slow_ratio": config.slow_ratio,
+            "slow_latency_ms": config.slow_latency_ms,
+        },
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_per_second": round(requests / elapsed, 2) if elapsed else 0.0,
+        "latency": summarize(latencies),
+        **outcome,
+        "models": models,
+        "server": stats,
+    }
+    if stream:
+        result["ttft"] = summarize(ttfts)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="AI 검증 경로 오프라인 벤치마크")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--stream", action="store_true", help="validate_okr_stream 경로 측정")
+    parser.add_argument("--model", help="요청 모델 (기본: OPENAI_MODEL)")
+    parser.add_argument("--hedge", action="store_true", help="느린 요청 헤지를 켜고 측정")
+    parser.add_argument("--rate", type=float, help="공용 리미터 초당 요청 수 (기본: 제한 없음)")
+    add_arguments(parser)
+    args = parser.parse_args()
+    print(json.dumps(
+        run(args.requests, args.concurrency, args.stream, config_from_args(args), args.model, args.hedge, args.rate),
+        indent=2, ensure_ascii=False,
+    ))
+
+
+if __name__ == "__main__":
+    main()
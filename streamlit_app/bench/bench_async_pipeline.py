@@ -0,0 +1,183 @@
+"""일괄 검증 파이프라인 벤치마크: 스레드 방식(validate_pending) vs asyncio 방식(validate_pending_async)
+
+임시 SQLite에 미검증 수행내역 rows건을 넣고 로컬 스텁 서버를 상대로 두 방식을 같은 동시 요청 수로 실행해
+처리량, 지연시간, 클라이언트 쪽 최대 스레드 수를 비교한다 (오프라인).
+스텁 서버는 기본적으로 별도 프로세스에서 띄운다 (같은 프로세스면 서버 스레드와 GIL을 나눠 써서 클라이언트 비용이 가려짐).
+
+실행: python streamlit_app/bench/bench_async_pipeline.py --rows 400 --concurrency 8 32 128 --latency-ms 200 [--in-process-stub]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import date, timedelta
+from types import SimpleNamespace
+from typing import Callable, Iterator, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.bench_ai_path import KEY_RESULTS, OBJECTIVE, _notes, stub_environment
+from bench.stub_openai import StubConfig, StubOpenAIServer, add_arguments, config_from_args
+
+MODES = ("threads", "async")
+STUB_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub_openai.py")
+
+
+@contextmanager
+def _stub_process(config: StubConfig) -> Iterator[SimpleNamespace]:
+    """스텁 서버를 별도 프로세스로 띄우고 base_url을 가진 객체를 돌려준다."""
+    args = [
+        sys.executable, STUB_SCRIPT, "--port", "0",
+        "--latency-ms", str(config.latency_ms),
+        "--rate-limit-ratio", str(config.rate_limit_ratio),
+        "--retry-after", str(config.retry_after_seconds),
+        "--max-rps", str(config.max_requests_per_second),
+        "--slow-ratio", str(config.slow_ratio),
+        "--slow-latency-ms", str(config.slow_latency_ms),
+        *(arg for model in sorted(config.forbidden_models) for arg in ("--forbidden-model", model)),
+    ]
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, text=True)
+    try:
+        # 첫 줄: "stub listening on http://127.0.0.1:<port>/v1 (api key: ...)"
+        line = proc.stdout.readline()
+        if not line:
+            raise RuntimeError("스텁 서버를 시작하지 못했습니다")
+        yield SimpleNamespace(base_url=line.split()[3])
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def _seed(rows: int) -> None:
+    """현재 DB(repository)에 Objective 1개와 미검증 수행내역 rows건을 넣는다 (내용은 실행마다 달라 캐시 적중 없음)."""
+    from db import repository as repo
+
+    repo.init_db()
+    company = repo.upsert_company("bench")
+    cycle = repo.create_cycle(company.id, "bench", date(2025, 1, 1), date(2025, 12, 31))
+    objective_id, _ = repo.create_objective_with_krs(cycle.id, "bench", OBJECTIVE, KEY_RESULTS)
+    run_id = uuid.uuid4().hex[:8]
+    repo.bulk_add_daily_progress(
+        {"objective_id": objective_id, "date": date(2025, 1, 1) + timedelta(days=i % 365), "content": _notes(run_id, i)}
+        for i in range(rows)
+    )
+
+
+class _ThreadSampler:
+    """실행 중 클라이언트 쪽 스레드 수의 최댓값을 잰다 (같은 프로세스 스텁 서버의 요청 처리 스레드 제외)."""
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="bench-thread-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            count = sum(
+                1 for t in threading.enumerate()
+                if "process_request_thread" not in t.name and t is not self._thread
+            )
+            self.peak = max(self.peak, count)
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "_ThreadSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def _run_threads(url: str, concurrency: int) -> dict:
+    from db import repository as repo
+    from services.batch_validator import validate_pending
+
+    repo.reset_engine(url)
+    try:
+        return validate_pending(concurrency=concurrency, rate_per_second=0).as_dict()
+    finally:
+        repo.reset_engine()
+
+
+async def _run_async(url: str, concurrency: int) -> dict:
+    from db import async_repository
+    from services.batch_validator import validate_pending_async
+
+    await async_repository.reset_engine(url)
+    try:
+        return (await validate_pending_async(concurrency=concurrency, rate_per_second=0)).as_dict()
+    finally:
+        await async_repository.reset_engine()
+
+
+def _measure(rows: int, mode: str, concurrency: int) -> dict:
+    """새 임시 DB에 rows건을 넣고 mode로 일괄 검증한 결과"""
+    from db import repository as repo
+
+    runners: dict[str, Callable[[str], dict]] = {
+        "threads": lambda url: _run_threads(url, concurrency),
+        "async": lambda url: asyncio.run(_run_async(url, concurrency)),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        repo.reset_engine(url)
+        try:
+            _seed(rows)
+        finally:
+            repo.reset_engine()
+        with _ThreadSampler() as sampler:
+            report = runners[mode](url)
+    return {"mode": mode, "concurrency": concurrency, **report, "peak_client_threads": sampler.peak}
+
+
+def run(
+    rows: int, concurrency_levels: List[int], config: Optional[StubConfig] = None, in_process_stub: bool = False,
+) -> dict:
+    """동시 요청 수마다 두 방식을 실행해 결과와 async/threads 처리량 비율을 반환한다."""
+    config = config or StubConfig()
+    results = []
+    stub = StubOpenAIServer(config) if in_process_stub else _stub_process(config)
+    with stub as server, stub_environment(server):
+        for concurrency in concurrency_levels:
+            for mode in MODES:
+                results.append(_measure(rows, mode, concurrency))
+    by_key = {(r["mode"], r["concurrency"]): r for r in results}
+    return {
+        "rows": rows,
+        "stub": {"latency_ms": config.latency_ms, "jitter": config.jitter, "in_process": in_process_stub},
+        "results": results,
+        "speedup": {
+            str(c): round(
+                by_key[("async", c)]["throughput_per_minute"] / by_key[("threads", c)]["throughput_per_minute"], 2,
+            )
+            for c in concurrency_levels
+            if by_key[("threads", c)]["throughput_per_minute"]
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="일괄 검증: 스레드 방식 vs asyncio 방식 처리량 비교 (오프라인)")
+    parser.add_argument("--rows", type=int, default=400, help="미검증 수행내역 수")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32, 128], help="동시 요청 수 (여러 개 가능)")
+    parser.add_argument("--in-process-stub", action="store_true", help="스텁 서버를 같은 프로세스 스레드로 실행")
+    add_arguments(parser)
+    args = parser.parse_args()
+    started = time.perf_counter()
+    result = run(args.rows, args.concurrency, config_from_args(args), args.in_process_stub)
+    result["elapsed_seconds"] = round(time.perf_counter() - started, 1)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
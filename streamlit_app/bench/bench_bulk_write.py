@@ -0,0 +1,86 @@
+"""Bulk write 벤치마크: 행 단위 API와 bulk API의 초당 처리 행 수 비교
+
+실행: python streamlit_app/bench/bench_bulk_write.py --rows 5000
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _rate(rows: int, seconds: float) -> float:
+    return round(rows / seconds, 1) if seconds else 0.0
+
+
+def run(rows: int, krs_per_objective: int = 10, objectives: int = 50) -> dict:
+    """행 단위 경로와 bulk 경로를 같은 DB에서 측정해 결과를 dict로 반환한다."""
+    from db import repository as repo
+
+    repo.init_db()
+    company = repo.upsert_company("bench-co")
+    cycle = repo.create_cycle(company.id, "bench", date.today(), date.today() + timedelta(days=90))
+    kr = repo.add_kr(repo.create_objective(cycle.id, "bench", "seed").id, "seed kr")
+
+    results: dict = {"rows": rows}
+
+    started = time.perf_counter()
+    for i in range(rows):
+        repo.add_kr_update(kr.id, f"note {i}", progress=i % 100)
+    per_row = time.perf_counter() - started
+
+    started = time.perf_counter()
+    repo.bulk_add_kr_updates({"kr_id": kr.id, "note": f"note {i}", "progress": i % 100} for i in range(rows))
+    bulk = time.perf_counter() - started
+    results["kr_updates"] = {
+        "per_row_rows_per_sec": _rate(rows, per_row),
+        "bulk_rows_per_sec": _rate(rows, bulk),
+        "speedup": round(per_row / bulk, 1) if bulk else None,
+    }
+
+    kr_texts = [f"KR {j}" for j in range(krs_per_objective)]
+    created = objectives * (krs_per_objective + 1)
+
+    started = time.perf_counter()
+    for i in range(objectives):
+        obj = repo.create_objective(cycle.id, "bench", f"objective {i}")
+        for text in kr_texts:
+            repo.add_kr(obj.id, text)
+    per_row = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for i in range(objectives):
+        repo.create_objective_with_krs(cycle.id, "bench", f"objective {i}", kr_texts)
+    bulk = time.perf_counter() - started
+    results["objectives_with_krs"] = {
+        "objectives": objectives,
+        "krs_per_objective": krs_per_objective,
+        "per_row_rows_per_sec": _rate(created, per_row),
+        "bulk_rows_per_sec": _rate(created, bulk),
+        "speedup": round(per_row / bulk, 1) if bulk else None,
+    }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="repository bulk write 벤치마크")
+    parser.add_argument("--rows", type=int, default=5000, help="KR 업데이트 행 수")
+    parser.add_argument("--objectives", type=int, default=50, help="생성할 Objective 수")
+    parser.add_argument("--krs", type=int, default=10, help="Objective당 KR 수")
+    args = parser.parse_args()
+
+    from db import repository as repo
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo.reset_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        print(json.dumps(run(args.rows, args.krs, args.objectives), indent=2))
+        repo.reset_engine()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""KR 추세/예측 벤치마크: 10k KR × 100 업데이트에 대한 벡터화 계산 vs 행 단위 Python 계산
+
+실행: python streamlit_app/bench/bench_forecast.py --krs 10000 --updates 100 [--with-db]
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.kr_forecast import forecast_columns, to_columns
+
+CYCLE_DAYS = 90
+
+
+def _synthetic(krs: int, updates: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    kr_ids = np.repeat(np.arange(1, krs + 1), updates)
+    days = np.sort(rng.uniform(0, CYCLE_DAYS * 0.6, (krs, updates)), axis=1).ravel()
+    rates = rng.uniform(0.2, 2.0, krs)
+    progress = np.clip(days * np.repeat(rates, updates) + rng.normal(0, 3, days.size), 0, None)
+    return kr_ids, days, progress
+
+
+def _row_by_row(kr_ids, days, progress, end_day: float) -> dict:
+    """비교 기준: KR마다 Python 루프로 최소제곱 기울기/예상치 계산"""
+    groups: dict = {}
+    for kr_id, x, y in zip(kr_ids.tolist(), days.tolist(), progress.tolist()):
+        groups.setdefault(kr_id, []).append((x, y))
+    result = {}
+    for kr_id, points in groups.items():
+        n = len(points)
+        mx = sum(p[0] for p in points) / n
+        my = sum(p[1] for p in points) / n
+        sxx = sum((p[0] - mx) ** 2 for p in points)
+        sxy = sum((p[0] - mx) * (p[1] - my) for p in points)
+        slope = sxy / sxx if sxx else 0.0
+        result[kr_id] = my + slope * (end_day - mx)
+    return result
+
+
+def _with_db(krs: int, updates: int) -> dict:
+    from db import repository as repo
+
+    kr_ids, days, progress = _synthetic(krs, updates)
+    with tempfile.TemporaryDirectory() as tmp:
+        repo.reset_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        repo.init_db()
+        start = date(2025, 1, 1)
+        company = repo.upsert_company("bench-co")
+        cycle = repo.create_cycle(company.id, "bench", start, start + timedelta(days=CYCLE_DAYS))
+        per_objective = 10
+        id_map = {}
+        for i in range(0, krs, per_objective):
+            _, ids = repo.create_objective_with_krs(
+                cycle.id, "bench", f"objective {i}", [f"KR {j}" for j in range(i, min(i + per_objective, krs))]
+            )
+            id_map.update(zip(range(i + 1, i + 1 + len(ids)), ids))
+        origin = datetime(2025, 1, 1)
+        repo.bulk_add_kr_updates(
+            {"kr_id": id_map[int(k)], "note": "", "progress": float(p), "created_at": origin + timedelta(days=float(d))}
+            for k, d, p in zip(kr_ids, days, progress)
+        )
+
+        started = time.perf_counter()
+        history = repo.kr_progress_history(cycle.id)
+        loaded = time.perf_counter()
+        columns = to_columns(history, start)
+        converted = time.perf_counter()
+        forecast_columns(*columns, end_day=float(CYCLE_DAYS))
+        computed = time.perf_counter()
+        repo.reset_engine()
+    return {
+        "query_seconds": round(loaded - started, 3),
+        "to_columns_seconds": round(converted - loaded, 3),
+        "forecast_seconds": round(computed - converted, 3),
+    }
+
+
+def run(krs: int, updates: int, with_db: bool = False) -> dict:
+    """벡터화 계산과 행 단위 계산 시간을 측정한다."""
+    kr_ids, days, progress = _synthetic(krs, updates)
+
+    started = time.perf_counter()
+    arrays = forecast_columns(kr_ids, days, progress, float(CYCLE_DAYS))
+    vectorized = time.perf_counter() - started
+
+    started = time.perf_counter()
+    baseline = _row_by_row(kr_ids, days, progress, float(CYCLE_DAYS))
+    row_by_row = time.perf_counter() - started
+
+    sample = int(arrays.kr_ids[0])
+    assert abs(baseline[sample] - arrays.projected_at_end[0]) < 1e-6 or arrays.projected_at_end[0] == 0.0
+
+    result = {
+        "krs": krs,
+        "updates_per_kr": updates,
+        "rows": int(kr_ids.size),
+        "vectorized_seconds": round(vectorized, 4),
+        "row_by_row_seconds": round(row_by_row, 4),
+        "speedup": round(row_by_row / vectorized, 1) if vectorized else None,
+    }
+    if with_db:
+        result["end_to_end"] = _with_db(krs, updates)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="KR 예측 엔진 벤치마크")
+    parser.add_argument("--krs", type=int, default=10_000)
+    parser.add_argument("--updates", type=int, default=100)
+    parser.add_argument("--with-db", action="store_true", help="SQLite 적재 후 조회→계산까지 측정")
+    args = parser.parse_args()
+    print(json.dumps(run(args.krs, args.updates, args.with_db), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""가져오기/내보내기 벤치마크: 형식별(CSV/JSONL/Parquet) KR 업데이트 N행의 초당 처리 행 수와 최대 메모리
+
+실행: python streamlit_app/bench/bench_io.py --rows 100000 [--formats csv jsonl parquet]
+"""
+from __future__ import annotations
+import argparse
+import importlib.util
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+OBJECTIVES = 50
+KRS_PER_OBJECTIVE = 4
+
+
+def available_formats() -> List[str]:
+    """설치된 의존성으로 측정 가능한 형식 (Parquet은 pyarrow가 있을 때만)"""
+    return ["csv", "jsonl"] + (["parquet"] if importlib.util.find_spec("pyarrow") else [])
+
+
+def _rate(rows: int, seconds: float) -> float:
+    return round(rows / seconds, 1) if seconds else 0.0
+
+
+def _max_rss_mb() -> float:
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def _records(rows: int, kr_ids: List[int]):
+    origin = datetime(2025, 1, 1)
+    for n in range(rows):
+        yield {
+            "kr_id": kr_ids[n % len(kr_ids)],
+            "note": f"update {n}",
+            "progress": min(100.0, (n // len(kr_ids)) * 0.5),
+            "created_at": origin + timedelta(minutes=n // len(kr_ids)),
+        }
+
+
+def run(rows: int, formats: List[str], chunk_size: int = 5000) -> dict:
+    """현재 엔진(DB)에 N행을 넣고 형식별로 내보내기 → 새 DB로 가져오기를 측정한다."""
+    from db import repository as repo
+    from services import okr_io
+
+    repo.init_db()
+    company = repo.upsert_company("bench-co")
+    cycle = repo.create_cycle(company.id, "bench", date(2025, 1, 1), date(2025, 3, 31))
+    kr_ids: List[int] = []
+    for i in range(OBJECTIVES):
+        kr_ids.extend(repo.create_objective_with_krs(
+            cycle.id, "bench", f"objective {i}", [f"KR {i}-{j}" for j in range(KRS_PER_OBJECTIVE)],
+        )[1])
+    repo.bulk_add_kr_updates(_records(rows, kr_ids), chunk_size)
+    source_url = repo.get_engine().url.render_as_string(hide_password=False)
+
+    results: dict = {"rows": rows, "chunk_size": chunk_size}
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in formats:
+            path = os.path.join(tmp, f"kr_updates.{fmt}")
+            repo.reset_engine(source_url)
+            exported = okr_io.export_file("kr_updates", path, fmt, chunk_size)
+
+            # 같은 OKR 구조만 있는 새 DB로 가져오기
+            repo.reset_engine(f"sqlite:///{os.path.join(tmp, f'import_{fmt}.db')}")
+            repo.init_db()
+            for table in ("cycles", "objectives", "key_results"):
+                repo.reset_engine(source_url)
+                okr_io.export_file(table, os.path.join(tmp, f"{table}.jsonl"))
+                repo.reset_engine(f"sqlite:///{os.path.join(tmp, f'import_{fmt}.db')}")
+                if table == "cycles":
+                    repo.upsert_company("bench-co")
+                okr_io.import_file(table, os.path.join(tmp, f"{table}.jsonl"))
+            started = time.perf_counter()
+            imported = okr_io.import_file("kr_updates", path, fmt, chunk_size)
+            seconds = time.perf_counter() - started
+            results[fmt] = {
+                "file_mb": round(os.path.getsize(path) / 1024 / 1024, 2),
+                "export_rows_per_sec": _rate(exported.rows, exported.elapsed_seconds),
+                "import_rows_per_sec": _rate(imported.inserted, seconds),
+                "import_failed": imported.failed,
+                "max_rss_mb": _max_rss_mb(),
+            }
+        repo.reset_engine(source_url)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="가져오기/내보내기 처리량 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000, help="KR 업데이트 행 수")
+    parser.add_argument("--formats", nargs="+", default=available_formats(), help="측정할 형식")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    from db import repository as repo
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo.reset_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        print(json.dumps(run(args.rows, args.formats, args.chunk_size), indent=2))
+        repo.reset_engine()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""조회 벤치마크: 인덱스 생성 전/후의 쿼리 플랜과 지연시간 비교
+
+실행: python streamlit_app/bench/bench_queries.py --rows 1000000
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, text
+
+
+def _populate(repo, rows: int, objectives: int, krs_per_objective: int) -> dict:
+    company = repo.upsert_company("bench-co")
+    start = date(2024, 1, 1)
+    cycle = repo.create_cycle(company.id, "bench", start, start + timedelta(days=365 * 3))
+    objective_ids, kr_ids = [], []
+    for i in range(objectives):
+        objective_id, ids = repo.create_objective_with_krs(
+            cycle.id, "bench", f"objective {i}", [f"KR {j}" for j in range(krs_per_objective)]
+        )
+        objective_ids.append(objective_id)
+        kr_ids.extend(ids)
+
+    rnd = random.Random(42)
+    repo.bulk_add_daily_progress(
+        {
+            "objective_id": rnd.choice(objective_ids),
+            "date": start + timedelta(days=rnd.randrange(365 * 3)),
+            "content": f"log {i}",
+        }
+        for i in range(rows)
+    )
+    base = datetime(2024, 1, 1)
+    repo.bulk_add_kr_updates(
+        {
+            "kr_id": rnd.choice(kr_ids),
+            "note": f"note {i}",
+            "progress": rnd.random() * 100,
+            "created_at": base + timedelta(minutes=rnd.randrange(60 * 24 * 365 * 3)),
+        }
+        for i in range(rows)
+    )
+    return {"cycle_id": cycle.id, "objective_ids": objective_ids, "kr_ids": kr_ids}
+
+
+def _measure(repo, data: dict, repeats: int) -> dict:
+    engine = repo.get_engine()
+    captured: list = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    rnd = random.Random(7)
+    month = date(2025, 6, 1)
+    cases = {
+        "list_daily_progress(month)": lambda: repo.list_daily_progress(
+            rnd.choice(data["objective_ids"]), month, month + timedelta(days=30)
+        ),
+        "latest_kr_updates(objective KRs)": lambda: repo.latest_kr_updates(
+            rnd.sample(data["kr_ids"], 5)
+        ),
+        "list_krs(objective)": lambda: repo.list_krs(rnd.choice(data["objective_ids"])),
+        "list_objectives(cycle)": lambda: repo.list_objectives(data["cycle_id"]),
+    }
+    results = {}
+    for name, call in cases.items():
+        captured.clear()
+        event.listen(engine, "before_cursor_execute", _capture)
+        call()
+        event.remove(engine, "before_cursor_execute", _capture)
+        statement, parameters = captured[-1]
+        with engine.connect() as conn:
+            plan = [row[-1] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)]
+
+        timings = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            call()
+            timings.append((time.perf_counter() - started) * 1000)
+        results[name] = {"plan": plan, "median_ms": round(statistics.median(timings), 3)}
+    return results
+
+
+def run(rows: int, objectives: int = 1000, krs_per_objective: int = 5, repeats: int = 20) -> dict:
+    """인덱스 없는 상태와 있는 상태에서 같은 쿼리를 측정한다."""
+    from db import repository as repo
+    from db.models import Base
+
+    repo.init_db()
+    index_names = [index.name for table in Base.metadata.sorted_tables for index in table.indexes]
+    with repo.get_engine().begin() as conn:
+        for name in index_names:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+    started = time.perf_counter()
+    data = _populate(repo, rows, objectives, krs_per_objective)
+    populate_seconds = time.perf_counter() - started
+
+    before = _measure(repo, data, repeats)
+    engine = repo.get_engine()
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    after = _measure(repo, data, repeats)
+
+    return {
+        "rows_per_table": rows,
+        "populate_seconds": round(populate_seconds, 1),
+        "before": before,
+        "after": after,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="인덱스 전/후 조회 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="daily_progress/kr_updates 행 수")
+    parser.add_argument("--objectives", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    from db import repository as repo
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo.reset_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        print(json.dumps(run(args.rows, args.objectives, repeats=args.repeats), indent=2, ensure_ascii=False))
+        repo.reset_engine()
+
+
+if __name__ == "__main__":
+    main()
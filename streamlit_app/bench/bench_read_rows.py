@@ -0,0 +1,69 @@
+"""읽기 경로 벤치마크: ORM 인스턴스 조회와 Core select + DTO 조회의 시간/메모리 비교
+
+실행: python streamlit_app/bench/bench_read_rows.py --rows 100000
+"""
+from __future__ import annotations
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _profile(call) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = call()
+    elapsed = time.perf_counter() - started
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(result)
+    del result
+    return {
+        "rows": count,
+        "seconds": round(elapsed, 3),
+        "retained_mb": round(retained / 2**20, 1),
+        "peak_mb": round(peak / 2**20, 1),
+    }
+
+
+def run(rows: int) -> dict:
+    """같은 KR 데이터를 ORM 경로와 DTO 경로로 읽어 결과를 dict로 반환한다."""
+    from db import repository as repo
+
+    repo.init_db()
+    company = repo.upsert_company("bench-co")
+    cycle = repo.create_cycle(company.id, "bench", date.today(), date.today() + timedelta(days=90))
+    objective_id, _ = repo.create_objective_with_krs(
+        cycle.id, "bench", "objective", ({"text": f"KR {i}", "target": 100.0, "unit": "%"} for i in range(rows))
+    )
+
+    # tracemalloc 자체의 오버헤드가 있으므로 시간은 두 경로의 상대 비교용
+    return {
+        "orm": _profile(lambda: repo.list_krs(objective_id)),
+        "rows": _profile(lambda: repo.list_kr_rows(objective_id)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ORM vs DTO 읽기 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    from db import repository as repo
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo.reset_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        print(json.dumps(run(args.rows), indent=2))
+        repo.reset_engine()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""저장소 계층 벤치마크: 가상 회사 데이터(10³~10⁶행)의 쓰기/읽기 처리량
+
+규모 N은 KR 업데이트와 수행내역 행 수이며 사이클/Objective/KR 수는 N에 비례해 정한다.
+읽기는 조회 캐시를 거치지 않은 값(cold)과 캐시 적중(warm)을 따로 잰다.
+
+실행: python streamlit_app/bench/bench_repository.py --scales 1000 10000 100000 [1000000]
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CYCLE_DAYS = 90
+KRS_PER_OBJECTIVE = 4
+OBJECTIVES_PER_CYCLE = 50
+
+
+def _shape(rows: int) -> dict:
+    """행 수 N에 대한 가상 회사 구성 (KR당 업데이트 약 20건)"""
+    krs = max(KRS_PER_OBJECTIVE, rows // 20)
+    objectives = max(1, krs // KRS_PER_OBJECTIVE)
+    cycles = max(1, objectives // OBJECTIVES_PER_CYCLE)
+    return {"cycles": cycles, "objectives": objectives, "krs": objectives * KRS_PER_OBJECTIVE, "updates": rows}
+
+
+def _rate(rows: int, seconds: float) -> float:
+    return round(rows / seconds, 1) if seconds else 0.0
+
+
+def _timed(call: Callable[[], object], repeats: int) -> dict:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {"median_ms": round(statistics.median(timings), 3), "max_ms": round(max(timings), 3)}
+
+
+def _populate(repo, shape: dict, rnd: random.Random) -> tuple[dict, dict]:
+    company = repo.upsert_company("bench-co")
+    start = date(2025, 1, 1)
+    writes: dict = {}
+
+    started = time.perf_counter()
+    cycle_ids = [
+        repo.create_cycle(company.id, f"cycle {c}", start, start + timedelta(days=CYCLE_DAYS)).id
+        for c in range(shape["cycles"])
+    ]
+    objective_ids: List[int] = []
+    kr_ids: List[int] = []
+    for i in range(shape["objectives"]):
+        objective_id, ids = repo.create_objective_with_krs(
+            cycle_ids[i % len(cycle_ids)], "bench", f"objective {i}",
+            [f"KR {i}-{j}" for j in range(KRS_PER_OBJECTIVE)],
+        )
+        objective_ids.append(objective_id)
+        kr_ids.extend(ids)
+    seconds = time.perf_counter() - started
+    writes["okr_tree"] = {"rows": len(cycle_ids) + len(objective_ids) + len(kr_ids), "rows_per_sec": _rate(
+        len(cycle_ids) + len(objective_ids) + len(kr_ids), seconds)}
+
+    origin = datetime(2025, 1, 1)
+    started = time.perf_counter()
+    repo.bulk_add_kr_updates(
+        {
+            "kr_id": kr_ids[n % len(kr_ids)],
+            "note": f"update {n}",
+            "progress": min(100.0, (n // len(kr_ids)) * 5.0 + rnd.random() * 3),
+            "created_at": origin + timedelta(hours=n // len(kr_ids) * 24 + rnd.random()),
+        }
+        for n in range(shape["updates"])
+    )
+    seconds = time.perf_counter() - started
+    writes["kr_updates"] = {"rows": shape["updates"], "rows_per_sec": _rate(shape["updates"], seconds)}
+
+    started = time.perf_counter()
+    repo.bulk_add_daily_progress(
+        {
+            "objective_id": objective_ids[n % len(objective_ids)],
+            "date": start + timedelta(days=n % CYCLE_DAYS),
+            "content": f"수행내역 {n}",
+        }
+        for n in range(shape["updates"])
+    )
+    seconds = time.perf_counter() - started
+    writes["daily_progress"] = {"rows": shape["updates"], "rows_per_sec": _rate(shape["updates"], seconds)}
+    return writes, {"cycle_ids": cycle_ids, "objective_ids": objective_ids, "kr_ids": kr_ids}
+
+
+def run(rows: int, repeats: int = 20, seed: int = 0) -> dict:
+    """현재 엔진(DB)에 N행 규모 데이터를 만들고 쓰기/읽기 처리량을 dict로 반환한다."""
+    from db import repository as repo
+
+    repo.init_db()
+    rnd = random.Random(seed)
+    shape = _shape(rows)
+    writes, ids = _populate(repo, shape, rnd)
+
+    cycle_id = ids["cycle_ids"][0]
+    month = date(2025, 2, 1)
+    cases = {
+        "load_cycle_tree": (repo.load_cycle_tree, lambda: (cycle_id,)),
+        "get_objective_progress": (repo.get_objective_progress, lambda: (cycle_id,)),
+        "list_objective_rows": (repo.list_objective_rows, lambda: (cycle_id,)),
+        "list_kr_rows": (repo.list_kr_rows, lambda: (rnd.choice(ids["objective_ids"]),)),
+        "list_kr_update_rows(limit=20)": (repo.list_kr_update_rows, lambda: (rnd.choice(ids["kr_ids"]), 20)),
+    }
+    reads: dict = {}
+    for name, (fn, args) in cases.items():
+        # cold: 캐시를 거치지 않은 DB 조회, warm: 같은 인자로 반복 조회(캐시 적중)
+        warm_args = args()
+        fn(*warm_args)
+        reads[name] = {
+            "cold": _timed(lambda: fn.uncached(*args()), repeats),
+            "warm": _timed(lambda: fn(*warm_args), repeats),
+        }
+    reads["list_daily_progress(month)"] = {"cold": _timed(
+        lambda: repo.list_daily_progress(rnd.choice(ids["objective_ids"]), month, month + timedelta(days=30)), repeats,
+    )}
+    reads["kr_progress_history(cycle)"] = {"cold": _timed(lambda: repo.kr_progress_history(cycle_id), max(1, repeats // 4))}
+
+    return {"rows": rows, "shape": shape, "writes": writes, "reads": reads, "read_cache": {
+        k: v for k, v in repo.read_cache_stats().items() if k != "entry_ages_seconds"
+    }}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="저장소 쓰기/읽기 처리량 벤치마크 (가상 회사 데이터)")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="규모별 행 수")
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    from db import repository as repo
+
+    results = []
+    for rows in args.scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo.reset_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            results.append(run(rows, args.repeats))
+            repo.reset_engine()
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""다중 세션 부하 테스트: Streamlit AppTest로 N명의 가상 사용자가 동시에 app.py를 조작
+
+AppTest는 프로세스 전역 런타임을 사용하므로 사용자마다 별도 프로세스에서 세션을 돌리고,
+같은 SQLite 파일과 같은 스텁 LLM 서버를 공유한다.
+
+사용자마다 좌측 패널(Objective/KR) 수정 → 우측 패널 수행내역 입력 → AI 검증 요청(수행내역 저장 +
+백그라운드 작업 큐, 로컬 스텁 LLM) → 결과가 나올 때까지 폴링하는 흐름을 반복하고, N이 늘 때의
+rerun 지연시간 백분위수, 검증 완료까지 걸린 시간, 세션당 메모리(ai_feedback 크기 포함),
+SQLite 잠금 경합과 DailyProgress 저장 결과를 JSON으로 출력한다.
+
+실행: python streamlit_app/bench/load_app.py --users 1 5 10 20 --iterations 3 --latency-ms 200
+"""
+from __future__ import annotations
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.bench_ai_path import stub_environment, summarize
+from bench.stub_openai import StubConfig, StubOpenAIServer, add_arguments, config_from_args
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+VALIDATE_LABEL = "🤖 AI에 피드백받기"
+OBJECTIVE_LABEL = "🎯 Objective"
+POLL_INTERVAL_SECONDS = 0.1
+POLL_TIMEOUT_SECONDS = 60.0
+
+
+def _timed_run(at, reruns: Dict[str, List[float]], step: str) -> None:
+    started = time.perf_counter()
+    at.run()
+    reruns.setdefault(step, []).append(time.perf_counter() - started)
+    if at.exception:
+        raise RuntimeError(f"{step}: {at.exception[0].message}")
+
+
+def _wait_for_job(at, reruns: Dict[str, List[float]]) -> None:
+    """브라우저의 fragment 폴링 대신 주기적으로 rerun 해서 검증 작업이 끝날 때까지 기다린다."""
+    deadline = time.monotonic() + POLL_TIMEOUT_SECONDS
+    while "validation_job_id" in at.session_state:
+        if time.monotonic() > deadline:
+            raise RuntimeError("validate: 검증 작업이 시간 안에 끝나지 않음")
+        time.sleep(POLL_INTERVAL_SECONDS)
+        _timed_run(at, reruns, "poll")
+
+
+def _rss_kb() -> int:
+    """현재 프로세스의 상주 메모리(KB). /proc이 없으면 최대 RSS로 대신한다."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _user(user_id: int, iterations: int, db_url: str, run_id: str, barrier, results) -> None:
+    """가상 사용자 1명 (별도 프로세스). AppTest는 전역 런타임 상태를 쓰므로 스레드로 동시에 돌릴 수 없다."""
+    from streamlit.testing.v1 import AppTest
+
+    from db import repository
+
+    repository.reset_engine(db_url)
+    result: dict = {"reruns": {}, "completions": [], "lock_errors": 0, "errors": [], "feedback_sizes": []}
+    # 모듈 import 비용이 측정에 섞이지 않도록 한 번 실행해 둔다
+    AppTest.from_file(APP_PATH, default_timeout=120).run()
+    gc.collect()
+    rss_before = _rss_kb()
+    barrier.wait()
+    try:
+        at = AppTest.from_file(APP_PATH, default_timeout=120)
+        _timed_run(at, result["reruns"], "initial")
+        for i in range(iterations):
+            next(w for w in at.text_input if w.label == OBJECTIVE_LABEL).input(f"사용자 {user_id}의 Objective v{i}")
+            _timed_run(at, result["reruns"], "edit_objective")
+            at.text_input(key="kr_0").input(f"사용자 {user_id} KR #1 v{i}")
+            _timed_run(at, result["reruns"], "edit_kr")
+            notes = f"[{run_id}] 사용자 {user_id} / {i}회차: 커뮤니티 3곳에 모집 글 게시, 신청 {i * 7}명"
+            at.text_area[0].input(notes)
+            _timed_run(at, result["reruns"], "type_progress")
+            # 클릭 rerun은 수행내역 저장 + 작업 등록만 하고 반환, 결과는 폴링으로 받음
+            next(b for b in at.button if b.label == VALIDATE_LABEL).click()
+            started = time.perf_counter()
+            _timed_run(at, result["reruns"], "validate")
+            _wait_for_job(at, result["reruns"])
+            result["completions"].append(time.perf_counter() - started)
+            feedback = at.session_state["ai_feedback"]
+            result["feedback_sizes"].append(len(feedback.encode("utf-8")))
+        # 세션(AppTest 인스턴스: 세션 상태 + 위젯 트리)이 살아 있는 동안 늘어난 메모리
+        result["session_rss_kb"] = _rss_kb() - rss_before
+    except Exception as e:
+        result["lock_errors"] += int("database is locked" in str(e))
+        result["errors"].append(f"user {user_id}: {e}")
+    finally:
+        result["max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        results.put(result)
+
+
+def run(users: int, iterations: int = 3, config: StubConfig | None = None) -> dict:
+    """users명이 동시에 iterations회 흐름을 반복하고 결과를 dict로 반환한다 (현재 엔진의 SQLite 파일 공유)."""
+    from sqlalchemy import func, select
+
+    from db import repository
+    from db.models import DailyProgress
+
+    repository.init_db()
+    db_url = repository.get_engine().url.render_as_string(hide_password=False)
+
+    # 실행마다 수행내역을 달리해 응답 캐시 적중 없이 실제 호출 경로를 측정
+    run_id = uuid.uuid4().hex[:8]
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(users + 1)
+    queue = ctx.Queue()
+    with StubOpenAIServer(config or StubConfig()) as server, stub_environment(server):
+        processes = [
+            ctx.Process(target=_user, args=(u, iterations, db_url, run_id, barrier, queue), name=f"user-{u}")
+            for u in range(users)
+        ]
+        for p in processes:
+            p.start()
+        # 모든 사용자가 준비된 뒤 동시에 시작
+        barrier.wait()
+        started = time.perf_counter()
+        collected = [queue.get() for _ in processes]
+        elapsed = time.perf_counter() - started
+        for p in processes:
+            p.join()
+        llm_requests = server.stats.requests
+
+    with repository.get_session() as s:
+        persisted, validated = s.execute(
+            select(func.count(DailyProgress.id), func.count(DailyProgress.ai_validation))
+            .where(DailyProgress.date == date.today(), DailyProgress.is_draft.is_(False))
+        ).one()
+        drafts = s.scalar(select(func.count(DailyProgress.id)).where(DailyProgress.is_draft.is_(True)))
+
+    reruns: Dict[str, List[float]] = {}
+    for result in collected:
+        for step, values in result["reruns"].items():
+            reruns.setdefault(step, []).extend(values)
+    all_reruns = [s for values in reruns.values() for s in values]
+    completions = [s for result in collected for s in result["completions"]]
+    sizes = [result["feedback_sizes"] for result in collected if result["feedback_sizes"]]
+    session_rss = [result["session_rss_kb"] for result in collected if "session_rss_kb" in result]
+    return {
+        "users": users,
+        "iterations": iterations,
+        "elapsed_seconds": round(elapsed, 2),
+        "reruns": len(all_reruns),
+        "reruns_per_second": round(len(all_reruns) / elapsed, 2) if elapsed else 0.0,
+        "rerun_latency": summarize(all_reruns),
+        "rerun_latency_by_step": {step: summarize(values) for step, values in reruns.items()},
+        # 버튼 클릭 → 결과 표시까지 (백그라운드 작업 대기 포함)
+        "validation_latency": summarize(completions),
+        "llm_requests": llm_requests,
+        "memory": {
+            "session_rss_kb_max": max(session_rss, default=0),
+            "process_max_rss_mb": round(max(r["max_rss_kb"] for r in collected) / 1024, 1),
+            "ai_feedback_bytes_last": max((s[-1] for s in sizes), default=0),
+            # 반복해도 늘지 않아야 정상 (이전 결과를 덮어씀)
+            "ai_feedback_growth_bytes": max((s[-1] - s[0] for s in sizes), default=0),
+        },
+        "sqlite": {
+            "daily_progress_rows": persisted,
+            "validated_rows": validated,
+            # 검증 요청 없이 남은 자동 저장 초안 (검증하면 수행내역으로 전환되므로 보통 0)
+            "draft_rows": drafts,
+            "lock_errors": sum(r["lock_errors"] for r in collected),
+        },
+        "errors": [e for r in collected for e in r["errors"]][:10],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streamlit 다중 세션 부하 테스트 (AppTest + 로컬 스텁 LLM)")
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 5, 10], help="동시 사용자 수 (여러 개면 차례로)")
+    parser.add_argument("--iterations", type=int, default=3, help="사용자당 편집→검증 반복 횟수")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    from db import repository
+
+    results = []
+    for users in args.users:
+        with tempfile.TemporaryDirectory() as tmp:
+            repository.reset_engine(f"sqlite:///{os.path.join(tmp, 'load.db')}")
+            results.append(run(users, args.iterations, config_from_args(args)))
+            repository.reset_engine()
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
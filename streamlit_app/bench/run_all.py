@@ -0,0 +1,114 @@
+"""오프라인 벤치마크 묶음 실행: DB 계층과 AI 경로 결과를 하나의 JSON으로 출력 (회귀 비교용)
+
+실행: python streamlit_app/bench/run_all.py [--quick] [--output bench_result.json]
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench import (
+    bench_ai_path, bench_async_pipeline, bench_bulk_write, bench_forecast, bench_io, bench_read_rows, bench_repository,
+)
+from bench.stub_openai import StubConfig
+
+
+def _with_temp_db(call: Callable[[], dict]) -> dict:
+    """새 임시 SQLite 파일에서 call을 실행한다."""
+    from db import repository as repo
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo.reset_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        try:
+            return call()
+        finally:
+            repo.reset_engine()
+
+
+def _environment() -> dict:
+    import numpy
+    import openai
+    import sqlalchemy
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sqlite": sqlite3.sqlite_version,
+        "sqlalchemy": sqlalchemy.__version__,
+        "openai": openai.__version__,
+        "numpy": numpy.__version__,
+    }
+
+
+def run(quick: bool = False) -> dict:
+    """모든 스위트를 실행해 {environment, results, elapsed_seconds}를 반환한다."""
+    scales = [1_000, 10_000] if quick else [1_000, 10_000, 100_000, 1_000_000]
+    requests = 50 if quick else 300
+    started = time.perf_counter()
+    results = {
+        "repository": [_with_temp_db(lambda rows=rows: bench_repository.run(rows)) for rows in scales],
+        "bulk_write": _with_temp_db(lambda: bench_bulk_write.run(500 if quick else 5_000)),
+        "read_rows": _with_temp_db(lambda: bench_read_rows.run(10_000 if quick else 100_000)),
+        "import_export": _with_temp_db(lambda: bench_io.run(20_000 if quick else 200_000, bench_io.available_formats())),
+        "forecast": bench_forecast.run(1_000 if quick else 10_000, 100),
+        # 일괄 검증: 스레드 방식 vs asyncio 방식 (스텁은 별도 프로세스)
+        "async_pipeline": bench_async_pipeline.run(
+            200 if quick else 1_000, [8, 64], StubConfig(latency_ms=200, seed=1),
+        ),
+        "ai_path": {
+            "chat": bench_ai_path.run(requests, 8, config=StubConfig(latency_ms=200, seed=1)),
+            "stream": bench_ai_path.run(requests, 8, stream=True, config=StubConfig(latency_ms=200, ttft_ms=50, seed=1)),
+            "fallback_403": bench_ai_path.run(
+                requests, 8, config=StubConfig(latency_ms=200, forbidden_models=frozenset({"gpt-5-nano"}), seed=1),
+            ),
+            "rate_limited_429": bench_ai_path.run(
+                requests, 8, config=StubConfig(latency_ms=200, rate_limit_ratio=0.1, retry_after_seconds=0.2, seed=1),
+            ),
+            # 서버 한도(40 rps)를 넘는 동시 요청: 공용 리미터 + Retry-After 재시도로 실패 없이 처리되는지
+            "burst_429": bench_ai_path.run(
+                requests * 2, 32, config=StubConfig(latency_ms=200, max_requests_per_second=40, seed=1),
+                rate_per_second=36,
+            ),
+            # 2% 요청이 3초 걸리는 꼬리 지연: p95 시점 헤지로 p99가 줄어드는지
+            "slow_tail": bench_ai_path.run(
+                requests, 8, config=StubConfig(latency_ms=200, slow_ratio=0.02, slow_latency_ms=3000, seed=1),
+            ),
+            "slow_tail_hedged": bench_ai_path.run(
+                requests, 8, config=StubConfig(latency_ms=200, slow_ratio=0.02, slow_latency_ms=3000, seed=1),
+                hedge=True,
+            ),
+        },
+    }
+    return {
+        "environment": _environment(),
+        "quick": quick,
+        "elapsed_seconds": round(time.perf_counter() - started, 1),
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="오프라인 벤치마크 전체 실행")
+    parser.add_argument("--quick", action="store_true", help="작은 규모로 빠르게 실행 (CI/스모크용)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: 표준 출력)")
+    args = parser.parse_args()
+    text = json.dumps(run(args.quick), indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
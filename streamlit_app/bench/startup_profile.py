@@ -0,0 +1,158 @@
+"""앱 시작 시간 점검: `-X importtime` 기반 import 프로파일 + AppTest 첫 실행/rerun 시간, 예산을 넘으면 종료 코드 1
+
+Streamlit 서버는 스크립트를 실행하기 전에 이미 streamlit을 불러와 두므로, 각 측정은 streamlit을 먼저
+import한 새 프로세스에서 앱 모듈만 잰다.
+- pre_header: 헤더를 그리기 전에 불러오는 모듈 (services.metrics, ui.components, config.settings)
+- app_imports: 나머지 앱 모듈까지 전부 (SQLAlchemy, pydantic 포함, OpenAI SDK는 첫 호출 때라 제외돼야 함)
+- cold_run / rerun: AppTest로 app.py를 처음 실행한 시간과 이후 rerun 시간 (임시 SQLite, 검증 클릭 없음)
+
+실행: python streamlit_app/bench/startup_profile.py [--pre-header-budget-ms 150] [--rerun-budget-ms 300]
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(APP_DIR, "app.py")
+PRE_HEADER_MODULES = ("services.metrics", "ui.components", "config.settings")
+APP_MODULES = PRE_HEADER_MODULES + ("services.ai_validator", "services.okr_service", "services.validation_jobs")
+# 앱 시작 때 불러오면 안 되는 모듈 (첫 사용 때 import)
+LAZY_MODULES = ("openai",)
+
+_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+# 새 프로세스에서 AppTest로 첫 실행과 rerun 시간을 잰다 (결과는 마지막 줄 JSON)
+_APPTEST_SCRIPT = """
+import json, sys, time
+import streamlit
+from streamlit.testing.v1 import AppTest
+sys.path.insert(0, {app_dir!r})
+at = AppTest.from_file({app_path!r}, default_timeout=120)
+started = time.perf_counter()
+at.run()
+cold = time.perf_counter() - started
+reruns = []
+for _ in range({reruns}):
+    started = time.perf_counter()
+    at.run()
+    reruns.append(time.perf_counter() - started)
+errors = [e.message for e in at.exception]
+loaded = [name for name in {lazy!r} if name in sys.modules]
+print(json.dumps({{"cold": cold, "reruns": reruns, "errors": errors, "loaded": loaded}}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[dict]:
+    """`-X importtime` 출력 → [{module, self_us, cumulative_us, depth}] (import 순서)"""
+    rows = []
+    for line in stderr.splitlines():
+        m = _IMPORTTIME.match(line)
+        if m:
+            rows.append({
+                "module": m.group(4),
+                "self_us": int(m.group(1)),
+                "cumulative_us": int(m.group(2)),
+                "depth": len(m.group(3)) // 2,
+            })
+    return rows
+
+
+def profile_imports(modules: tuple) -> Dict[str, object]:
+    """streamlit을 먼저 불러온 새 프로세스에서 modules를 import하고 시간을 잰다."""
+    code = "import streamlit, sys; sys.path.insert(0, %r)\n" % APP_DIR
+    code += "".join(f"import {m}\n" for m in modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, cwd=APP_DIR,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr[-2000:])
+    rows = parse_importtime(proc.stderr)
+    # streamlit 자체를 불러오는 부분은 제외하고 앱 모듈 import 구간만
+    first = next(i for i, r in enumerate(rows) if r["depth"] == 0 and r["module"] == "streamlit")
+    rows = rows[first + 1:]
+    top = [r for r in rows if r["depth"] == 0]
+    return {
+        "total_ms": round(sum(r["cumulative_us"] for r in top) / 1000, 1),
+        "modules": {r["module"]: round(r["cumulative_us"] / 1000, 1) for r in top},
+        "slowest": [
+            {"module": r["module"], "cumulative_ms": round(r["cumulative_us"] / 1000, 1)}
+            for r in sorted(rows, key=lambda r: r["cumulative_us"], reverse=True)[:10]
+        ],
+        "lazy_loaded": sorted({r["module"] for r in rows} & set(LAZY_MODULES)),
+    }
+
+
+def profile_app(reruns: int) -> dict:
+    """AppTest로 app.py를 새 프로세스에서 처음 실행하고 reruns번 다시 실행한다 (임시 SQLite)."""
+    from bench.bench_ai_path import summarize
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DB_URL=f"sqlite:///{os.path.join(tmp, 'startup.db')}", OPENAI_API_KEY="")
+        code = _APPTEST_SCRIPT.format(app_dir=APP_DIR, app_path=APP_PATH, reruns=reruns, lazy=LAZY_MODULES)
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=tmp, env=env)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr[-2000:])
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    return {
+        "cold_run_ms": round(result["cold"] * 1000, 1),
+        "rerun": summarize(result["reruns"]),
+        "lazy_loaded": result["loaded"],
+        "errors": result["errors"],
+    }
+
+
+def check(report: dict, args: argparse.Namespace) -> List[str]:
+    """예산을 넘은 항목 목록 (비어 있으면 통과)"""
+    violations = []
+    if report["pre_header"]["total_ms"] > args.pre_header_budget_ms:
+        violations.append(f"pre_header import {report['pre_header']['total_ms']} ms > {args.pre_header_budget_ms} ms")
+    if report["app_imports"]["total_ms"] > args.import_budget_ms:
+        violations.append(f"app import {report['app_imports']['total_ms']} ms > {args.import_budget_ms} ms")
+    for name in report["app_imports"]["lazy_loaded"] + report["app"]["lazy_loaded"]:
+        violations.append(f"{name} 이(가) 시작 시 import됨 (첫 사용 때 불러와야 함)")
+    if report["app"]["cold_run_ms"] > args.cold_budget_ms:
+        violations.append(f"cold run {report['app']['cold_run_ms']} ms > {args.cold_budget_ms} ms")
+    if report["app"]["rerun"]["p95_ms"] > args.rerun_budget_ms:
+        violations.append(f"rerun p95 {report['app']['rerun']['p95_ms']} ms > {args.rerun_budget_ms} ms")
+    violations += [f"app error: {e}" for e in report["app"]["errors"]]
+    return violations
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """예산 옵션 (tests/test_startup.py도 parse_args([])로 기본 예산을 사용)"""
+    parser = argparse.ArgumentParser(description="앱 시작/rerun 시간 예산 점검 (-X importtime + AppTest)")
+    parser.add_argument("--pre-header-budget-ms", type=float, default=150, help="헤더 전 앱 모듈 import 예산")
+    parser.add_argument("--import-budget-ms", type=float, default=800, help="앱 모듈 전체 import 예산")
+    parser.add_argument("--cold-budget-ms", type=float, default=3000, help="AppTest 첫 실행 예산")
+    parser.add_argument("--rerun-budget-ms", type=float, default=300, help="rerun p95 예산")
+    parser.add_argument("--reruns", type=int, default=20)
+    return parser
+
+
+def build_report(args: argparse.Namespace) -> dict:
+    """import 프로파일 + AppTest 측정과 예산 위반 목록"""
+    report = {
+        "pre_header": profile_imports(PRE_HEADER_MODULES),
+        "app_imports": profile_imports(APP_MODULES),
+        "app": profile_app(args.reruns),
+    }
+    report["violations"] = check(report, args)
+    return report
+
+
+def main() -> None:
+    report = build_report(build_parser().parse_args())
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    sys.exit(1 if report["violations"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""Chat Completions API를 흉내 내는 로컬 HTTP 스텁 (오프라인 벤치마크/부하 테스트용)
+
+지연시간, 스트리밍(SSE), 403(model_not_found)/429 오류를 설정할 수 있다.
+실행: python streamlit_app/bench/stub_openai.py --port 8765 --latency-ms 300 --ttft-ms 80
+앱 연결: OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=sk-stub streamlit run streamlit_app/app.py
+"""
+from __future__ import annotations
+import argparse
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import FrozenSet, Optional
+
+STUB_API_KEY = "sk-stub"
+REPLY = (
+    "1) 부족/누락 항목\n- 수치 변화(Baseline→Today/Target)가 없습니다. → 진행률을 판단할 수 없습니다. "
+    "→ 오늘 확보한 사용자 수를 단위와 함께 적으세요.\n\n"
+    "2) 모호·비구체 항목과 개선안\n- '배포함' → '인천대 커뮤니티 3곳에 모집 글 게시, 신청 42명'\n\n"
+    "3) 다시 작성 가이드\n- KR 1개만 다루기\n- 증거 URL 첨부\n- 다음 액션은 24–48시간 내 행동 단위로\n"
+)
+# response_format(json_schema)을 보낸 요청(구조화 출력 모드)에 돌려줄 응답
+REPLY_JSON = json.dumps({
+    "missing_items": [{"item": "수치 변화", "why": "진행률을 판단할 수 없음", "fix": "오늘 확보한 사용자 수를 단위와 함께 기재"}],
+    "rewrites": [{"original": "배포함", "improved": "인천대 커뮤니티 3곳에 모집 글 게시, 신청 42명"}],
+    "next_actions": ["수원대 교수님 2명에게 안내 메일 발송"],
+    "questions": ["신청자 중 실제 사용자는 몇 명입니까?"],
+}, ensure_ascii=False)
+
+
+@dataclass
+class StubConfig:
+    latency_ms: float = 200.0  # 요청 수신 → 응답 완료까지
+    ttft_ms: float = 50.0  # 스트리밍 첫 청크까지
+    jitter: float = 0.1  # 지연시간 ± 비율
+    chunks: int = 20  # 스트리밍 청크 수
+    forbidden_models: FrozenSet[str] = field(default_factory=frozenset)  # 항상 403 model_not_found
+    rate_limit_ratio: float = 0.0  # 이 비율만큼 429 응답
+    retry_after_seconds: float = 1.0
+    max_requests_per_second: float = 0.0  # 0보다 크면 이 속도를 넘는 요청에 429 (Retry-After = 다음 허용까지 시간)
+    slow_ratio: float = 0.0  # 이 비율만큼 slow_latency_ms로 느리게 응답 (꼬리 지연)
+    slow_latency_ms: float = 2000.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class StubStats:
+    requests: int = 0
+    completed: int = 0
+    forbidden: int = 0
+    rate_limited: int = 0
+    streamed: int = 0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "StubOpenAIServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _json(self, status: int, payload: dict, headers: Optional[dict] = None) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):  # noqa: N802 (http.server 규약)
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._json(404, {"error": {"message": "not found", "type": "invalid_request_error"}})
+            return
+
+        stub = self.server
+        config = stub.config
+        model = request.get("model", "")
+        stub.count("requests")
+
+        if model in config.forbidden_models:
+            stub.count("forbidden")
+            self._json(403, {"error": {
+                "message": f"The model `{model}` does not exist or you do not have access to it.",
+                "type": "invalid_request_error", "code": "model_not_found",
+            }})
+            return
+        wait = stub.admit()
+        if wait > 0:
+            stub.count("rate_limited")
+            self._json(429, {"error": {
+                "message": "Rate limit reached for requests", "type": "requests", "code": "rate_limit_exceeded",
+            }}, headers={"Retry-After": f"{wait:.3f}"})
+            return
+        if config.rate_limit_ratio and stub.random() < config.rate_limit_ratio:
+            stub.count("rate_limited")
+            self._json(429, {"error": {
+                "message": "Rate limit reached for requests", "type": "requests", "code": "rate_limit_exceeded",
+            }}, headers={"Retry-After": f"{config.retry_after_seconds:g}"})
+            return
+
+        prompt_tokens = sum(len(m.get("content", "")) for m in request.get("messages", [])) // 3
+        reply = REPLY_JSON if (request.get("response_format") or {}).get("type") == "json_schema" else REPLY
+        completion_tokens = len(reply) // 3
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        latency = stub.jittered(config.latency_ms) / 1000.0
+        if config.slow_ratio and stub.random() < config.slow_ratio:
+            latency = config.slow_latency_ms / 1000.0
+        if request.get("stream"):
+            self._stream(model, latency, usage, bool((request.get("stream_options") or {}).get("include_usage")))
+        else:
+            time.sleep(latency)
+            self._json(200, {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": reply},
+                    "finish_reason": "stop",
+                }],
+                "usage": usage,
+            })
+        stub.count("completed")
+
+    def _stream(self, model: str, latency: float, usage: dict, include_usage: bool) -> None:
+        config = self.server.config
+        self.server.count("streamed")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def send(payload) -> None:
+            data = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+            self.wfile.write(f"data: {data}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        def chunk(delta: dict, finish_reason=None) -> dict:
+            return {
+                "id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": int(time.time()),
+                "model": model, "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+
+        ttft = min(latency, self.server.jittered(config.ttft_ms) / 1000.0)
+        time.sleep(ttft)
+        pieces = max(1, config.chunks)
+        size = -(-len(REPLY) // pieces)
+        interval = (latency - ttft) / pieces
+        send(chunk({"role": "assistant", "content": ""}))
+        for i in range(0, len(REPLY), size):
+            send(chunk({"content": REPLY[i:i + size]}))
+            time.sleep(interval)
+        send(chunk({}, finish_reason="stop"))
+        if include_usage:
+            send({
+                "id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": int(time.time()),
+                "model": model, "choices": [], "usage": usage,
+            })
+        send("[DONE]")
+
+
+class StubOpenAIServer(ThreadingHTTPServer):
+    """백그라운드 스레드에서 도는 스텁 서버. with 문으로 사용한다."""
+
+    daemon_threads = True
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        super().__init__((host, port), _Handler)
+        self.config = config or StubConfig()
+        self.stats = StubStats()
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._allowance = max(1.0, self.config.max_requests_per_second)
+        self._allowance_at = time.monotonic()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            setattr(self.stats, name, getattr(self.stats, name) + 1)
+
+    def admit(self) -> float:
+        """서버 쪽 요청 한도(토큰 버킷). 허용하면 0, 아니면 다음 허용까지 남은 시간(초)"""
+        rate = self.config.max_requests_per_second
+        if rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(max(1.0, rate), self._allowance + (now - self._allowance_at) * rate)
+            self._allowance_at = now
+            if self._allowance >= 1.0:
+                self._allowance -= 1.0
+                return 0.0
+            return (1.0 - self._allowance) / rate
+
+    def random(self) -> float:
+        with self._lock:
+            return self._random.random()
+
+    def jittered(self, value_ms: float) -> float:
+        return max(0.0, value_ms * (1 + self.config.jitter * (2 * self.random() - 1)))
+
+    def start(self) -> "StubOpenAIServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="stub-openai", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "StubOpenAIServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """스텁 설정용 CLI 옵션 (다른 벤치마크 스크립트에서도 재사용)"""
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="응답 완료까지 지연시간")
+    parser.add_argument("--ttft-ms", type=float, default=50.0, help="스트리밍 첫 청크까지 지연시간")
+    parser.add_argument("--forbidden-model", action="append", default=[], help="403을 돌려줄 모델 (반복 가능)")
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="429로 응답할 요청 비율 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 응답의 Retry-After(초)")
+    parser.add_argument("--max-rps", type=float, default=0.0, help="서버 쪽 초당 요청 한도 (넘으면 429)")
+    parser.add_argument("--slow-ratio", type=float, default=0.0, help="느리게 응답할 요청 비율 (0~1)")
+    parser.add_argument("--slow-latency-ms", type=float, default=2000.0, help="느린 요청의 지연시간")
+
+
+def config_from_args(args: argparse.Namespace) -> StubConfig:
+    return StubConfig(
+        latency_ms=args.latency_ms,
+        ttft_ms=args.ttft_ms,
+        forbidden_models=frozenset(args.forbidden_model),
+        rate_limit_ratio=args.rate_limit_ratio,
+        retry_after_seconds=args.retry_after,
+        max_requests_per_second=args.max_rps,
+        slow_ratio=args.slow_ratio,
+        slow_latency_ms=args.slow_latency_ms,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 OpenAI Chat Completions 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_arguments(parser)
+    args = parser.parse_args()
+    server = StubOpenAIServer(config_from_args(args), args.host, args.port)
+    print(f"stub listening on {server.base_url} (api key: {STUB_API_KEY})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,8 +12,77 @@ if os.path.exists(".env"):
 class Settings:
     # Streamlit Cloud에서는 환경변수나 secrets를 사용
     db_url: str = os.getenv("DB_URL", "sqlite:///okr.db")
+    # 비동기 저장소(db.async_repository)용 URL. 비워 두면 DB_URL에서 드라이버만 바꿔 사용 (aiosqlite/asyncpg)
+    db_async_url: str = os.getenv("DB_ASYNC_URL", "")
+    # SQLite 성능 프로파일 (WAL + synchronous=NORMAL, 잠금 대기)
+    db_sqlite_journal_mode: str = os.getenv("DB_SQLITE_JOURNAL_MODE", "WAL")
+    db_sqlite_synchronous: str = os.getenv("DB_SQLITE_SYNCHRONOUS", "NORMAL")
+    db_sqlite_mmap_size: int = int(os.getenv("DB_SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    db_sqlite_cache_size: int = int(os.getenv("DB_SQLITE_CACHE_SIZE", "-65536"))  # 음수: KiB 단위
+    db_busy_timeout_ms: int = int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000"))
+    # SQLite 외 DB의 커넥션 풀
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_recycle_seconds: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+    # 조회 캐시 (rerun마다 반복되는 조회를 메모리에서 제공, 쓰기 시 태그 무효화)
+    db_read_cache_enabled: bool = os.getenv("DB_READ_CACHE_ENABLED", "1") == "1"
+    db_read_cache_ttl_seconds: int = int(os.getenv("DB_READ_CACHE_TTL_SECONDS", "300"))
+    db_read_cache_max_entries: int = int(os.getenv("DB_READ_CACHE_MAX_ENTRIES", "512"))
+
     openai_model: str = os.getenv("OPENAI_MODEL", "gpt-5-nano")
-    
+    openai_timeout_seconds: float = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "60"))
+    # 사용자 메시지(Objective/KR/수행내역) 최대 토큰 수. 넘으면 중복 제거 후 잘라서 보냄
+    openai_prompt_token_budget: int = int(os.getenv("OPENAI_PROMPT_TOKEN_BUDGET", "4000"))
+    # model_not_found/403 이 난 모델을 다시 시도하지 않는 시간
+    openai_model_unavailable_ttl_seconds: int = int(os.getenv("OPENAI_MODEL_UNAVAILABLE_TTL_SECONDS", "3600"))
+    # 호출 복원력: 요청별 제한 시간, 일시 오류(429/5xx/타임아웃) 재시도와 지수 백오프(Retry-After 우선)
+    openai_call_timeout_seconds: float = float(os.getenv("OPENAI_CALL_TIMEOUT_SECONDS", "30"))
+    openai_max_retries: int = int(os.getenv("OPENAI_MAX_RETRIES", "3"))
+    openai_backoff_base_seconds: float = float(os.getenv("OPENAI_BACKOFF_BASE_SECONDS", "0.5"))
+    openai_backoff_max_seconds: float = float(os.getenv("OPENAI_BACKOFF_MAX_SECONDS", "20"))
+
+    # 일괄 검증 동시성/요청 속도 제한
+    ai_batch_concurrency: int = int(os.getenv("AI_BATCH_CONCURRENCY", "8"))
+    ai_rate_limit_per_second: float = float(os.getenv("AI_RATE_LIMIT_PER_SECOND", "5"))  # 모든 세션 공용, 0이면 제한 없음
+    # 느린 요청 헤지: p95 시간이 지나도 응답이 없으면 다음 모델로 한 번 더 요청 (비용이 늘어 기본은 끔)
+    ai_hedge_enabled: bool = os.getenv("AI_HEDGE_ENABLED", "0") == "1"
+    ai_hedge_percentile: float = float(os.getenv("AI_HEDGE_PERCENTILE", "95"))
+    ai_hedge_delay_seconds: float = float(os.getenv("AI_HEDGE_DELAY_SECONDS", "3"))  # 응답 시간 표본이 모이기 전 기본값
+
+    # 백그라운드 검증 작업 큐 (프로세스 공유 스레드 풀, 같은 요청은 한 번만 호출)
+    ai_job_workers: int = int(os.getenv("AI_JOB_WORKERS", "4"))
+    ai_job_retention_seconds: int = int(os.getenv("AI_JOB_RETENTION_SECONDS", "600"))  # 끝난 작업 결과 보관
+    ai_job_poll_seconds: float = float(os.getenv("AI_JOB_POLL_SECONDS", "0.5"))  # 화면 갱신 주기
+
+    # 수행내역 초안 자동 저장 (write-behind): rerun마다 메모리에 모으고 입력이 멈춘 뒤 묶어서 저장
+    draft_autosave_enabled: bool = os.getenv("DRAFT_AUTOSAVE_ENABLED", "1") == "1"
+    draft_flush_seconds: float = float(os.getenv("DRAFT_FLUSH_SECONDS", "2"))  # 마지막 변경 후 저장까지 대기
+    draft_max_delay_seconds: float = float(os.getenv("DRAFT_MAX_DELAY_SECONDS", "20"))  # 계속 바뀌어도 이 안에 저장
+
+    # AI 응답 캐시 (메모리 LRU + SQLite 파일)
+    ai_cache_enabled: bool = os.getenv("AI_CACHE_ENABLED", "1") == "1"
+    ai_cache_path: str = os.getenv("AI_CACHE_PATH", ".cache/ai_responses.db")
+    ai_cache_ttl_seconds: int = int(os.getenv("AI_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    ai_cache_max_entries: int = int(os.getenv("AI_CACHE_MAX_ENTRIES", "5000"))
+    ai_cache_memory_entries: int = int(os.getenv("AI_CACHE_MEMORY_ENTRIES", "256"))
+    # 거의 같은 수행내역(띄어쓰기·문장부호·숫자만 다름)은 이전 검증 결과를 재사용 (SimHash 유사도)
+    ai_near_dup_enabled: bool = os.getenv("AI_NEAR_DUP_ENABLED", "1") == "1"
+    ai_near_dup_threshold: float = float(os.getenv("AI_NEAR_DUP_THRESHOLD", "0.95"))
+    ai_near_dup_max_per_objective: int = int(os.getenv("AI_NEAR_DUP_MAX_PER_OBJECTIVE", "200"))
+    # 구조화 출력 모드: 짧은 JSON 스키마(누락 항목/개선안/다음 행동/질문) + 출력 토큰 상한, 파싱 결과를 DB에 저장
+    ai_structured_output: bool = os.getenv("AI_STRUCTURED_OUTPUT", "0") == "1"
+    ai_structured_max_tokens: int = int(os.getenv("AI_STRUCTURED_MAX_TOKENS", "800"))
+
+    # 성능 계측 (rerun 구간/쿼리/LLM 호출 → JSONL, Prometheus 텍스트)
+    metrics_enabled: bool = os.getenv("METRICS_ENABLED", "1") == "1"
+    metrics_jsonl_path: str = os.getenv("METRICS_JSONL_PATH", ".cache/metrics.jsonl")
+    metrics_prometheus_path: str = os.getenv("METRICS_PROMETHEUS_PATH", ".cache/metrics.prom")
+    metrics_flush_seconds: float = float(os.getenv("METRICS_FLUSH_SECONDS", "5"))
+    metrics_jsonl_max_bytes: int = int(os.getenv("METRICS_JSONL_MAX_BYTES", str(10 * 1024 * 1024)))
+    metrics_prometheus_port: int = int(os.getenv("METRICS_PROMETHEUS_PORT", "0"))  # 0이면 HTTP 엔드포인트 끔
+    metrics_host: str = os.getenv("METRICS_HOST", "127.0.0.1")  # 외부 수집기용이면 0.0.0.0
+    metrics_debug_panel: bool = os.getenv("METRICS_DEBUG_PANEL", "0") == "1"
+
     @property
     def openai_api_key(self) -> str:
         """OpenAI API 키를 가져옵니다. Streamlit Cloud에서는 secrets를 우선 사용합니다."""
@@ -27,4 +96,14 @@ class Settings:
         # 환경변수에서 가져오기
         return os.getenv("OPENAI_API_KEY", "")
 
+    @property
+    def openai_base_url(self) -> str:
+        """OpenAI 호환 API 주소 (비우면 SDK 기본값). 오프라인 벤치마크에서는 로컬 스텁 주소를 지정합니다."""
+        try:
+            if hasattr(st, 'secrets') and 'openai' in st.secrets and "base_url" in st.secrets["openai"]:
+                return st.secrets["openai"]["base_url"]
+        except Exception:
+            pass
+        return os.getenv("OPENAI_BASE_URL", "")
+
 settings = Settings()
@@ -0,0 +1,560 @@
+from __future__ import annotations
+import asyncio
+import importlib
+import weakref
+from datetime import date
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional
+from sqlalchemy import event, select, update
+from sqlalchemy.exc import OperationalError
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from .models import Company, OKRCycle, Objective, KeyResult, KRUpdate, DailyProgress
+from .snapshots import (
+    CycleProgressRow, CycleRow, CycleTree, KeyResultRow, KRUpdateRow, LogSearchHit, ObjectiveProgressRow, ObjectiveRow,
+)
+from . import repository, rollups, search_index
+from .repository import BULK_CHUNK_SIZE, column_python_types, table_columns  # noqa: F401 (동기 모듈과 같은 이름으로 제공)
+from config.settings import settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+# db.repository의 비동기 버전 (SQLAlchemy AsyncEngine/AsyncSession)
+# 로컬은 sqlite+aiosqlite, 운영은 postgresql+asyncpg. 쿼리·대량 쓰기·롤업 갱신은 동기 모듈의 것을 그대로 쓰고
+# (세션을 받는 헬퍼는 run_sync로 호출), 조회 캐시도 동기 모듈과 공유하므로 어느 쪽에서 쓰든 서로의 캐시가 무효화된다.
+# 커넥션은 이벤트 루프에 묶이므로 엔진은 루프마다 하나씩 만든다.
+
+# 동기 드라이버 → 비동기 드라이버
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+_DRIVER_PACKAGES = {"aiosqlite": "aiosqlite", "asyncpg": "asyncpg"}
+
+_engine_url: Optional[str] = None
+_engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncEngine]" = weakref.WeakKeyDictionary()
+_init_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+_schema_ready: set[str] = set()  # DDL을 마친 URL
+_fts_ready: Dict[str, bool] = {}  # URL별 SQLite FTS5 검색 색인 사용 가능 여부
+
+_read_cache = repository._read_cache
+_cached = _read_cache.cached
+
+
+def async_url(url: str) -> str:
+    """동기 DB URL의 드라이버를 비동기 드라이버로 바꾼다 (sqlite:///x.db → sqlite+aiosqlite:///x.db)."""
+    scheme, sep, rest = url.partition("://")
+    return f"{_ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+def _url() -> str:
+    return _engine_url or settings.db_async_url or async_url(settings.db_url)
+
+
+def _require_async_driver(url: str) -> None:
+    packages = ["greenlet"]
+    driver = url.partition("://")[0].partition("+")[2]
+    if driver in _DRIVER_PACKAGES:
+        packages.append(_DRIVER_PACKAGES[driver])
+    for package in packages:
+        try:
+            importlib.import_module(package)
+        except ImportError as e:
+            raise RuntimeError(
+                f"비동기 저장소를 쓰려면 {package}를 설치하세요: pip install {' '.join(packages)}"
+            ) from e
+
+
+def _create_engine(url: str) -> "AsyncEngine":
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from services.metrics import instrument_engines
+
+    _require_async_driver(url)
+    instrument_engines()
+    if url.startswith("sqlite"):
+        engine = create_async_engine(url, echo=False, connect_args={"timeout": settings.db_busy_timeout_ms / 1000})
+        event.listen(engine.sync_engine, "connect", repository._apply_sqlite_pragmas)
+        return engine
+    return create_async_engine(
+        url,
+        echo=False,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=True,
+    )
+
+
+def get_engine() -> "AsyncEngine":
+    """현재 이벤트 루프용 엔진을 처음 사용할 때 생성해 반환한다 (루프 안에서 호출)."""
+    loop = asyncio.get_running_loop()
+    engine = _engines.get(loop)
+    if engine is None:
+        with repository._engine_lock:
+            engine = _engines.get(loop)
+            if engine is None:
+                engine = _engines[loop] = _create_engine(_url())
+    return engine
+
+
+async def dispose_engine() -> None:
+    """현재 루프의 엔진 커넥션을 정리한다. asyncio.run()이 끝나기 전에 호출하면 경고 없이 종료된다."""
+    engine = _engines.pop(asyncio.get_running_loop(), None)
+    if engine is not None:
+        await engine.dispose()
+
+
+async def reset_engine(db_url: Optional[str] = None) -> None:
+    """엔진을 정리하고 다음 사용 시 db_url(기본: 설정값, 동기 URL이면 드라이버를 바꿈)로 다시 만든다. 벤치마크/도구용."""
+    global _engine_url
+    await dispose_engine()
+    _engines.clear()
+    _engine_url = async_url(db_url) if db_url else None
+    _schema_ready.clear()
+    _read_cache.clear()
+
+
+def get_session() -> "AsyncSession":
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    # 커밋 후 속성을 다시 읽지 않도록 (비동기 세션은 지연 로딩 불가)
+    return AsyncSession(get_engine(), expire_on_commit=False)
+
+
+async def init_db() -> None:
+    """스키마를 생성한다. URL당 한 번만 실제 DDL을 실행한다 (동기 모듈과 같은 DDL)."""
+    url = _url()
+    if url in _schema_ready:
+        return
+    lock = _init_locks.setdefault(asyncio.get_running_loop(), asyncio.Lock())
+    async with lock:
+        if url in _schema_ready:
+            return
+        engine = get_engine()
+        async with engine.begin() as conn:
+            await conn.run_sync(repository._create_schema)
+        _fts_ready[url] = False
+        if engine.dialect.name == "sqlite":
+            try:
+                async with engine.begin() as conn:
+                    await conn.run_sync(search_index.create_index)
+                _fts_ready[url] = True
+            except OperationalError as e:
+                # FTS5/trigram 미지원만 LIKE 검색으로 대체하고, 그 밖의 오류는 올려 다음 init_db에서 다시 시도
+                if not search_index.unsupported(e):
+                    raise
+        _schema_ready.add(url)
+
+
+def read_cache_stats() -> dict:
+    """조회 캐시 적중률/항목별 경과 시간 (동기 모듈과 같은 캐시)"""
+    return _read_cache.stats()
+
+
+def clear_read_cache() -> None:
+    _read_cache.clear()
+
+# Companies
+
+async def upsert_company(name: str) -> Company:
+    from sqlalchemy.exc import IntegrityError
+
+    async with get_session() as s:
+        comp = (await s.scalars(select(Company).where(Company.name == name))).first()
+        if comp:
+            return comp
+        comp = Company(name=name)
+        s.add(comp)
+        try:
+            await s.commit()
+        except IntegrityError:
+            # 다른 세션이 같은 이름을 먼저 만든 경우
+            await s.rollback()
+            return (await s.scalars(select(Company).where(Company.name == name))).one()
+        _read_cache.invalidate("companies")
+        return comp
+
+
+@_cached("companies")
+async def find_company_id(name: str) -> Optional[int]:
+    """이름이 같은 회사 ID (없으면 None)"""
+    async with get_session() as s:
+        return await s.scalar(select(Company.id).where(Company.name == name))
+
+# Cycles/Objectives/KRs
+
+async def create_cycle(company_id: int, name: str, start_date, end_date) -> OKRCycle:
+    async with get_session() as s:
+        cycle = OKRCycle(company_id=company_id, name=name, start_date=start_date, end_date=end_date)
+        s.add(cycle)
+        await s.commit()
+    _read_cache.invalidate("cycles")
+    return cycle
+
+
+@_cached("cycles")
+async def find_cycle_id(company_id: int, start_date, end_date) -> Optional[int]:
+    """회사의 같은 기간 사이클 ID (없으면 None)"""
+    async with get_session() as s:
+        return await s.scalar(repository._find_cycle_id_stmt(company_id, start_date, end_date))
+
+
+async def create_objective(cycle_id: int, owner: str, text: str) -> Objective:
+    def _create(s) -> Objective:
+        obj = Objective(cycle_id=cycle_id, owner=owner, text=text)
+        s.add(obj)
+        s.flush()
+        rollups.on_objective_created(s, obj.id, cycle_id)
+        return obj
+
+    async with get_session() as s:
+        obj = await s.run_sync(_create)
+        await s.commit()
+    _read_cache.invalidate(f"cycle:{cycle_id}")
+    return obj
+
+
+async def add_kr(objective_id: int, text: str, target: float | None = None, unit: str | None = None) -> KeyResult:
+    def _add(s) -> tuple[KeyResult, List[str]]:
+        kr = KeyResult(objective_id=objective_id, text=text, target=target, unit=unit)
+        s.add(kr)
+        s.flush()
+        rollups.on_krs_added(s, objective_id, [kr.id])
+        cycle_ids = repository._cycle_ids_for_objectives(s, [objective_id])
+        return kr, [f"objective:{objective_id}", *(f"cycle:{c}" for c in cycle_ids)]
+
+    async with get_session() as s:
+        kr, tags = await s.run_sync(_add)
+        await s.commit()
+    _read_cache.invalidate(*tags)
+    return kr
+
+
+@_cached("cycle:{cycle_id}")
+async def find_objective_id(cycle_id: int, text: str) -> Optional[int]:
+    """사이클에서 문구가 같은 Objective ID (없으면 None)"""
+    async with get_session() as s:
+        return await s.scalar(repository._find_objective_id_stmt(cycle_id, text))
+
+
+async def list_objectives(cycle_id: int) -> List[Objective]:
+    async with get_session() as s:
+        return list(await s.scalars(select(Objective).where(Objective.cycle_id == cycle_id)))
+
+
+async def list_krs(objective_id: int) -> List[KeyResult]:
+    async with get_session() as s:
+        return list(await s.scalars(select(KeyResult).where(KeyResult.objective_id == objective_id)))
+
+
+# Progress rollups
+
+@_cached("cycle:{cycle_id}")
+async def get_objective_progress(cycle_id: int) -> List[ObjectiveProgressRow]:
+    """사이클의 Objective별 진행률/상태 (Objective당 미리 계산된 한 행)"""
+    async with get_engine().connect() as conn:
+        result = await conn.execute(repository._objective_progress_stmt(cycle_id))
+        return [ObjectiveProgressRow(*row) for row in result]
+
+
+@_cached("cycle:{cycle_id}")
+async def get_cycle_progress(cycle_id: int) -> Optional[CycleProgressRow]:
+    """사이클 전체 진행률/상태"""
+    async with get_engine().connect() as conn:
+        row = (await conn.execute(repository._cycle_progress_stmt(cycle_id))).first()
+    return CycleProgressRow(*row) if row else None
+
+
+async def rebuild_rollups() -> None:
+    """모든 진행률 롤업을 원본 데이터로 다시 계산한다 (복구용)."""
+    async with get_session() as s:
+        await s.run_sync(rollups.rebuild)
+        await s.commit()
+    _read_cache.clear()
+
+
+# 읽기 전용 행(DTO) 조회
+
+@_cached("cycles")
+async def list_cycle_rows(company_id: int | None = None) -> List[CycleRow]:
+    """OKR 사이클 목록 (최근 시작일 순)"""
+    async with get_engine().connect() as conn:
+        return [CycleRow(*row) for row in await conn.execute(repository._cycle_rows_stmt(company_id))]
+
+
+@_cached("cycle:{cycle_id}")
+async def list_objective_rows(cycle_id: int) -> List[ObjectiveRow]:
+    async with get_engine().connect() as conn:
+        return [ObjectiveRow(*row) for row in await conn.execute(repository._objective_rows_stmt(cycle_id))]
+
+
+@_cached("objective:{objective_id}")
+async def list_kr_rows(objective_id: int) -> List[KeyResultRow]:
+    async with get_engine().connect() as conn:
+        return [KeyResultRow(*row) for row in await conn.execute(repository._kr_rows_stmt(objective_id))]
+
+
+@_cached("kr:{kr_id}")
+async def list_kr_update_rows(kr_id: int, limit: int | None = None) -> List[KRUpdateRow]:
+    """KR 업데이트를 최신순으로 조회한다 (불변 KRUpdateRow)."""
+    async with get_engine().connect() as conn:
+        return [KRUpdateRow(*row) for row in await conn.execute(repository._kr_update_rows_stmt(kr_id, limit))]
+
+
+async def add_kr_update(kr_id: int, note: str, progress: float | None = None) -> KRUpdate:
+    def _add(s) -> tuple[KRUpdate, List[str]]:
+        upd = KRUpdate(kr_id=kr_id, note=note, progress=progress)
+        s.add(upd)
+        s.flush()
+        rollups.on_kr_updates(s, [(kr_id, progress, upd.created_at)])
+        return upd, [f"kr:{kr_id}", *(f"cycle:{c}" for c in repository._cycle_ids_for_krs(s, [kr_id]))]
+
+    async with get_session() as s:
+        upd, tags = await s.run_sync(_add)
+        await s.commit()
+    _read_cache.invalidate(*tags)
+    return upd
+
+
+async def list_daily_progress(
+    objective_id: int, start: date | None = None, end: date | None = None,
+) -> List[DailyProgress]:
+    """Objective의 수행내역(초안 제외)을 날짜 범위로 조회한다."""
+    async with get_session() as s:
+        return list(await s.scalars(repository._daily_progress_stmt(objective_id, start, end)))
+
+
+@_cached("daily_progress")
+async def find_daily_progress(
+    company: str, start_date: date, end_date: date, objective_text: str, day: date,
+) -> List[tuple[str, Optional[str]]]:
+    """회사·사이클 기간·Objective 문구로 그날의 (content, ai_validation) 목록 (초안 제외)"""
+    stmt = repository._find_daily_progress_stmt(company, start_date, end_date, objective_text, day)
+    async with get_session() as s:
+        return [tuple(row) for row in await s.execute(stmt)]
+
+
+@_cached("drafts")
+async def find_draft(
+    company: str, start_date: date, end_date: date, objective_text: str, day: date, owner: str,
+) -> Optional[str]:
+    """owner가 그날 자동 저장한 수행내역 초안. 없으면 None."""
+    async with get_session() as s:
+        return await s.scalar(repository._find_draft_stmt(company, start_date, end_date, objective_text, day, owner))
+
+
+async def add_daily_progress(objective_id: int, day: date, content: str, draft_owner: Optional[str] = None) -> int:
+    """수행내역을 저장하고 ID를 반환한다. draft_owner의 그날 초안이 있으면 그 행을 수행내역으로 전환한다."""
+    async with get_session() as s:
+        dp_id = await s.run_sync(repository._add_daily_progress, objective_id, day, content, draft_owner)
+        await s.commit()
+    _read_cache.invalidate("daily_progress", "drafts")
+    return dp_id
+
+
+async def save_drafts(drafts: Iterable[tuple[str, int, date, str]]) -> int:
+    """(owner, objective_id, date, content) 초안 목록을 한 트랜잭션으로 저장한다 (빈 내용은 초안 삭제)."""
+    latest = {(owner, objective_id, day): content for owner, objective_id, day, content in drafts}
+    if not latest:
+        return 0
+    async with get_session() as s:
+        await s.run_sync(repository._save_drafts, latest)
+        await s.commit()
+    _read_cache.invalidate("drafts")
+    return len(latest)
+
+
+async def latest_kr_updates(kr_ids: Iterable[int]) -> Dict[int, KRUpdate]:
+    """여러 KR의 최신 업데이트를 한 번의 쿼리로 조회한다."""
+    ids = list(set(kr_ids))
+    if not ids:
+        return {}
+    async with get_session() as s:
+        return {upd.kr_id: upd for upd in await s.scalars(repository._latest_kr_updates_stmt(ids))}
+
+
+async def kr_progress_history(cycle_id: int) -> List[tuple[int, float, float]]:
+    """사이클 내 모든 KR의 (kr_id, created_at epoch 초, progress) 이력 (kr_id, 시간순)"""
+    engine = get_engine()
+    async with engine.connect() as conn:
+        result = await conn.execute(repository._kr_progress_history_stmt(cycle_id, engine.dialect.name))
+        return list(result.tuples())
+
+
+@_cached("cycle:{cycle_id}")
+async def load_cycle_tree(cycle_id: int) -> Optional[CycleTree]:
+    """사이클·Objective·KR·KR별 최신 업데이트를 고정된 4개 쿼리로 읽어 불변 스냅샷으로 반환한다."""
+    cycle_stmt, objectives_stmt, krs_stmt, updates_stmt = repository._cycle_tree_stmts(cycle_id)
+    async with get_session() as s:
+        cycle = (await s.execute(cycle_stmt)).first()
+        if cycle is None:
+            return None
+        objectives = (await s.execute(objectives_stmt)).all()
+        krs = (await s.execute(krs_stmt)).all()
+        updates = (await s.execute(updates_stmt)).all()
+    return repository._build_cycle_tree(cycle, objectives, krs, updates)
+
+# Full-text search
+
+async def search_logs(
+    query: str,
+    cycle_id: int | None = None,
+    limit: int = 50,
+    start: date | None = None,
+    end: date | None = None,
+) -> List[LogSearchHit]:
+    """수행내역과 KR 노트를 검색해 최신순으로 반환한다 (repository.search_logs와 같은 규칙)."""
+    await init_db()
+    use_fts = _fts_ready.get(_url(), False)
+    async with get_session() as s:
+        return await s.run_sync(search_index.search, query, use_fts, cycle_id, start, end, limit)
+
+
+async def rebuild_search_index() -> None:
+    """검색 색인을 원본 테이블 기준으로 다시 만든다."""
+    await init_db()
+    if _fts_ready.get(_url(), False):
+        async with get_engine().begin() as conn:
+            await conn.run_sync(search_index.rebuild_index)
+
+# Bulk writes (한 트랜잭션, executemany)
+
+async def bulk_add_krs(
+    objective_id: int,
+    krs: Iterable[str | Mapping[str, Any]],
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> List[int]:
+    """KR 여러 개를 한 트랜잭션으로 추가하고 생성된 ID 목록을 반환한다."""
+    def _add(s) -> tuple[List[int], List[str]]:
+        ids = repository._insert_krs(s, objective_id, krs, chunk_size)
+        cycle_ids = repository._cycle_ids_for_objectives(s, [objective_id])
+        return ids, [f"objective:{objective_id}", *(f"cycle:{c}" for c in cycle_ids)]
+
+    async with get_session() as s:
+        ids, tags = await s.run_sync(_add)
+        await s.commit()
+    _read_cache.invalidate(*tags)
+    return ids
+
+
+async def create_objective_with_krs(
+    cycle_id: int,
+    owner: str,
+    text: str,
+    krs: Iterable[str | Mapping[str, Any]],
+) -> tuple[int, List[int]]:
+    """Objective와 KR들을 한 트랜잭션으로 생성하고 (objective_id, kr_ids)를 반환한다."""
+    async with get_session() as s:
+        objective_id, kr_ids = await s.run_sync(repository._create_objective_with_krs, cycle_id, owner, text, krs)
+        await s.commit()
+    _read_cache.invalidate(f"cycle:{cycle_id}")
+    return objective_id, kr_ids
+
+
+async def bulk_add_kr_updates(updates: Iterable[Mapping[str, Any]], chunk_size: int = BULK_CHUNK_SIZE) -> int:
+    """KR 업데이트(kr_id, note, progress[, created_at]) 여러 건을 한 트랜잭션으로 추가하고 건수를 반환한다."""
+    async with get_session() as s:
+        count, tags = await s.run_sync(repository._bulk_add_kr_updates, updates, chunk_size)
+        await s.commit()
+    _read_cache.invalidate(*tags)
+    return count
+
+
+async def bulk_add_daily_progress(entries: Iterable[Mapping[str, Any]], chunk_size: int = BULK_CHUNK_SIZE) -> int:
+    """수행내역(objective_id, date, content[, ai_validation, ai_comment]) 여러 건을 한 트랜잭션으로 추가한다."""
+    async with get_session() as s:
+        count = await s.run_sync(repository._bulk_add_daily_progress, entries, chunk_size)
+        await s.commit()
+    _read_cache.invalidate("daily_progress")
+    return count
+
+
+async def bulk_add_cycles(rows: Iterable[Mapping[str, Any]], chunk_size: int = BULK_CHUNK_SIZE) -> int:
+    """사이클(company_id, name, start_date, end_date[, id]) 여러 건을 한 트랜잭션으로 추가한다."""
+    async with get_session() as s:
+        count = await s.run_sync(repository._bulk_add_cycles, rows, chunk_size)
+        await s.commit()
+    _read_cache.invalidate("cycles")
+    return count
+
+
+async def bulk_add_objectives(rows: Iterable[Mapping[str, Any]], chunk_size: int = BULK_CHUNK_SIZE) -> List[int]:
+    """Objective(cycle_id, owner, text[, id]) 여러 건을 한 트랜잭션으로 추가하고 ID 목록을 반환한다."""
+    async with get_session() as s:
+        ids, tags = await s.run_sync(repository._bulk_add_objectives, rows, chunk_size)
+        await s.commit()
+    _read_cache.invalidate(*tags)
+    return ids
+
+
+async def bulk_add_key_results(rows: Iterable[Mapping[str, Any]], chunk_size: int = BULK_CHUNK_SIZE) -> List[int]:
+    """여러 Objective의 KR(objective_id, text[, target, unit, current, confidence, id])을 한 트랜잭션으로 추가한다."""
+    async with get_session() as s:
+        ids, tags = await s.run_sync(repository._bulk_add_key_results, rows, chunk_size)
+        await s.commit()
+    _read_cache.invalidate(*tags)
+    return ids
+
+# Streaming export / import 검증
+
+async def iter_table_rows(table: str, chunk_size: int = BULK_CHUNK_SIZE) -> AsyncIterator[List[Dict[str, Any]]]:
+    """테이블 전체를 id 순으로 chunk_size행씩 dict 목록으로 흘려보낸다 (서버 측 커서, 메모리 일정)."""
+    t = repository._TABLES[table]
+    order = list(t.primary_key.columns)
+    async with get_engine().connect() as conn:
+        result = await conn.stream(select(t).order_by(*order), execution_options={"yield_per": chunk_size})
+        async for part in result.mappings().partitions(chunk_size):
+            yield [dict(row) for row in part]
+
+
+async def existing_ids(table: str, ids: Iterable[int]) -> set[int]:
+    """ids 중 테이블에 실제로 있는 id (가져오기 시 참조 무결성 확인용)"""
+    t = repository._TABLES[table]
+    found: set[int] = set()
+    async with get_session() as s:
+        for chunk in repository._chunked(set(ids), BULK_CHUNK_SIZE):
+            found.update(await s.scalars(select(t.c.id).where(t.c.id.in_(chunk))))
+    return found
+
+# Daily progress / AI validation
+
+async def list_unvalidated_daily_progress(
+    cycle_id: int | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    limit: int | None = None,
+) -> List[tuple[DailyProgress, Objective]]:
+    """AI 검증이 아직 없는 수행내역(초안 제외)을 Objective와 함께 조회한다 (사이클/기간 필터)."""
+    async with get_session() as s:
+        result = await s.execute(repository._unvalidated_stmt(cycle_id, start, end, limit))
+        return [(dp, obj) for dp, obj in result.all()]
+
+
+async def kr_texts_by_objective(objective_ids: Iterable[int]) -> Dict[int, List[str]]:
+    """여러 Objective의 KR 문구를 한 번의 쿼리로 조회한다."""
+    ids = list(set(objective_ids))
+    result: Dict[int, List[str]] = {oid: [] for oid in ids}
+    if not ids:
+        return result
+    async with get_session() as s:
+        for objective_id, kr_text in await s.execute(repository._kr_texts_stmt(ids)):
+            result[objective_id].append(kr_text)
+    return result
+
+
+async def save_validations(results: Iterable[tuple[int, str, Optional[str]]]) -> int:
+    """(daily_progress_id, ai_validation, ai_comment) 목록을 한 트랜잭션으로 저장한다."""
+    rows = repository._validation_rows(results)
+    if not rows:
+        return 0
+    async with get_session() as s:
+        await s.execute(update(DailyProgress), rows)
+        await s.commit()
+    _read_cache.invalidate("daily_progress")
+    return len(rows)
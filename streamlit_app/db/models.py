@@ -2,7 +2,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy import String, Integer, ForeignKey, Date, Text, Float
+from sqlalchemy import String, Integer, ForeignKey, Date, Text, Float, Index, Boolean, false
 
 class Base(DeclarativeBase):
     pass
@@ -24,14 +24,14 @@ class OKRCycle(Base):
 class Objective(Base):
     __tablename__ = "objectives"
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    cycle_id: Mapped[int] = mapped_column(ForeignKey("okr_cycles.id"), nullable=False)
+    cycle_id: Mapped[int] = mapped_column(ForeignKey("okr_cycles.id"), nullable=False, index=True)
     owner: Mapped[str] = mapped_column(String(80), nullable=False)
     text: Mapped[str] = mapped_column(Text, nullable=False)
 
 class KeyResult(Base):
     __tablename__ = "key_results"
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    objective_id: Mapped[int] = mapped_column(ForeignKey("objectives.id"), nullable=False)
+    objective_id: Mapped[int] = mapped_column(ForeignKey("objectives.id"), nullable=False, index=True)
     text: Mapped[str] = mapped_column(Text, nullable=False)
     target: Mapped[Optional[float]] = mapped_column(Float)
     unit: Mapped[Optional[str]] = mapped_column(String(32))
@@ -40,6 +40,8 @@ class KeyResult(Base):
 
 class KRUpdate(Base):
     __tablename__ = "kr_updates"
+    # KR별 최신/기간 업데이트 조회용
+    __table_args__ = (Index("ix_kr_updates_kr_id_created_at", "kr_id", "created_at"),)
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     kr_id: Mapped[int] = mapped_column(ForeignKey("key_results.id"), nullable=False)
     note: Mapped[str] = mapped_column(Text, nullable=False)
@@ -48,10 +50,43 @@ class KRUpdate(Base):
 
 class DailyProgress(Base):
     __tablename__ = "daily_progress"
+    # Objective별 날짜 범위(달력) 조회용
+    __table_args__ = (Index("ix_daily_progress_objective_id_date", "objective_id", "date"),)
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     objective_id: Mapped[int] = mapped_column(ForeignKey("objectives.id"), nullable=False)
     date: Mapped[datetime] = mapped_column(Date, nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     ai_validation: Mapped[Optional[str]] = mapped_column(Text)
     ai_comment: Mapped[Optional[str]] = mapped_column(Text)
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
\ No newline at end of file
+    # 검증 전 자동 저장된 초안 (작성자·Objective·날짜당 한 건, 검증을 요청하면 일반 수행내역으로 전환)
+    is_draft: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default=false())
+    # 초안을 쓴 작성자(브라우저 세션). 같은 Objective를 쓰는 다른 세션의 초안과 섞이지 않게 한다
+    draft_owner: Mapped[Optional[str]] = mapped_column(String(64))
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+
+# 진행률 롤업 (KR 업데이트 시 증분 갱신되는 집계 테이블)
+
+class KRRollup(Base):
+    __tablename__ = "kr_rollups"
+    kr_id: Mapped[int] = mapped_column(ForeignKey("key_results.id"), primary_key=True)
+    objective_id: Mapped[int] = mapped_column(ForeignKey("objectives.id"), nullable=False, index=True)
+    progress: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)  # 0~100
+    update_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_update_at: Mapped[Optional[datetime]] = mapped_column()
+
+class ObjectiveRollup(Base):
+    __tablename__ = "objective_rollups"
+    objective_id: Mapped[int] = mapped_column(ForeignKey("objectives.id"), primary_key=True)
+    cycle_id: Mapped[int] = mapped_column(ForeignKey("okr_cycles.id"), nullable=False, index=True)
+    kr_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    progress_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    progress: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    status: Mapped[str] = mapped_column(String(8), nullable=False, default="red")
+
+class CycleRollup(Base):
+    __tablename__ = "cycle_rollups"
+    cycle_id: Mapped[int] = mapped_column(ForeignKey("okr_cycles.id"), primary_key=True)
+    objective_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    progress_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    progress: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    status: Mapped[str] = mapped_column(String(8), nullable=False, default="red")
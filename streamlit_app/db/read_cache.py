@@ -0,0 +1,151 @@
+from __future__ import annotations
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+
+@dataclass
+class _Entry:
+    value: Any
+    loaded_at: float
+    versions: Tuple[Tuple[str, int], ...]
+
+
+class ReadCache:
+    """프로세스 공용 조회 캐시. 태그(cycle:1, objective:3 ...) 버전으로 무효화한다.
+
+    쓰기는 커밋 후 관련 태그의 버전을 올리고, 조회는 저장 당시 버전과 현재 버전이
+    다르면 다시 읽는다. 로드 시작 전에 버전을 기록하므로 로드 중 커밋된 변경도 놓치지 않는다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, enabled: bool = True) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _current(self, tags: Iterable[str]) -> Tuple[Tuple[str, int], ...]:
+        return tuple((tag, self._versions.get(tag, 0)) for tag in tags)
+
+    def get_or_load(self, key: Hashable, tags: Iterable[str], loader: Callable[[], Any]) -> Any:
+        """캐시에 유효한 값이 있으면 반환하고, 없으면 loader로 읽어 저장한다."""
+        tags = tuple(tags)
+        if not self.enabled:
+            return loader()
+        now = time.monotonic()
+        found, value, versions = self._lookup(key, tags, now)
+        if found:
+            return value
+        value = loader()
+        self._store(key, value, now, versions)
+        return value
+
+    async def aget_or_load(self, key: Hashable, tags: Iterable[str], loader: Callable[[], Awaitable[Any]]) -> Any:
+        """get_or_load의 비동기 버전 (같은 캐시 항목/태그 버전을 동기 조회와 함께 쓴다)"""
+        tags = tuple(tags)
+        if not self.enabled:
+            return await loader()
+        now = time.monotonic()
+        found, value, versions = self._lookup(key, tags, now)
+        if found:
+            return value
+        value = await loader()
+        self._store(key, value, now, versions)
+        return value
+
+    def _lookup(self, key: Hashable, tags: Tuple[str, ...], now: float) -> Tuple[bool, Any, Optional[tuple]]:
+        """(적중 여부, 값, 로드 전에 기록한 태그 버전)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.versions == self._current(tags) and now - entry.loaded_at <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, entry.value, None
+                self.stale += 1
+                del self._entries[key]
+            self.misses += 1
+            return False, None, self._current(tags)
+
+    def _store(self, key: Hashable, value: Any, now: float, versions: tuple) -> None:
+        with self._lock:
+            self._entries[key] = _Entry(value, now, versions)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *tags: str) -> None:
+        """태그 버전을 올려 해당 태그로 저장된 값을 모두 무효화한다."""
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+            self.invalidations += len(tags)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def stats(self) -> dict:
+        """디버깅용 적중률/항목 수/항목별 경과 시간(staleness)"""
+        now = time.monotonic()
+        with self._lock:
+            total = self.hits + self.misses
+            ages = {f"{key[0]}{key[1]}": round(now - e.loaded_at, 1) for key, e in self._entries.items()}
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale_reloads": self.stale,
+                "invalidations": self.invalidations,
+                "hit_ratio": round(self.hits / total, 3) if total else 0.0,
+                "max_age_seconds": max(ages.values(), default=0.0),
+                "entry_ages_seconds": ages,
+            }
+
+    def cached(self, *tag_templates: str):
+        """조회 함수 데코레이터. 태그는 인자 이름으로 포맷한다 (예: "cycle:{cycle_id}").
+
+        리스트 결과는 호출자가 수정해도 캐시가 오염되지 않도록 얕은 복사본을 반환한다.
+        코루틴 함수에도 쓸 수 있으며, 같은 이름의 동기 함수와 캐시 항목을 공유한다.
+        """
+        def decorator(fn):
+            signature = inspect.signature(fn)
+
+            def _key_and_tags(args, kwargs):
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                arguments = bound.arguments
+                key = (fn.__name__, tuple(arguments.values()))
+                return key, [template.format(**arguments) for template in tag_templates]
+
+            if inspect.iscoroutinefunction(fn):
+                @functools.wraps(fn)
+                async def async_wrapper(*args, **kwargs):
+                    key, tags = _key_and_tags(args, kwargs)
+                    value = await self.aget_or_load(key, tags, lambda: fn(*args, **kwargs))
+                    return list(value) if isinstance(value, list) else value
+
+                async_wrapper.uncached = fn
+                return async_wrapper
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                key, tags = _key_and_tags(args, kwargs)
+                value = self.get_or_load(key, tags, lambda: fn(*args, **kwargs))
+                return list(value) if isinstance(value, list) else value
+
+            wrapper.uncached = fn
+            return wrapper
+        return decorator
@@ -1,21 +1,179 @@
 from __future__ import annotations
-from typing import Iterable, List, Optional
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import Session
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+from sqlalchemy import create_engine, delete, event, extract, func, insert, inspect, select, text, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.schema import CreateColumn
 import sys
 import os
+import threading
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from .models import Base, Company, OKRCycle, Objective, KeyResult, KRUpdate
+from .models import (
+    Base, Company, OKRCycle, Objective, KeyResult, KRUpdate, DailyProgress,
+    CycleRollup, ObjectiveRollup,
+)
+from .snapshots import (
+    CycleProgressRow, CycleRow, CycleTree, KeyResultRow, KRNode, KRUpdateRow, LogSearchHit, ObjectiveNode,
+    ObjectiveProgressRow, ObjectiveRow,
+)
+from . import rollups, search_index
+from .read_cache import ReadCache
 from config.settings import settings
 
-_engine = create_engine(settings.db_url, echo=False)
-Base.metadata.create_all(_engine)
+_engine: Optional[Engine] = None
+_engine_url: Optional[str] = None
+_engine_lock = threading.Lock()
+_schema_ready = False
+_fts_ready = False  # SQLite FTS5 검색 색인 사용 가능 여부 (init_db에서 결정)
+
+# 조회 캐시: 태그는 "cycles", "cycle:<id>", "objective:<id>", "kr:<id>"
+_read_cache = ReadCache(
+    max_entries=settings.db_read_cache_max_entries,
+    ttl_seconds=settings.db_read_cache_ttl_seconds,
+    enabled=settings.db_read_cache_enabled,
+)
+_cached = _read_cache.cached
+
+
+def _apply_sqlite_pragmas(dbapi_conn, _connection_record) -> None:
+    """SQLite 연결마다 성능 관련 PRAGMA를 적용한다."""
+    cur = dbapi_conn.cursor()
+    cur.execute(f"PRAGMA busy_timeout={int(settings.db_busy_timeout_ms)}")
+    cur.execute(f"PRAGMA journal_mode={settings.db_sqlite_journal_mode}")
+    cur.execute(f"PRAGMA synchronous={settings.db_sqlite_synchronous}")
+    cur.execute(f"PRAGMA mmap_size={int(settings.db_sqlite_mmap_size)}")
+    cur.execute(f"PRAGMA cache_size={int(settings.db_sqlite_cache_size)}")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.close()
+
+
+def _create_engine(url: str) -> Engine:
+    # 쿼리 계측은 엔진을 처음 만들 때 등록 (services.metrics가 앱 시작 때 SQLAlchemy를 불러오지 않도록)
+    from services.metrics import instrument_engines
+
+    instrument_engines()
+    if url.startswith("sqlite"):
+        engine = create_engine(
+            url,
+            echo=False,
+            connect_args={"timeout": settings.db_busy_timeout_ms / 1000, "check_same_thread": False},
+        )
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+        return engine
+    return create_engine(
+        url,
+        echo=False,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=True,
+    )
+
+
+def get_engine() -> Engine:
+    """프로세스 공용 엔진을 처음 사용할 때 생성해 반환한다."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _create_engine(_engine_url or settings.db_url)
+    return _engine
+
+
+def reset_engine(db_url: Optional[str] = None) -> None:
+    """엔진을 정리하고 다음 사용 시 db_url(기본: 설정값)로 다시 만든다. 벤치마크/도구용."""
+    global _engine, _engine_url, _schema_ready
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+        _engine = None
+        _engine_url = db_url
+        _schema_ready = False
+    _read_cache.clear()
+
+
+def init_db() -> None:
+    """스키마를 생성한다. 프로세스당 한 번만 실제 DDL을 실행한다."""
+    global _schema_ready, _fts_ready
+    if _schema_ready:
+        return
+    engine = get_engine()
+    with _engine_lock:
+        if not _schema_ready:
+            with engine.begin() as conn:
+                _create_schema(conn)
+            _fts_ready = search_index.ensure_schema(engine)
+            _schema_ready = True
+
+
+def _create_schema(conn: Connection) -> None:
+    """테이블·새 컬럼·인덱스를 만들고 롤업을 채운다 (동기/비동기 저장소 공용, 비동기는 run_sync로 호출)."""
+    Base.metadata.create_all(conn)
+    _add_missing_columns(conn)
+    # create_all은 이미 있는 테이블에 새 인덱스를 추가하지 않으므로 따로 생성
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+    _backfill_rollups(conn)
+
+
+def _add_missing_columns(conn: Connection) -> None:
+    """create_all은 이미 있는 테이블에 새 컬럼을 추가하지 않으므로, 기본값이 있는 새 컬럼은 ALTER TABLE로 추가한다."""
+    inspector = inspect(conn)
+    preparer = conn.dialect.identifier_preparer
+    for table in Base.metadata.sorted_tables:
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        for col in table.columns:
+            if col.name in existing or (not col.nullable and col.server_default is None):
+                continue
+            ddl = CreateColumn(col).compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {ddl}"))
+
+
+def _backfill_rollups(conn: Connection) -> None:
+    """롤업 테이블 도입 전 데이터가 있으면 한 번 전체 계산한다."""
+    with Session(conn) as s:
+        has_objectives = s.scalar(select(Objective.id).limit(1)) is not None
+        has_rollups = s.scalar(select(ObjectiveRollup.objective_id).limit(1)) is not None
+        if has_objectives and not has_rollups:
+            rollups.rebuild(s)
+            s.commit()
 
 
 def get_session() -> Session:
-    return Session(_engine)
+    return Session(get_engine())
+
+
+def read_cache_stats() -> dict:
+    """조회 캐시 적중률/항목별 경과 시간 (디버깅용)"""
+    return _read_cache.stats()
+
+
+def clear_read_cache() -> None:
+    """다른 프로세스가 DB를 직접 바꾼 경우 등 조회 캐시를 전부 비운다."""
+    _read_cache.clear()
+
+
+def _cycle_ids_for_objectives(s: Session, objective_ids: Iterable[int]) -> List[int]:
+    ids = list(set(objective_ids))
+    return list(s.scalars(select(Objective.cycle_id).where(Objective.id.in_(ids)).distinct())) if ids else []
+
+
+def _cycle_ids_for_krs(s: Session, kr_ids: Iterable[int]) -> List[int]:
+    cycle_ids: set[int] = set()
+    for chunk in _chunked(set(kr_ids), BULK_CHUNK_SIZE):
+        cycle_ids.update(s.scalars(
+            select(Objective.cycle_id)
+            .join(KeyResult, KeyResult.objective_id == Objective.id)
+            .where(KeyResult.id.in_(chunk))
+            .distinct()
+        ))
+    return list(cycle_ids)
 
 # Companies
 
@@ -26,10 +184,23 @@ def upsert_company(name: str) -> Company:
             return comp
         comp = Company(name=name)
         s.add(comp)
-        s.commit()
+        try:
+            s.commit()
+        except IntegrityError:
+            # 다른 세션이 같은 이름을 먼저 만든 경우
+            s.rollback()
+            return s.scalars(select(Company).where(Company.name == name)).one()
+        _read_cache.invalidate("companies")
         s.refresh(comp)
         return comp
 
+
+@_cached("companies")
+def find_company_id(name: str) -> Optional[int]:
+    """이름이 같은 회사 ID (없으면 None)"""
+    with get_session() as s:
+        return s.scalar(select(Company.id).where(Company.name == name))
+
 # Cycles/Objectives/KRs
 
 def create_cycle(company_id: int, name: str, start_date, end_date) -> OKRCycle:
@@ -37,15 +208,35 @@ def create_cycle(company_id: int, name: str, start_date, end_date) -> OKRCycle:
         cycle = OKRCycle(company_id=company_id, name=name, start_date=start_date, end_date=end_date)
         s.add(cycle)
         s.commit()
+        _read_cache.invalidate("cycles")
         s.refresh(cycle)
         return cycle
 
 
+def _find_cycle_id_stmt(company_id: int, start_date, end_date):
+    return (
+        select(OKRCycle.id)
+        .where(OKRCycle.company_id == company_id, OKRCycle.start_date == start_date, OKRCycle.end_date == end_date)
+        .order_by(OKRCycle.id)
+        .limit(1)
+    )
+
+
+@_cached("cycles")
+def find_cycle_id(company_id: int, start_date, end_date) -> Optional[int]:
+    """회사의 같은 기간 사이클 ID (없으면 None)"""
+    with get_session() as s:
+        return s.scalar(_find_cycle_id_stmt(company_id, start_date, end_date))
+
+
 def create_objective(cycle_id: int, owner: str, text: str) -> Objective:
     with get_session() as s:
         obj = Objective(cycle_id=cycle_id, owner=owner, text=text)
         s.add(obj)
+        s.flush()
+        rollups.on_objective_created(s, obj.id, cycle_id)
         s.commit()
+        _read_cache.invalidate(f"cycle:{cycle_id}")
         s.refresh(obj)
         return obj
 
@@ -54,11 +245,31 @@ def add_kr(objective_id: int, text: str, target: float | None = None, unit: str
     with get_session() as s:
         kr = KeyResult(objective_id=objective_id, text=text, target=target, unit=unit)
         s.add(kr)
+        s.flush()
+        rollups.on_krs_added(s, objective_id, [kr.id])
+        tags = [f"objective:{objective_id}", *(f"cycle:{c}" for c in _cycle_ids_for_objectives(s, [objective_id]))]
         s.commit()
+        _read_cache.invalidate(*tags)
         s.refresh(kr)
         return kr
 
 
+def _find_objective_id_stmt(cycle_id: int, text: str):
+    return (
+        select(Objective.id)
+        .where(Objective.cycle_id == cycle_id, Objective.text == text)
+        .order_by(Objective.id)
+        .limit(1)
+    )
+
+
+@_cached("cycle:{cycle_id}")
+def find_objective_id(cycle_id: int, text: str) -> Optional[int]:
+    """사이클에서 문구가 같은 Objective ID (없으면 None)"""
+    with get_session() as s:
+        return s.scalar(_find_objective_id_stmt(cycle_id, text))
+
+
 def list_objectives(cycle_id: int) -> List[Objective]:
     with get_session() as s:
         return list(s.query(Objective).filter_by(cycle_id=cycle_id).all())
@@ -69,10 +280,710 @@ def list_krs(objective_id: int) -> List[KeyResult]:
         return list(s.query(KeyResult).filter_by(objective_id=objective_id).all())
 
 
+# Progress rollups (증분 유지되는 진행률 집계)
+
+def _objective_progress_stmt(cycle_id: int):
+    return (
+        select(
+            ObjectiveRollup.objective_id, ObjectiveRollup.cycle_id, ObjectiveRollup.kr_count,
+            ObjectiveRollup.progress, ObjectiveRollup.status,
+        )
+        .where(ObjectiveRollup.cycle_id == cycle_id)
+        .order_by(ObjectiveRollup.objective_id)
+    )
+
+
+@_cached("cycle:{cycle_id}")
+def get_objective_progress(cycle_id: int) -> List[ObjectiveProgressRow]:
+    """사이클의 Objective별 진행률/상태 (Objective당 미리 계산된 한 행)"""
+    with get_engine().connect() as conn:
+        return [ObjectiveProgressRow(*row) for row in conn.execute(_objective_progress_stmt(cycle_id))]
+
+
+def _cycle_progress_stmt(cycle_id: int):
+    return select(
+        CycleRollup.cycle_id, CycleRollup.objective_count, CycleRollup.progress, CycleRollup.status,
+    ).where(CycleRollup.cycle_id == cycle_id)
+
+
+@_cached("cycle:{cycle_id}")
+def get_cycle_progress(cycle_id: int) -> Optional[CycleProgressRow]:
+    """사이클 전체 진행률/상태"""
+    with get_engine().connect() as conn:
+        row = conn.execute(_cycle_progress_stmt(cycle_id)).first()
+    return CycleProgressRow(*row) if row else None
+
+
+def rebuild_rollups() -> None:
+    """모든 진행률 롤업을 원본 데이터로 다시 계산한다 (복구용)."""
+    with get_session() as s:
+        rollups.rebuild(s)
+        s.commit()
+    _read_cache.clear()
+
+
+# 읽기 전용 행(DTO) 조회: ORM identity map/instrumentation 없이 Core select로 읽는다
+
+def _cycle_rows_stmt(company_id: int | None):
+    stmt = select(OKRCycle.id, OKRCycle.company_id, OKRCycle.name, OKRCycle.start_date, OKRCycle.end_date)
+    if company_id is not None:
+        stmt = stmt.where(OKRCycle.company_id == company_id)
+    return stmt.order_by(OKRCycle.start_date.desc(), OKRCycle.id.desc())
+
+
+@_cached("cycles")
+def list_cycle_rows(company_id: int | None = None) -> List[CycleRow]:
+    """OKR 사이클 목록 (최근 시작일 순)"""
+    with get_engine().connect() as conn:
+        return [CycleRow(*row) for row in conn.execute(_cycle_rows_stmt(company_id))]
+
+
+def _objective_rows_stmt(cycle_id: int):
+    return (
+        select(Objective.id, Objective.cycle_id, Objective.owner, Objective.text)
+        .where(Objective.cycle_id == cycle_id)
+        .order_by(Objective.id)
+    )
+
+
+@_cached("cycle:{cycle_id}")
+def list_objective_rows(cycle_id: int) -> List[ObjectiveRow]:
+    """list_objectives의 경량 버전 (불변 ObjectiveRow)"""
+    with get_engine().connect() as conn:
+        return [ObjectiveRow(*row) for row in conn.execute(_objective_rows_stmt(cycle_id))]
+
+
+def _kr_rows_stmt(objective_id: int):
+    return (
+        select(
+            KeyResult.id, KeyResult.objective_id, KeyResult.text, KeyResult.target,
+            KeyResult.unit, KeyResult.current, KeyResult.confidence,
+        )
+        .where(KeyResult.objective_id == objective_id)
+        .order_by(KeyResult.id)
+    )
+
+
+@_cached("objective:{objective_id}")
+def list_kr_rows(objective_id: int) -> List[KeyResultRow]:
+    """list_krs의 경량 버전 (불변 KeyResultRow)"""
+    with get_engine().connect() as conn:
+        return [KeyResultRow(*row) for row in conn.execute(_kr_rows_stmt(objective_id))]
+
+
+def _kr_update_rows_stmt(kr_id: int, limit: int | None):
+    stmt = (
+        select(KRUpdate.id, KRUpdate.kr_id, KRUpdate.note, KRUpdate.progress, KRUpdate.created_at)
+        .where(KRUpdate.kr_id == kr_id)
+        .order_by(KRUpdate.created_at.desc(), KRUpdate.id.desc())
+    )
+    return stmt.limit(limit) if limit is not None else stmt
+
+
+@_cached("kr:{kr_id}")
+def list_kr_update_rows(kr_id: int, limit: int | None = None) -> List[KRUpdateRow]:
+    """KR 업데이트를 최신순으로 조회한다 (불변 KRUpdateRow)."""
+    with get_engine().connect() as conn:
+        return [KRUpdateRow(*row) for row in conn.execute(_kr_update_rows_stmt(kr_id, limit))]
+
+
 def add_kr_update(kr_id: int, note: str, progress: float | None = None) -> KRUpdate:
     with get_session() as s:
         upd = KRUpdate(kr_id=kr_id, note=note, progress=progress)
         s.add(upd)
+        s.flush()
+        # 이력을 다시 훑지 않고 KR→Objective→사이클 진행률을 증분 갱신
+        rollups.on_kr_updates(s, [(kr_id, progress, upd.created_at)])
+        tags = [f"kr:{kr_id}", *(f"cycle:{c}" for c in _cycle_ids_for_krs(s, [kr_id]))]
         s.commit()
+        _read_cache.invalidate(*tags)
         s.refresh(upd)
         return upd
+
+def _daily_progress_stmt(objective_id: int, start: date | None, end: date | None):
+    stmt = select(DailyProgress).where(DailyProgress.objective_id == objective_id, DailyProgress.is_draft.is_(False))
+    if start is not None:
+        stmt = stmt.where(DailyProgress.date >= start)
+    if end is not None:
+        stmt = stmt.where(DailyProgress.date <= end)
+    return stmt.order_by(DailyProgress.date, DailyProgress.id)
+
+
+def list_daily_progress(objective_id: int, start: date | None = None, end: date | None = None) -> List[DailyProgress]:
+    """Objective의 수행내역(초안 제외)을 날짜 범위로 조회한다 (objective_id, date 인덱스 사용)."""
+    with get_session() as s:
+        return list(s.scalars(_daily_progress_stmt(objective_id, start, end)))
+
+
+def _daily_progress_on(company: str, start_date: date, end_date: date, objective_text: str, day: date, *columns):
+    """회사·사이클 기간·Objective 문구로 그날의 수행내역을 찾는 select (조인 한 번)"""
+    return (
+        select(*columns)
+        .join(Objective, Objective.id == DailyProgress.objective_id)
+        .join(OKRCycle, OKRCycle.id == Objective.cycle_id)
+        .join(Company, Company.id == OKRCycle.company_id)
+        .where(
+            Company.name == company,
+            OKRCycle.start_date == start_date,
+            OKRCycle.end_date == end_date,
+            Objective.text == objective_text,
+            DailyProgress.date == day,
+        )
+    )
+
+
+def _find_daily_progress_stmt(company: str, start_date: date, end_date: date, objective_text: str, day: date):
+    return (
+        _daily_progress_on(
+            company, start_date, end_date, objective_text, day, DailyProgress.content, DailyProgress.ai_validation,
+        )
+        .where(DailyProgress.is_draft.is_(False))
+        .order_by(DailyProgress.id)
+    )
+
+
+@_cached("daily_progress")
+def find_daily_progress(
+    company: str, start_date: date, end_date: date, objective_text: str, day: date,
+) -> List[tuple[str, Optional[str]]]:
+    """회사·사이클 기간·Objective 문구로 그날의 (content, ai_validation) 목록을 한 번의 조회로 가져온다 (초안 제외)."""
+    with get_session() as s:
+        return [
+            tuple(row)
+            for row in s.execute(_find_daily_progress_stmt(company, start_date, end_date, objective_text, day))
+        ]
+
+
+def _find_draft_stmt(company: str, start_date: date, end_date: date, objective_text: str, day: date, owner: str):
+    return (
+        _daily_progress_on(company, start_date, end_date, objective_text, day, DailyProgress.content)
+        .where(DailyProgress.is_draft.is_(True), DailyProgress.draft_owner == owner)
+        .order_by(DailyProgress.id.desc())
+        .limit(1)
+    )
+
+
+@_cached("drafts")
+def find_draft(
+    company: str, start_date: date, end_date: date, objective_text: str, day: date, owner: str,
+) -> Optional[str]:
+    """owner가 그날 자동 저장한 수행내역 초안. 없으면 None."""
+    with get_session() as s:
+        return s.scalar(_find_draft_stmt(company, start_date, end_date, objective_text, day, owner))
+
+
+def _draft_ids(s: Session, objective_id: int, day: date, owner: str) -> List[int]:
+    stmt = select(DailyProgress.id).where(
+        DailyProgress.objective_id == objective_id, DailyProgress.date == day, DailyProgress.is_draft.is_(True),
+        DailyProgress.draft_owner == owner,
+    )
+    return list(s.scalars(stmt.order_by(DailyProgress.id.desc())))
+
+
+def add_daily_progress(objective_id: int, day: date, content: str, draft_owner: Optional[str] = None) -> int:
+    """수행내역 한 건을 저장하고 ID를 반환한다 (AI 검증은 나중에 save_validations로 채움).
+
+    draft_owner가 그날 자동 저장한 초안이 있으면 새 행을 만들지 않고 그 초안을 수행내역으로 전환한다.
+    """
+    with get_session() as s:
+        dp_id = _add_daily_progress(s, objective_id, day, content, draft_owner)
+        s.commit()
+    _read_cache.invalidate("daily_progress", "drafts")
+    return dp_id
+
+
+def _add_daily_progress(
+    s: Session, objective_id: int, day: date, content: str, draft_owner: Optional[str] = None,
+) -> int:
+    draft_ids = _draft_ids(s, objective_id, day, draft_owner) if draft_owner is not None else []
+    if draft_ids:
+        dp_id = draft_ids[0]
+        s.execute(
+            update(DailyProgress).where(DailyProgress.id == dp_id)
+            .values(content=content, is_draft=False, draft_owner=None, created_at=datetime.utcnow())
+        )
+        return dp_id
+    return s.scalar(
+        insert(DailyProgress).values(objective_id=objective_id, date=day, content=content)
+        .returning(DailyProgress.id)
+    )
+
+
+def save_drafts(drafts: Iterable[tuple[str, int, date, str]]) -> int:
+    """(owner, objective_id, date, content) 초안 여러 건을 한 트랜잭션으로 저장하고 건수를 반환한다.
+
+    작성자·Objective·날짜당 초안은 한 건만 유지하며, 내용이 비어 있으면 초안을 지운다.
+    """
+    latest = {(owner, objective_id, day): content for owner, objective_id, day, content in drafts}
+    if not latest:
+        return 0
+    with get_session() as s:
+        _save_drafts(s, latest)
+        s.commit()
+    _read_cache.invalidate("drafts")
+    return len(latest)
+
+
+def _save_drafts(s: Session, latest: Dict[tuple[str, int, date], str]) -> None:
+    existing: Dict[tuple[str, int, date], List[int]] = {}
+    stmt = select(DailyProgress.id, DailyProgress.draft_owner, DailyProgress.objective_id, DailyProgress.date).where(
+        DailyProgress.is_draft.is_(True),
+        DailyProgress.draft_owner.in_({owner for owner, _, _ in latest}),
+        DailyProgress.objective_id.in_({objective_id for _, objective_id, _ in latest}),
+        DailyProgress.date.in_({day for _, _, day in latest}),
+    )
+    for dp_id, owner, objective_id, day in s.execute(stmt.order_by(DailyProgress.id.desc())):
+        existing.setdefault((owner, objective_id, day), []).append(dp_id)
+    updates, inserts, stale = [], [], []
+    for (owner, objective_id, day), content in latest.items():
+        ids = existing.get((owner, objective_id, day), [])
+        if not content.strip():
+            stale += ids
+            continue
+        if ids:
+            updates.append({"id": ids[0], "content": content})
+            stale += ids[1:]
+        else:
+            inserts.append({
+                "objective_id": objective_id, "date": day, "content": content, "is_draft": True, "draft_owner": owner,
+            })
+    if updates:
+        s.execute(update(DailyProgress), updates)
+    if inserts:
+        s.execute(insert(DailyProgress), inserts)
+    if stale:
+        s.execute(delete(DailyProgress).where(DailyProgress.id.in_(stale)))
+
+
+def latest_kr_updates(kr_ids: Iterable[int]) -> Dict[int, KRUpdate]:
+    """KR별 가장 최근 업데이트를 조회한다. KR마다 (kr_id, created_at) 인덱스를 한 번씩 탐색한다."""
+    ids = list(set(kr_ids))
+    if not ids:
+        return {}
+    with get_session() as s:
+        return {upd.kr_id: upd for upd in s.scalars(_latest_kr_updates_stmt(ids))}
+
+
+def _latest_kr_updates_stmt(ids: List[int]):
+    return select(KRUpdate).where(
+        KRUpdate.id.in_(select(_latest_update_id()).select_from(KeyResult).where(KeyResult.id.in_(ids)))
+    )
+
+
+def _epoch_seconds(column, dialect_name: str):
+    """DB에서 바로 epoch 초(float)로 변환하는 식 (대량 조회 시 datetime 객체 생성 비용 제거)"""
+    if dialect_name == "sqlite":
+        return (func.julianday(column) - 2440587.5) * 86400.0
+    return extract("epoch", column)
+
+
+def _kr_progress_history_stmt(cycle_id: int, dialect_name: str):
+    return (
+        select(KRUpdate.kr_id, _epoch_seconds(KRUpdate.created_at, dialect_name), KRUpdate.progress)
+        .join(KeyResult, KRUpdate.kr_id == KeyResult.id)
+        .join(Objective, KeyResult.objective_id == Objective.id)
+        .where(Objective.cycle_id == cycle_id, KRUpdate.progress.is_not(None))
+        .order_by(KRUpdate.kr_id, KRUpdate.created_at, KRUpdate.id)
+    )
+
+
+def kr_progress_history(cycle_id: int) -> List[tuple[int, float, float]]:
+    """사이클 내 모든 KR의 (kr_id, created_at epoch 초, progress) 이력을 한 번의 쿼리로 읽는다 (kr_id, 시간순)."""
+    engine = get_engine()
+    with engine.connect() as conn:
+        return list(conn.execute(_kr_progress_history_stmt(cycle_id, engine.dialect.name)).tuples())
+
+
+def _latest_update_id():
+    """KeyResult 행과 상관된 '가장 최근 KRUpdate id' 스칼라 서브쿼리"""
+    newer = aliased(KRUpdate)
+    return (
+        select(newer.id)
+        .where(newer.kr_id == KeyResult.id)
+        .order_by(newer.created_at.desc(), newer.id.desc())
+        .limit(1)
+        .correlate(KeyResult)
+        .scalar_subquery()
+    )
+
+
+def _cycle_tree_stmts(cycle_id: int):
+    """load_cycle_tree의 4개 쿼리 (사이클, Objective, KR, KR별 최신 업데이트)"""
+    return (
+        select(OKRCycle.id, OKRCycle.company_id, OKRCycle.name, OKRCycle.start_date, OKRCycle.end_date)
+        .where(OKRCycle.id == cycle_id),
+        select(Objective.id, Objective.owner, Objective.text)
+        .where(Objective.cycle_id == cycle_id)
+        .order_by(Objective.id),
+        select(
+            KeyResult.id, KeyResult.objective_id, KeyResult.text, KeyResult.target,
+            KeyResult.unit, KeyResult.current, KeyResult.confidence,
+        )
+        .join(Objective, KeyResult.objective_id == Objective.id)
+        .where(Objective.cycle_id == cycle_id)
+        .order_by(KeyResult.id),
+        select(KRUpdate.id, KRUpdate.kr_id, KRUpdate.note, KRUpdate.progress, KRUpdate.created_at)
+        .where(KRUpdate.id.in_(
+            select(_latest_update_id())
+            .select_from(KeyResult)
+            .join(Objective, KeyResult.objective_id == Objective.id)
+            .where(Objective.cycle_id == cycle_id)
+        )),
+    )
+
+
+@_cached("cycle:{cycle_id}")
+def load_cycle_tree(cycle_id: int) -> Optional[CycleTree]:
+    """사이클·Objective·KR·KR별 최신 업데이트를 고정된 4개 쿼리로 읽어 불변 스냅샷으로 반환한다."""
+    cycle_stmt, objectives_stmt, krs_stmt, updates_stmt = _cycle_tree_stmts(cycle_id)
+    with get_session() as s:
+        cycle = s.execute(cycle_stmt).first()
+        if cycle is None:
+            return None
+        objectives = s.execute(objectives_stmt).all()
+        krs = s.execute(krs_stmt).all()
+        updates = s.execute(updates_stmt).all()
+    return _build_cycle_tree(cycle, objectives, krs, updates)
+
+
+def _build_cycle_tree(cycle, objectives, krs, updates) -> CycleTree:
+    latest = {row.kr_id: KRUpdateRow(*row) for row in updates}
+    krs_by_objective: Dict[int, List[KRNode]] = {}
+    for kr in krs:
+        krs_by_objective.setdefault(kr.objective_id, []).append(KRNode(
+            id=kr.id, text=kr.text, target=kr.target, unit=kr.unit,
+            current=kr.current, confidence=kr.confidence, latest_update=latest.get(kr.id),
+        ))
+    return CycleTree(
+        id=cycle.id,
+        company_id=cycle.company_id,
+        name=cycle.name,
+        start_date=cycle.start_date,
+        end_date=cycle.end_date,
+        objectives=tuple(
+            ObjectiveNode(id=o.id, owner=o.owner, text=o.text, krs=tuple(krs_by_objective.get(o.id, ())))
+            for o in objectives
+        ),
+    )
+
+# Full-text search (수행내역/KR 노트)
+
+def search_logs(
+    query: str,
+    cycle_id: int | None = None,
+    limit: int = 50,
+    start: date | None = None,
+    end: date | None = None,
+) -> List[LogSearchHit]:
+    """수행내역(DailyProgress.content)과 KR 노트(KRUpdate.note)를 검색해 최신순으로 반환한다.
+
+    공백으로 나눈 검색어를 모두 포함하는 기록만 찾는다. SQLite에서는 FTS5 trigram 색인을 쓰고,
+    그 외 DB나 3글자 미만 검색어는 LIKE로 찾는다.
+    """
+    init_db()
+    with get_session() as s:
+        return search_index.search(s, query, _fts_ready, cycle_id, start, end, limit)
+
+
+def rebuild_search_index() -> None:
+    """검색 색인을 원본 테이블 기준으로 다시 만든다 (트리거를 거치지 않고 DB를 고친 경우)."""
+    init_db()
+    if _fts_ready:
+        search_index.rebuild(get_engine())
+
+# Bulk writes (한 트랜잭션, executemany, refresh 없음)
+
+BULK_CHUNK_SIZE = 1000
+
+
+def _chunked(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    it = iter(rows)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _kr_row(objective_id: int, kr: str | Mapping[str, Any]) -> Dict[str, Any]:
+    if isinstance(kr, str):
+        return {"objective_id": objective_id, "text": kr, "target": None, "unit": None}
+    return {
+        "objective_id": objective_id,
+        "text": kr["text"],
+        "target": kr.get("target"),
+        "unit": kr.get("unit"),
+    }
+
+
+def _insert_krs(s: Session, objective_id: int, krs: Iterable[str | Mapping[str, Any]], chunk_size: int) -> List[int]:
+    ids: List[int] = []
+    stmt = insert(KeyResult).returning(KeyResult.id, sort_by_parameter_order=True)
+    for chunk in _chunked((_kr_row(objective_id, kr) for kr in krs), chunk_size):
+        ids.extend(s.scalars(stmt, chunk).all())
+    rollups.on_krs_added(s, objective_id, ids)
+    return ids
+
+
+def bulk_add_krs(
+    objective_id: int,
+    krs: Iterable[str | Mapping[str, Any]],
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> List[int]:
+    """KR 여러 개를 한 트랜잭션으로 추가하고 생성된 ID 목록을 반환한다.
+
+    각 항목은 KR 문구(str) 또는 text/target/unit 키를 가진 dict.
+    """
+    with get_session() as s:
+        ids = _insert_krs(s, objective_id, krs, chunk_size)
+        tags = [f"objective:{objective_id}", *(f"cycle:{c}" for c in _cycle_ids_for_objectives(s, [objective_id]))]
+        s.commit()
+    _read_cache.invalidate(*tags)
+    return ids
+
+
+def create_objective_with_krs(
+    cycle_id: int,
+    owner: str,
+    text: str,
+    krs: Iterable[str | Mapping[str, Any]],
+) -> tuple[int, List[int]]:
+    """Objective와 KR들을 한 트랜잭션으로 생성하고 (objective_id, kr_ids)를 반환한다."""
+    with get_session() as s:
+        objective_id, kr_ids = _create_objective_with_krs(s, cycle_id, owner, text, krs)
+        s.commit()
+    _read_cache.invalidate(f"cycle:{cycle_id}")
+    return objective_id, kr_ids
+
+
+def _create_objective_with_krs(
+    s: Session, cycle_id: int, owner: str, text: str, krs: Iterable[str | Mapping[str, Any]],
+) -> tuple[int, List[int]]:
+    objective_id = s.scalar(
+        insert(Objective).values(cycle_id=cycle_id, owner=owner, text=text).returning(Objective.id)
+    )
+    rollups.on_objective_created(s, objective_id, cycle_id)
+    s.flush()
+    return objective_id, _insert_krs(s, objective_id, krs, BULK_CHUNK_SIZE)
+
+
+def bulk_add_kr_updates(
+    updates: Iterable[Mapping[str, Any]],
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> int:
+    """KR 업데이트(kr_id, note, progress[, created_at]) 여러 건을 한 트랜잭션으로 추가하고 건수를 반환한다."""
+    with get_session() as s:
+        count, tags = _bulk_add_kr_updates(s, updates, chunk_size)
+        s.commit()
+    _read_cache.invalidate(*tags)
+    return count
+
+
+def _bulk_add_kr_updates(s: Session, updates: Iterable[Mapping[str, Any]], chunk_size: int) -> tuple[int, List[str]]:
+    """(추가 건수, 무효화할 캐시 태그)"""
+    count = 0
+    kr_ids: set[int] = set()
+    for chunk in _chunked(updates, chunk_size):
+        now = datetime.utcnow()
+        rows = [{"progress": None, **row, "created_at": row.get("created_at") or now} for row in chunk]
+        s.execute(insert(KRUpdate), rows)
+        rollups.on_kr_updates(s, ((r["kr_id"], r["progress"], r["created_at"]) for r in rows))
+        kr_ids.update(r["kr_id"] for r in rows)
+        count += len(rows)
+    return count, [*(f"kr:{k}" for k in kr_ids), *(f"cycle:{c}" for c in _cycle_ids_for_krs(s, kr_ids))]
+
+
+def bulk_add_daily_progress(
+    entries: Iterable[Mapping[str, Any]],
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> int:
+    """수행내역(objective_id, date, content[, ai_validation, ai_comment]) 여러 건을 한 트랜잭션으로 추가한다."""
+    with get_session() as s:
+        count = _bulk_add_daily_progress(s, entries, chunk_size)
+        s.commit()
+    _read_cache.invalidate("daily_progress")
+    return count
+
+
+def _bulk_add_daily_progress(s: Session, entries: Iterable[Mapping[str, Any]], chunk_size: int) -> int:
+    count = 0
+    for chunk in _chunked(entries, chunk_size):
+        now = datetime.utcnow()
+        s.execute(insert(DailyProgress), [
+            {
+                "ai_validation": None, "ai_comment": None, "draft_owner": None, **row,
+                "is_draft": bool(row.get("is_draft")), "created_at": row.get("created_at") or now,
+            }
+            for row in chunk
+        ])
+        count += len(chunk)
+    return count
+
+
+def bulk_add_cycles(rows: Iterable[Mapping[str, Any]], chunk_size: int = BULK_CHUNK_SIZE) -> int:
+    """사이클(company_id, name, start_date, end_date[, id]) 여러 건을 한 트랜잭션으로 추가한다."""
+    with get_session() as s:
+        count = _bulk_add_cycles(s, rows, chunk_size)
+        s.commit()
+    _read_cache.invalidate("cycles")
+    return count
+
+
+def _bulk_add_cycles(s: Session, rows: Iterable[Mapping[str, Any]], chunk_size: int) -> int:
+    count = 0
+    for chunk in _chunked(rows, chunk_size):
+        s.execute(insert(OKRCycle), chunk)
+        count += len(chunk)
+    return count
+
+
+def bulk_add_objectives(rows: Iterable[Mapping[str, Any]], chunk_size: int = BULK_CHUNK_SIZE) -> List[int]:
+    """Objective(cycle_id, owner, text[, id]) 여러 건을 한 트랜잭션으로 추가하고 ID 목록을 반환한다."""
+    with get_session() as s:
+        ids, tags = _bulk_add_objectives(s, rows, chunk_size)
+        s.commit()
+    _read_cache.invalidate(*tags)
+    return ids
+
+
+def _bulk_add_objectives(s: Session, rows: Iterable[Mapping[str, Any]], chunk_size: int) -> tuple[List[int], List[str]]:
+    """(생성된 ID 목록, 무효화할 캐시 태그)"""
+    ids: List[int] = []
+    cycle_ids: set[int] = set()
+    stmt = insert(Objective).returning(Objective.id, Objective.cycle_id, sort_by_parameter_order=True)
+    for chunk in _chunked(rows, chunk_size):
+        for objective_id, cycle_id in s.execute(stmt, chunk).all():
+            rollups.on_objective_created(s, objective_id, cycle_id)
+            ids.append(objective_id)
+            cycle_ids.add(cycle_id)
+        s.flush()
+    return ids, [f"cycle:{c}" for c in cycle_ids]
+
+
+def bulk_add_key_results(rows: Iterable[Mapping[str, Any]], chunk_size: int = BULK_CHUNK_SIZE) -> List[int]:
+    """여러 Objective의 KR(objective_id, text[, target, unit, current, confidence, id])을 한 트랜잭션으로 추가한다."""
+    with get_session() as s:
+        ids, tags = _bulk_add_key_results(s, rows, chunk_size)
+        s.commit()
+    _read_cache.invalidate(*tags)
+    return ids
+
+
+def _bulk_add_key_results(
+    s: Session, rows: Iterable[Mapping[str, Any]], chunk_size: int,
+) -> tuple[List[int], List[str]]:
+    """(생성된 ID 목록, 무효화할 캐시 태그)"""
+    ids: List[int] = []
+    objective_ids: set[int] = set()
+    stmt = insert(KeyResult).returning(KeyResult.id, KeyResult.objective_id, sort_by_parameter_order=True)
+    for chunk in _chunked(rows, chunk_size):
+        by_objective: Dict[int, List[int]] = {}
+        for kr_id, objective_id in s.execute(stmt, chunk).all():
+            by_objective.setdefault(objective_id, []).append(kr_id)
+            ids.append(kr_id)
+        for objective_id, kr_ids in by_objective.items():
+            rollups.on_krs_added(s, objective_id, kr_ids)
+        objective_ids.update(by_objective)
+        s.flush()
+    return ids, [
+        *(f"objective:{o}" for o in objective_ids),
+        *(f"cycle:{c}" for c in _cycle_ids_for_objectives(s, objective_ids)),
+    ]
+
+# Streaming export / import 검증
+
+_TABLES = {table.name: table for table in Base.metadata.sorted_tables}
+
+
+def table_columns(table: str) -> List[str]:
+    """테이블의 컬럼 이름 목록 (정의 순서)"""
+    return [c.name for c in _TABLES[table].columns]
+
+
+def column_python_types(table: str) -> Dict[str, type]:
+    """컬럼 이름 → 파이썬 타입 (int/float/str/date/datetime)"""
+    return {c.name: c.type.python_type for c in _TABLES[table].columns}
+
+
+def iter_table_rows(table: str, chunk_size: int = BULK_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """테이블 전체를 id 순으로 chunk_size행씩 dict 목록으로 흘려보낸다 (서버 측 커서, 메모리 일정)."""
+    t = _TABLES[table]
+    order = list(t.primary_key.columns)
+    with get_engine().connect() as conn:
+        result = conn.execution_options(yield_per=chunk_size).execute(select(t).order_by(*order))
+        for part in result.mappings().partitions():
+            yield [dict(row) for row in part]
+
+
+def existing_ids(table: str, ids: Iterable[int]) -> set[int]:
+    """ids 중 테이블에 실제로 있는 id (가져오기 시 참조 무결성 확인용)"""
+    t = _TABLES[table]
+    found: set[int] = set()
+    with get_session() as s:
+        for chunk in _chunked(set(ids), BULK_CHUNK_SIZE):
+            found.update(s.scalars(select(t.c.id).where(t.c.id.in_(chunk))))
+    return found
+
+# Daily progress / AI validation
+
+def list_unvalidated_daily_progress(
+    cycle_id: int | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    limit: int | None = None,
+) -> List[tuple[DailyProgress, Objective]]:
+    """AI 검증이 아직 없는 수행내역(초안 제외)을 Objective와 함께 조회한다 (사이클/기간 필터)."""
+    with get_session() as s:
+        return [(dp, obj) for dp, obj in s.execute(_unvalidated_stmt(cycle_id, start, end, limit)).all()]
+
+
+def _unvalidated_stmt(cycle_id: int | None, start: date | None, end: date | None, limit: int | None):
+    stmt = (
+        select(DailyProgress, Objective)
+        .join(Objective, DailyProgress.objective_id == Objective.id)
+        .where(DailyProgress.ai_validation.is_(None), DailyProgress.is_draft.is_(False))
+        .order_by(DailyProgress.date, DailyProgress.id)
+    )
+    if cycle_id is not None:
+        stmt = stmt.where(Objective.cycle_id == cycle_id)
+    if start is not None:
+        stmt = stmt.where(DailyProgress.date >= start)
+    if end is not None:
+        stmt = stmt.where(DailyProgress.date <= end)
+    return stmt.limit(limit) if limit is not None else stmt
+
+
+def kr_texts_by_objective(objective_ids: Iterable[int]) -> Dict[int, List[str]]:
+    """여러 Objective의 KR 문구를 한 번의 쿼리로 조회한다."""
+    ids = list(set(objective_ids))
+    result: Dict[int, List[str]] = {oid: [] for oid in ids}
+    if not ids:
+        return result
+    with get_session() as s:
+        for objective_id, kr_text in s.execute(_kr_texts_stmt(ids)):
+            result[objective_id].append(kr_text)
+    return result
+
+
+def _kr_texts_stmt(ids: List[int]):
+    return (
+        select(KeyResult.objective_id, KeyResult.text)
+        .where(KeyResult.objective_id.in_(ids))
+        .order_by(KeyResult.objective_id, KeyResult.id)
+    )
+
+
+def save_validations(results: Iterable[tuple[int, str, Optional[str]]]) -> int:
+    """(daily_progress_id, ai_validation, ai_comment) 목록을 한 트랜잭션으로 저장한다."""
+    rows = _validation_rows(results)
+    if not rows:
+        return 0
+    with get_session() as s:
+        s.execute(update(DailyProgress), rows)
+        s.commit()
+    _read_cache.invalidate("daily_progress")
+    return len(rows)
+
+
+def _validation_rows(results: Iterable[tuple[int, str, Optional[str]]]) -> List[Dict[str, Any]]:
+    return [
+        {"id": dp_id, "ai_validation": validation, "ai_comment": comment}
+        for dp_id, validation, comment in results
+    ]
@@ -0,0 +1,168 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from .models import CycleRollup, KeyResult, KRRollup, KRUpdate, Objective, ObjectiveRollup
+
+# show_okr_evaluation과 같은 기준 (%, 이상)
+STATUS_THRESHOLDS = (("green", 80.0), ("yellow", 50.0))
+
+
+def status_for(progress: float) -> str:
+    """진행률(%)을 green/yellow/red 상태 코드로 변환한다."""
+    for status, threshold in STATUS_THRESHOLDS:
+        if progress >= threshold:
+            return status
+    return "red"
+
+
+def _clamp(progress: float) -> float:
+    return max(0.0, min(100.0, float(progress)))
+
+
+def _set_progress(rollup, progress_sum: float, count: int) -> float:
+    """합계/개수로 진행률과 상태를 갱신하고 이전 대비 변화량을 반환한다."""
+    before = rollup.progress
+    rollup.progress_sum = progress_sum
+    rollup.progress = progress_sum / count if count else 0.0
+    rollup.status = status_for(rollup.progress)
+    return rollup.progress - before
+
+
+def _locked(stmt):
+    """롤업 행을 잠그고(SELECT ... FOR UPDATE) DB의 최신 값으로 다시 읽는 조회.
+
+    롤업은 읽은 값에 변화량을 더해 쓰므로, 여러 세션이 같은 행을 동시에 갱신할 때
+    (Postgres READ COMMITTED) 증분이 사라지지 않게 트랜잭션 끝까지 잠근다. SQLite는 쓰기가 이미 직렬화된다.
+    교착을 피하려고 항상 KR → Objective → 사이클 순, 각 단계는 ID 순으로 잠근다.
+    """
+    return stmt.with_for_update().execution_options(populate_existing=True)
+
+
+def _cycle_rollup(s: Session, cycle_id: int) -> CycleRollup:
+    rollup = s.scalars(_locked(select(CycleRollup).where(CycleRollup.cycle_id == cycle_id))).first()
+    if rollup is None:
+        rollup = CycleRollup(cycle_id=cycle_id, objective_count=0, progress_sum=0.0, progress=0.0, status="red")
+        s.add(rollup)
+    return rollup
+
+
+def _apply_objective_deltas(s: Session, deltas: Dict[int, Tuple[int, float]]) -> None:
+    """objective_id → (추가된 KR 수, 진행률 합 변화량)을 Objective/사이클 롤업에 반영한다."""
+    cycle_deltas: Dict[int, float] = {}
+    if not deltas:
+        return
+    # Objective마다 s.get(매번 autoflush) 대신 한 번의 조회로 가져온다
+    rollups = {
+        r.objective_id: r
+        for r in s.scalars(_locked(
+            select(ObjectiveRollup)
+            .where(ObjectiveRollup.objective_id.in_(deltas))
+            .order_by(ObjectiveRollup.objective_id)
+        ))
+    }
+    for objective_id, (added, progress_delta) in deltas.items():
+        rollup = rollups.get(objective_id)
+        if rollup is None:
+            continue
+        rollup.kr_count += added
+        change = _set_progress(rollup, rollup.progress_sum + progress_delta, rollup.kr_count)
+        cycle_deltas[rollup.cycle_id] = cycle_deltas.get(rollup.cycle_id, 0.0) + change
+    for cycle_id, change in sorted(cycle_deltas.items()):
+        cycle = _cycle_rollup(s, cycle_id)
+        _set_progress(cycle, cycle.progress_sum + change, cycle.objective_count)
+
+
+def on_objective_created(s: Session, objective_id: int, cycle_id: int) -> None:
+    """새 Objective의 롤업 행을 만들고 사이클 평균에 반영한다."""
+    s.add(ObjectiveRollup(
+        objective_id=objective_id, cycle_id=cycle_id, kr_count=0,
+        progress_sum=0.0, progress=0.0, status="red",
+    ))
+    cycle = _cycle_rollup(s, cycle_id)
+    cycle.objective_count += 1
+    _set_progress(cycle, cycle.progress_sum, cycle.objective_count)
+
+
+def on_krs_added(s: Session, objective_id: int, kr_ids: Iterable[int]) -> None:
+    """새 KR(진행률 0)을 Objective 평균에 반영한다."""
+    kr_ids = list(kr_ids)
+    if not kr_ids:
+        return
+    s.add_all(KRRollup(kr_id=kr_id, objective_id=objective_id, progress=0.0, update_count=0) for kr_id in kr_ids)
+    _apply_objective_deltas(s, {objective_id: (len(kr_ids), 0.0)})
+
+
+def on_kr_updates(s: Session, updates: Iterable[Tuple[int, Optional[float], datetime]]) -> None:
+    """(kr_id, progress, created_at) 목록을 KR→Objective→사이클 롤업에 증분 반영한다.
+
+    progress가 없는 업데이트는 횟수만 센다. 이미 반영된 것보다 오래된 업데이트는
+    진행률을 덮어쓰지 않는다(과거 이력 import 대비).
+    """
+    latest: Dict[int, Tuple[Optional[float], datetime, int]] = {}
+    for kr_id, progress, created_at in updates:
+        prev = latest.get(kr_id)
+        count = (prev[2] if prev else 0) + 1
+        if progress is None:
+            latest[kr_id] = (prev[0], prev[1], count) if prev else (None, created_at, count)
+        elif prev is None or prev[0] is None or created_at >= prev[1]:
+            latest[kr_id] = (progress, created_at, count)
+        else:
+            latest[kr_id] = (prev[0], prev[1], count)
+    if not latest:
+        return
+
+    rollups = {
+        r.kr_id: r
+        for r in s.scalars(_locked(select(KRRollup).where(KRRollup.kr_id.in_(latest)).order_by(KRRollup.kr_id)))
+    }
+    deltas: Dict[int, Tuple[int, float]] = {}
+    for kr_id, (progress, created_at, count) in latest.items():
+        rollup = rollups.get(kr_id)
+        if rollup is None:
+            continue
+        rollup.update_count += count
+        if progress is None or (rollup.last_update_at is not None and created_at < rollup.last_update_at):
+            continue
+        new_progress = _clamp(progress)
+        added, delta = deltas.get(rollup.objective_id, (0, 0.0))
+        deltas[rollup.objective_id] = (added, delta + new_progress - rollup.progress)
+        rollup.progress = new_progress
+        rollup.last_update_at = created_at
+    _apply_objective_deltas(s, deltas)
+
+
+def rebuild(s: Session) -> None:
+    """기존 데이터로 모든 롤업을 다시 계산한다 (최초 도입/복구용 전체 스캔)."""
+    s.execute(delete(KRRollup))
+    s.execute(delete(ObjectiveRollup))
+    s.execute(delete(CycleRollup))
+
+    for objective_id, cycle_id in s.execute(select(Objective.id, Objective.cycle_id)):
+        on_objective_created(s, objective_id, cycle_id)
+    s.flush()
+    krs_by_objective: Dict[int, list] = {}
+    for kr_id, objective_id in s.execute(select(KeyResult.id, KeyResult.objective_id)):
+        krs_by_objective.setdefault(objective_id, []).append(kr_id)
+    for objective_id, kr_ids in krs_by_objective.items():
+        on_krs_added(s, objective_id, kr_ids)
+    s.flush()
+
+    counts = dict(s.execute(select(KRUpdate.kr_id, func.count()).group_by(KRUpdate.kr_id)).all())
+    ranked = (
+        select(
+            KRUpdate.kr_id, KRUpdate.progress, KRUpdate.created_at,
+            func.row_number().over(
+                partition_by=KRUpdate.kr_id,
+                order_by=(KRUpdate.created_at.desc(), KRUpdate.id.desc()),
+            ).label("rn"),
+        )
+        .where(KRUpdate.progress.is_not(None))
+        .subquery()
+    )
+    latest = s.execute(select(ranked.c.kr_id, ranked.c.progress, ranked.c.created_at).where(ranked.c.rn == 1)).all()
+    on_kr_updates(s, latest)
+    for rollup in s.scalars(select(KRRollup)):
+        rollup.update_count = counts.get(rollup.kr_id, 0)
@@ -0,0 +1,201 @@
+from __future__ import annotations
+import logging
+import re
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Sequence
+
+from sqlalchemy import column, func, literal, literal_column, select, table, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from .models import DailyProgress, KeyResult, KRUpdate, Objective
+from .snapshots import LogSearchHit
+
+# 수행내역/KR 노트 전문 검색 (SQLite FTS5 trigram 토크나이저: 띄어쓰기와 무관하게 한국어 부분 일치)
+# 외부 콘텐츠 테이블이라 본문은 원본 테이블에만 저장되고, 트리거로 색인을 함께 갱신한다.
+FTS_SOURCES = {
+    "daily_progress_fts": ("daily_progress", "content"),
+    "kr_updates_fts": ("kr_updates", "note"),
+}
+MIN_TRIGRAM_CHARS = 3  # trigram 색인은 3글자 이상 검색어에만 쓸 수 있음
+SNIPPET_CHARS = 40
+# FTS5 모듈이나 trigram 토크나이저(3.34+)가 없는 SQLite의 오류 메시지
+UNSUPPORTED_MESSAGES = ("no such module: fts5", "no such tokenizer", "tokenize directive")
+
+logger = logging.getLogger(__name__)
+
+
+def _ddl(fts: str, source: str, body: str) -> List[str]:
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{body}, content='{source}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source} BEGIN "
+        f"INSERT INTO {fts}(rowid, {body}) VALUES (new.id, new.{body}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {body}) VALUES ('delete', old.id, old.{body}); END",
+        # AI 검증 저장(ai_validation 등) 때는 색인을 건드리지 않도록 본문 컬럼만 감시
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {body} ON {source} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {body}) VALUES ('delete', old.id, old.{body}); "
+        f"INSERT INTO {fts}(rowid, {body}) VALUES (new.id, new.{body}); END",
+    ]
+
+
+def _table_exists(conn: Connection, name: str) -> bool:
+    return conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": name}
+    ).first() is not None
+
+
+def ensure_schema(engine: Engine) -> bool:
+    """FTS 테이블/트리거를 만들고(처음이면 기존 데이터 색인) 사용 가능 여부를 반환한다.
+
+    SQLite가 아니거나 FTS5/trigram(3.34+)을 지원하지 않으면 False (LIKE 검색으로 대체).
+    그 밖의 오류(database is locked 등)는 그대로 올려 다음 init_db에서 다시 시도하게 한다.
+    """
+    if engine.dialect.name != "sqlite":
+        return False
+    try:
+        with engine.begin() as conn:
+            create_index(conn)
+    except OperationalError as e:
+        if not unsupported(e):
+            raise
+        return False
+    return True
+
+
+def unsupported(error: OperationalError) -> bool:
+    """FTS5/trigram을 지원하지 않는 SQLite의 오류면 경고를 남기고 True"""
+    message = str(error.orig).lower()
+    if not any(m in message for m in UNSUPPORTED_MESSAGES):
+        return False
+    logger.warning("SQLite FTS5 trigram 색인을 쓸 수 없어 LIKE 검색으로 대체합니다: %s", error.orig)
+    return True
+
+
+def create_index(conn: Connection) -> None:
+    """FTS 테이블/트리거를 만든다 (SQLite 전용, 지원하지 않으면 예외). 비동기 저장소는 run_sync로 호출한다."""
+    for fts, (source, body) in FTS_SOURCES.items():
+        created = not _table_exists(conn, fts)
+        for statement in _ddl(fts, source, body):
+            conn.execute(text(statement))
+        if created:
+            conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+def rebuild(engine: Engine) -> None:
+    """원본 테이블 기준으로 색인을 다시 만든다 (외부에서 DB를 직접 고친 경우)."""
+    with engine.begin() as conn:
+        rebuild_index(conn)
+
+
+def rebuild_index(conn: Connection) -> None:
+    for fts in FTS_SOURCES:
+        conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+def split_terms(query: str) -> List[str]:
+    """공백으로 나눈 검색어 (모두 포함해야 일치, 중복 제거)"""
+    return list(dict.fromkeys(t for t in query.split() if t))
+
+
+def _phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like_pattern(term: str) -> str:
+    return "%" + re.sub(r"([\\%_])", r"\\\1", term) + "%"
+
+
+def _excerpt(body: str, terms: Sequence[str]) -> str:
+    """첫 일치 위치 주변을 잘라 검색어를 **굵게** 표시한다 (LIKE 검색용 snippet)."""
+    lowered = body.lower()
+    positions = [p for p in (lowered.find(t.lower()) for t in terms) if p >= 0]
+    start = max(0, min(positions, default=0) - SNIPPET_CHARS // 2)
+    excerpt = body[start:start + SNIPPET_CHARS * 2]
+    for term in sorted(terms, key=len, reverse=True):
+        excerpt = re.sub(re.escape(term), lambda m: f"**{m.group(0)}**", excerpt, flags=re.IGNORECASE)
+    return ("…" if start > 0 else "") + excerpt + ("…" if start + SNIPPET_CHARS * 2 < len(body) else "")
+
+
+def _sources():
+    """(종류, 본문 컬럼, 날짜 컬럼, select 시작점) 목록"""
+    dp = (
+        "daily_progress", DailyProgress.content, DailyProgress.date,
+        select(
+            DailyProgress.id, Objective.cycle_id, DailyProgress.objective_id, literal(None).label("kr_id"),
+            DailyProgress.date.label("day"), DailyProgress.content.label("body"),
+        ).join(Objective, Objective.id == DailyProgress.objective_id).where(DailyProgress.is_draft.is_(False)),
+    )
+    kr = (
+        "kr_update", KRUpdate.note, KRUpdate.created_at,
+        select(
+            KRUpdate.id, Objective.cycle_id, KeyResult.objective_id, KRUpdate.kr_id,
+            KRUpdate.created_at.label("day"), KRUpdate.note.label("body"),
+        )
+        .join(KeyResult, KeyResult.id == KRUpdate.kr_id)
+        .join(Objective, Objective.id == KeyResult.objective_id),
+    )
+    return [dp, kr]
+
+
+def _filtered(stmt, body, day, cycle_id: Optional[int], start: Optional[date], end: Optional[date], terms):
+    if cycle_id is not None:
+        stmt = stmt.where(Objective.cycle_id == cycle_id)
+    if start is not None:
+        stmt = stmt.where(day >= start)
+    if end is not None:
+        # 날짜/일시 컬럼 모두 종료일 당일을 포함하도록 다음 날 미만으로 비교
+        stmt = stmt.where(day < end + timedelta(days=1))
+    for term in terms:
+        stmt = stmt.where(body.like(_like_pattern(term), escape="\\"))
+    return stmt
+
+
+def _hit(kind: str, row, terms: Sequence[str], snippet: Optional[str] = None) -> LogSearchHit:
+    day = row.day.date() if isinstance(row.day, datetime) else row.day
+    return LogSearchHit(
+        kind=kind, id=row.id, cycle_id=row.cycle_id, objective_id=row.objective_id, kr_id=row.kr_id,
+        day=day, snippet=snippet or _excerpt(row.body, terms),
+    )
+
+
+def search(
+    s: Session,
+    query: str,
+    use_fts: bool,
+    cycle_id: Optional[int] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    limit: int = 50,
+) -> List[LogSearchHit]:
+    """두 원본에서 날짜 최신순으로 limit건씩 찾아 합친다 (과거 날짜로 가져온 기록도 날짜 기준으로 정렬).
+
+    3글자 이상 검색어는 FTS 색인으로 찾고, 짧은 검색어는 그 결과 안에서 LIKE로 거른다.
+    색인을 쓸 수 없으면(짧은 검색어만 있거나 FTS 미지원) LIKE 스캔으로 대체한다.
+    """
+    terms = split_terms(query)
+    if not terms:
+        return []
+    indexed = [t for t in terms if len(t) >= MIN_TRIGRAM_CHARS] if use_fts else []
+    short = [t for t in terms if t not in indexed]
+    hits: List[LogSearchHit] = []
+    for (kind, body, day, stmt), fts in zip(_sources(), FTS_SOURCES):
+        base_id = stmt.selected_columns[0]
+        if indexed:
+            index = table(fts, column("rowid"))
+            snippet = func.snippet(literal_column(fts), 0, "**", "**", "…", 24).label("snippet")
+            q = _filtered(
+                stmt.add_columns(snippet)
+                .join(index, index.c.rowid == base_id)
+                .where(text(f"{fts} MATCH :match")),
+                body, day, cycle_id, start, end, short,
+            ).order_by(day.desc(), base_id.desc()).limit(limit)
+            match = " AND ".join(_phrase(t) for t in indexed)
+            hits.extend(_hit(kind, row, terms, row.snippet) for row in s.execute(q, {"match": match}).all())
+        else:
+            q = _filtered(stmt, body, day, cycle_id, start, end, terms).order_by(day.desc(), base_id.desc()).limit(limit)
+            hits.extend(_hit(kind, row, terms) for row in s.execute(q).all())
+    hits.sort(key=lambda h: (h.day, h.id), reverse=True)
+    return hits[:limit]
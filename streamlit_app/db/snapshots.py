@@ -0,0 +1,102 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional, Tuple
+
+
+# 읽기 전용 스냅샷: 세션과 무관한 불변 값 객체 (화면 렌더링용)
+
+@dataclass(frozen=True, slots=True)
+class CycleRow:
+    id: int
+    company_id: int
+    name: str
+    start_date: date
+    end_date: date
+
+
+@dataclass(frozen=True, slots=True)
+class ObjectiveRow:
+    id: int
+    cycle_id: int
+    owner: str
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class KeyResultRow:
+    id: int
+    objective_id: int
+    text: str
+    target: Optional[float]
+    unit: Optional[str]
+    current: Optional[float]
+    confidence: Optional[int]
+
+
+@dataclass(frozen=True, slots=True)
+class KRUpdateRow:
+    id: int
+    kr_id: int
+    note: str
+    progress: Optional[float]
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class KRNode:
+    id: int
+    text: str
+    target: Optional[float]
+    unit: Optional[str]
+    current: Optional[float]
+    confidence: Optional[int]
+    latest_update: Optional[KRUpdateRow]
+
+
+@dataclass(frozen=True, slots=True)
+class ObjectiveNode:
+    id: int
+    owner: str
+    text: str
+    krs: Tuple[KRNode, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class CycleTree:
+    """OKR 사이클 → Objective → KR → 최신 KR 업데이트 스냅샷"""
+    id: int
+    company_id: int
+    name: str
+    start_date: date
+    end_date: date
+    objectives: Tuple[ObjectiveNode, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ObjectiveProgressRow:
+    objective_id: int
+    cycle_id: int
+    kr_count: int
+    progress: float  # 0~100, KR 진행률 평균
+    status: str  # green / yellow / red
+
+
+@dataclass(frozen=True, slots=True)
+class CycleProgressRow:
+    cycle_id: int
+    objective_count: int
+    progress: float  # 0~100, Objective 진행률 평균
+    status: str
+
+
+@dataclass(frozen=True, slots=True)
+class LogSearchHit:
+    """수행내역/KR 노트 검색 결과 한 건"""
+    kind: str  # daily_progress / kr_update
+    id: int
+    cycle_id: int
+    objective_id: int
+    kr_id: Optional[int]
+    day: date
+    snippet: str  # 검색어를 **굵게** 표시한 발췌
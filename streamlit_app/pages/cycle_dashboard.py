@@ -0,0 +1,55 @@
+from __future__ import annotations
+import streamlit as st
+import sys
+import os
+
+# Streamlit Cloud에서 모듈 경로 문제 해결
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import metrics
+
+rerun = metrics.start_rerun("cycle_dashboard")
+
+from ui.components import inject_styles, page_header, cycle_dashboard, log_search_results
+
+# st.stop()으로 끝나도 rerun 측정값을 남기도록 모든 렌더링이 끝난 뒤 기록
+try:
+    # CSS 로드 (파일은 프로세스당 한 번만 읽음)
+    inject_styles()
+
+    page_header()
+
+    # 무거운 모듈(SQLAlchemy, numpy)은 헤더를 먼저 그린 뒤 불러옴
+    from services.kr_forecast import cycle_forecast
+    from services.okr_service import cycle_progress, list_cycles, read_cache_stats, search_logs
+
+    cycles = list_cycles()
+    if not cycles:
+        st.info("등록된 OKR 사이클이 없습니다.")
+        st.stop()
+
+    cycle = st.selectbox(
+        "OKR 사이클",
+        cycles,
+        format_func=lambda c: f"{c.name} ({c.start_date} ~ {c.end_date})",
+    )
+    with metrics.phase("cycle_progress"):
+        progress, objective_progress = cycle_progress(cycle.id)
+    with metrics.phase("forecast"):
+        forecasts = cycle_forecast(cycle.id)
+    with metrics.phase("render"):
+        cycle_dashboard(cycle.name, progress, objective_progress, forecasts)
+
+    # 수행내역/KR 노트 검색 (SQLite FTS5 색인)
+    st.subheader("🔎 기록 검색")
+    query = st.text_input("검색어", placeholder="예) 오픈채팅방 (공백으로 나누면 모두 포함)")
+    all_cycles = st.checkbox("모든 사이클에서 검색", value=False)
+    if query.strip():
+        with metrics.phase("search"):
+            hits = search_logs(query, cycle_id=None if all_cycles else cycle.id)
+        log_search_results(hits)
+
+    with st.sidebar.expander("조회 캐시 (디버그)"):
+        st.json(read_cache_stats())
+finally:
+    metrics.finish_rerun(rerun)
@@ -1,18 +1,30 @@
 from __future__ import annotations
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, Generator, List, Optional, Tuple
+import asyncio
 import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass, replace
 
-# OpenAI SDK (>=1.x)
-try:
-    from openai import OpenAI
-except Exception:  # 호환성 대비
-    OpenAI = None  # type: ignore
+# OpenAI SDK (>=1.x)는 import가 무거워(수백 ms) 첫 호출 때 불러온다 (_openai_class)
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
 
 import sys
-import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.settings import settings
+from services.metrics import LLMCallTimer
+from services.model_registry import ModelRegistry
+from services.near_duplicate import get_near_duplicate_index, scope_key
+from services.prompt_builder import build_user_content
+from services.rate_limit import TokenBucket, shared_limiter
+from services.resilience import hedging, is_transient_error, retry_delay, status_code
+from services.structured_feedback import (
+    STRUCTURED_SYSTEM_PROMPT, StructuredFeedback, parse_feedback, response_format, stored_fields,
+)
+from services.response_cache import get_response_cache, make_cache_key
 
 DEFAULT_MODEL = settings.openai_model
 
@@ -35,10 +47,74 @@ Return a concise, actionable review in Korean with the following sections:
 )
 
 
-def _client() -> Optional["OpenAI"]:
-    if OpenAI is None:
+# 프로세스 전체에서 공유하는 OpenAI 클라이언트 (HTTP 커넥션 풀 재사용)
+_clients: Dict[tuple, "OpenAI"] = {}
+_clients_lock = threading.Lock()
+# AsyncOpenAI의 HTTP 커넥션은 이벤트 루프에 묶이므로 루프별로 하나씩 (루프가 사라지면 함께 정리)
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# model_not_found/403 이 난 모델을 일정 시간 건너뛰기 위한 레지스트리 (클라이언트 키별)
+model_registry = ModelRegistry(settings.openai_model_unavailable_ttl_seconds)
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    """검증 결과. ok=False이면 text는 오류 안내문이다."""
+    text: str
+    ok: bool
+    model: Optional[str] = None  # fallback 후 실제로 응답한 모델
+    cached: bool = False
+    tokens_saved: int = 0  # 중복 제거/토큰 예산으로 줄인 입력 토큰 수
+    similarity: Optional[float] = None  # 비슷한 이전 수행내역의 결과를 재사용했을 때 그 유사도
+    feedback: Optional[StructuredFeedback] = None  # 구조화 출력 모드에서 파싱한 결과
+
+    def stored(self) -> tuple[str, Optional[str]]:
+        """DailyProgress에 저장할 (ai_validation, ai_comment). 구조화 결과는 JSON과 한 줄 요약으로 저장한다."""
+        if self.feedback is not None:
+            return stored_fields(self.feedback)
+        return self.text, None
+
+
+def _reused_feedback(response: str, similarity: float) -> str:
+    """재사용한 이전 검증 결과 앞에 안내 문구를 붙인다."""
+    return (
+        f"> ♻️ 거의 같은 이전 수행내역(유사도 {similarity:.0%})의 검증 결과를 재사용했습니다. "
+        f"내용이 달라졌다면 수행내역을 보완해 다시 요청하세요.\n\n{response}"
+    )
+
+
+_INVALID_STRUCTURED_FEEDBACK = "⚠️ AI 응답을 구조화된 형식으로 읽지 못했습니다. 잠시 후 다시 시도해주세요."
+
+
+def _result(content: str, structured: bool, **fields) -> ValidationResult:
+    """모델(또는 캐시) 응답으로 결과를 만든다. 구조화 모드면 JSON을 검증해 Markdown으로 표시한다."""
+    if not structured:
+        return ValidationResult(text=content, ok=True, **fields)
+    feedback = parse_feedback(content)
+    if feedback is None:
+        # max_tokens에서 잘렸거나 스키마와 다른 응답
+        return ValidationResult(text=_INVALID_STRUCTURED_FEEDBACK, ok=False, model=fields.get("model"))
+    return ValidationResult(text=feedback.to_markdown(), ok=True, feedback=feedback, **fields)
+
+
+def progress_review_prompt(progress_content: str) -> str:
+    """수행내역 검증용 추가 요청 프롬프트"""
+    return f"다음 수행내역이 OKR 목표 달성에 기여하는지 평가해주세요: {progress_content}"
+
+
+def _openai_class(name: str = "OpenAI"):
+    """OpenAI(또는 AsyncOpenAI) 클라이언트 클래스. SDK가 없으면 None (한 번 import하면 sys.modules에 남음)"""
+    try:
+        import openai
+    except Exception:  # 호환성 대비
         return None
-    
+    return getattr(openai, name, None)
+
+
+def _client_key() -> Optional[tuple]:
+    """(API 키, base_url). 키가 없거나 형식이 틀리면 None"""
     api_key = settings.openai_api_key
     if not api_key:
         return None
@@ -46,77 +122,142 @@ def _client() -> Optional["OpenAI"]:
     # API 키 형식 검증
     if not api_key.startswith("sk-"):
         return None
-        
-    try:
-        return OpenAI(api_key=api_key)
-    except Exception:
-        return None
+    return api_key, settings.openai_base_url or None
 
 
-def validate_okr(
-    objective: str,
-    key_results: List[str],
-    progress_notes: str,
-    user_prompt: str = "",
-    model: Optional[str] = None,
-    temperature: float = 0.2,
-) -> str:
-    """# === SYSTEM PROMPT (Daily OKR Gap-Finder, No Scoring) ===
-당신은 기업용 OKR 데일리 로그의 **결함 탐지·구체화 코치**입니다. 
-오직 사용자가 입력한 내용만을 근거로, 무엇이 **부족/누락/모호**한지 지적하고
-다시 쓸 수 있도록 **구체적 가이드와 예시 문장**을 제공합니다. 
-절대 평가점수·등급을 매기지 않습니다.
+def _client() -> Optional["OpenAI"]:
+    key = _client_key()
+    if key is None:
+        return None
+    api_key, base_url = key
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            OpenAI = _openai_class()
+            if OpenAI is None:
+                return None
+            try:
+                # 클라이언트 내부 HTTP 커넥션 풀이 재사용됨 (재시도는 SDK가 아니라 _handle_error에서 처리)
+                client = OpenAI(
+                    api_key=api_key, base_url=base_url, timeout=settings.openai_timeout_seconds, max_retries=0,
+                )
+            except Exception:
+                return None
+            _clients[key] = client
+        return client
 
-## 검토 범위 (하루 1개의 KR 로그에 한함)
-필드: KR, 오늘 한 일(Action), 수치 변화(Metrics: Baseline→Today / Target + 단위, 증거 링크),
-배운 점(Insight), 내일 할 일(Next 24–48h), Blocker, 상태(G/Y/R), Confidence(%), 시간(hrs),
-협업자, 실험/이슈 ID
 
-## 확인·지적 원칙
-- **단일 KR 원칙**: 한 로그에 다수 KR이 섞이면 분리 제안.
-- **Outcome 중심**: 산출물 나열이 아니라 지표 변화·영향이 드러나는지 확인.
-- **수치 명확성**: Baseline/Today/Target, **단위**, **근거 URL**이 있는지.
-- **인과성 언어**: "~인 듯", "영향 준 것 같다"처럼 모호하면 **검증 필요**로 표시.
-- **다음 액션**: 24–48시간 내 수행 가능한 **행동 단위**로 다시 쓰게 지도.
-- **일관성**: 상태/Confidence와 서술 내용이 충돌하면 정렬 방안 제시.
-- **사실 충실**: 추정·창작 금지. 증거 링크가 없으면 "추가 필요"만 지시.
+def _async_client() -> Optional["AsyncOpenAI"]:
+    """현재 이벤트 루프용 AsyncOpenAI 클라이언트 (루프 안에서 호출)"""
+    key = _client_key()
+    if key is None:
+        return None
+    api_key, base_url = key
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            AsyncOpenAI = _openai_class("AsyncOpenAI")
+            if AsyncOpenAI is None:
+                return None
+            try:
+                client = AsyncOpenAI(
+                    api_key=api_key, base_url=base_url, timeout=settings.openai_timeout_seconds, max_retries=0,
+                )
+            except Exception:
+                return None
+            clients[key] = client
+        return client
 
-## 출력 형식 (섹션 제목 고정, 점수/등급 금지)
-1) 부족/누락 항목
-   - 각 항목에 대해: **무엇이 부족한지 → 왜 중요한지 → 어떻게 보완할지(한 문장 지시)**
 
-2) 모호·비구체 항목과 개선안
-   - 각 필드별로 `원문 → 더 구체적인 예시` 형식 (가능하면 수치/단위/대상/범위 포함)
+def _candidate_models(model: str) -> List[str]:
+    """지정 모델 + GPT-5 계열 fallback 목록 (중복 제거, 순서 유지)"""
+    return list(dict.fromkeys([
+        model,            # 사용자가 지정한 모델
+        "gpt-5-nano",     # 가장 저렴하고 빠른 모델
+        "gpt-5-mini",     # 중간 성능 모델
+        "gpt-5",          # 최고 성능 모델
+    ]))
 
-3) 다시 작성 가이드 (사용자에게 직접 지시)
-   - 불릿 3–6개: **필수 기재 요소**(KR 1개, Baseline/Today/Target+단위, 증거 URL, 다음 액션을 행동 단위로 등)
-   - "이렇게 쓰면 좋다" 형식의 간단 규칙
 
-4) 다시 작성 템플릿 (복붙용, Markdown)
-   - KR / 오늘 한 일 / 수치(B→T/Target + 단위) / 증거 링크 / 배운 점 / 내일 할 일(24–48h) /
-     Blocker / 상태 / Confidence / 시간 / 협업자 / 실험ID
+_MODEL_ACCESS_ERROR_CODES = frozenset({"model_not_found"})
 
-5) 확인 질문(필요 시, 최대 5개)
-   - 모호 지점만 겨냥한 **예/아니오 또는 짧은 수치로 답할 질문**
 
-## 금지 사항
-- 점수/등급/평가어(예: 우수/부족/점수)를 사용 금지.
-- 사용자가 쓰지 않은 데이터·링크를 상상해서 추가 금지.
-- JSON을 출력할 경우 **한 개**만, 섹션 6에서만.
-(끝)"""
-    model = model or DEFAULT_MODEL
-    
-    # 모델 접근 가능성 확인을 위한 fallback 모델 리스트 (GPT-5 계열만)
-    fallback_models = [
-        model,  # 사용자가 지정한 모델
-        "gpt-5-nano",     # 가장 저렴하고 빠른 모델
-        "gpt-5-mini",     # 중간 성능 모델
-        "gpt-5",          # 최고 성능 모델
-    ]
-    
-    client = _client()
-    if client is None:
-        return """
+def _is_model_access_error(error: Exception) -> bool:
+    """모델 접근 권한 오류 여부. 오류 코드(model_not_found)나 403/404 + 모델 접근 거부 메시지일 때만 True
+
+    인증·지역 제한·프록시의 403까지 모델 탓으로 돌리면 모든 모델이 한꺼번에 막히므로 구분한다.
+    """
+    if getattr(error, "code", None) in _MODEL_ACCESS_ERROR_CODES:
+        return True
+    return status_code(error) in (403, 404) and "does not have access to model" in str(error)
+
+
+def _note_access_error(model: str, error: BaseException) -> bool:
+    """접근 권한 오류면 모델을 접근 불가로 기록하고 True (헤지 요청의 오류에도 사용)"""
+    if not _is_model_access_error(error):
+        return False
+    model_registry.mark_unavailable(model, _client_key())
+    return True
+
+
+def _next_action(error: Exception, model: str, attempt: int, limiter: Optional[TokenBucket]) -> Tuple[str, float]:
+    """실패한 요청 다음에 할 일과 대기 시간: "retry"(대기 후 같은 모델), "next"(다음 모델), "stop"(중단)"""
+    if _note_access_error(model, error):
+        return "next", 0.0
+    if not is_transient_error(error):
+        # 요청 자체의 오류(400 등)는 다른 모델로 보내도 같으므로 중단
+        return "stop", 0.0
+    delay = retry_delay(error, attempt, limiter)
+    if delay is None:
+        return "next", 0.0  # 재시도를 다 쓴 일시 오류는 다음 모델로
+    return "retry", delay
+
+
+def _handle_error(error: Exception, model: str, attempt: int, limiter: Optional[TokenBucket]) -> str:
+    """_next_action을 정하고 재시도면 그만큼 기다린다 (429는 공용 리미터가 기다리므로 0)."""
+    action, delay = _next_action(error, model, attempt, limiter)
+    if action == "retry" and delay > 0:
+        time.sleep(delay)
+    return action
+
+
+def _completion_kwargs(
+    model: str, user_content: str, temperature: float, stream: bool = False, structured: bool = False,
+) -> dict:
+    """Chat Completions 요청 인자를 구성한다."""
+    kwargs: dict = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": STRUCTURED_SYSTEM_PROMPT if structured else SYSTEM_PROMPT},
+            {"role": "user", "content": user_content},
+        ],
+    }
+    # gpt-5 모델은 temperature 파라미터를 지원하지 않으므로 조건부로 처리
+    if not model.startswith("gpt-5"):
+        kwargs["temperature"] = temperature
+    if structured:
+        # 짧은 JSON 스키마 + 출력 토큰 상한 (출력 토큰이 지연시간 대부분을 차지)
+        kwargs["response_format"] = response_format()
+        kwargs["max_completion_tokens"] = settings.ai_structured_max_tokens
+        if model.startswith("gpt-5"):
+            # 추론 토큰도 상한에 포함되므로 최소로
+            kwargs["reasoning_effort"] = "minimal"
+    # 요청 1회 제한 시간 (스트리밍은 청크 사이 대기 시간에 적용)
+    kwargs["timeout"] = settings.openai_call_timeout_seconds
+    if stream:
+        kwargs["stream"] = True
+        # 마지막 청크에 토큰 사용량을 포함시켜 계측에 사용
+        kwargs["stream_options"] = {"include_usage": True}
+    return kwargs
+
+
+_CONFIG_ERROR_FEEDBACK = """
 ## ⚠️ OpenAI 설정 오류
 
 OpenAI SDK가 설치되지 않았거나 API 키가 설정되지 않았습니다.
@@ -151,51 +292,9 @@ OpenAI SDK가 설치되지 않았거나 API 키가 설정되지 않았습니다.
 - 피드백 수집의 어려움
         """
 
-    user_content = (
-        "# Objective\n" + objective.strip() + "\n\n" +
-        "# Key Results\n- " + "\n- ".join(kr.strip() for kr in key_results if kr.strip()) + "\n\n" +
-        "# Progress Notes (최근 수행내역)\n" + progress_notes.strip() + "\n\n" +
-        (f"# 추가 요구사항\n{user_prompt.strip()}\n" if user_prompt.strip() else "")
-    )
 
-    # 모델별 fallback 시도
-    for current_model in fallback_models:
-        try:
-            # gpt-5 모델은 temperature 파라미터를 지원하지 않으므로 조건부로 처리
-            use_temperature = not current_model.startswith("gpt-5")
-            
-            # Chat Completions API 사용 (가장 안정적)
-            if use_temperature:
-                resp = client.chat.completions.create(
-                    model=current_model,
-                    messages=[
-                        {"role": "system", "content": SYSTEM_PROMPT},
-                        {"role": "user", "content": user_content},
-                    ],
-                    temperature=temperature,
-                )
-            else:
-                resp = client.chat.completions.create(
-                    model=current_model,
-                    messages=[
-                        {"role": "system", "content": SYSTEM_PROMPT},
-                        {"role": "user", "content": user_content},
-                    ],
-                )
-            
-            # 성공하면 결과 반환
-            return resp.choices[0].message.content or ""
-            
-        except Exception as e:
-            error_msg = str(e)
-            # 모델 접근 권한 오류인 경우 다음 모델 시도
-            if "model_not_found" in error_msg or "does not have access" in error_msg or "403" in error_msg:
-                continue  # 다음 모델 시도
-            else:
-                # 다른 종류의 오류는 즉시 처리
-                break
-    
-    # 모든 모델이 실패한 경우 - 최종 에러 처리
+def _all_models_failed_feedback(fallback_models: List[str]) -> str:
+    """모든 모델 호출이 실패했을 때 보여줄 안내문"""
     return f"""
 ## ⚠️ 모든 OpenAI 모델에 접근할 수 없습니다
 
@@ -235,4 +334,313 @@ OpenAI SDK가 설치되지 않았거나 API 키가 설정되지 않았습니다.
 - 학생들의 관심도가 낮을 수 있음
 - 배포 채널의 접근성 제한 가능성
 - 피드백 수집의 어려움
-    """
\ No newline at end of file
+    """
+
+
+def validate_okr(
+    objective: str,
+    key_results: List[str],
+    progress_notes: str,
+    user_prompt: str = "",
+    model: Optional[str] = None,
+    temperature: float = 0.2,
+) -> str:
+    """# === SYSTEM PROMPT (Daily OKR Gap-Finder, No Scoring) ===
+당신은 기업용 OKR 데일리 로그의 **결함 탐지·구체화 코치**입니다. 
+오직 사용자가 입력한 내용만을 근거로, 무엇이 **부족/누락/모호**한지 지적하고
+다시 쓸 수 있도록 **구체적 가이드와 예시 문장**을 제공합니다. 
+절대 평가점수·등급을 매기지 않습니다.
+
+## 검토 범위 (하루 1개의 KR 로그에 한함)
+필드: KR, 오늘 한 일(Action), 수치 변화(Metrics: Baseline→Today / Target + 단위, 증거 링크),
+배운 점(Insight), 내일 할 일(Next 24–48h), Blocker, 상태(G/Y/R), Confidence(%), 시간(hrs),
+협업자, 실험/이슈 ID
+
+## 확인·지적 원칙
+- **단일 KR 원칙**: 한 로그에 다수 KR이 섞이면 분리 제안.
+- **Outcome 중심**: 산출물 나열이 아니라 지표 변화·영향이 드러나는지 확인.
+- **수치 명확성**: Baseline/Today/Target, **단위**, **근거 URL**이 있는지.
+- **인과성 언어**: "~인 듯", "영향 준 것 같다"처럼 모호하면 **검증 필요**로 표시.
+- **다음 액션**: 24–48시간 내 수행 가능한 **행동 단위**로 다시 쓰게 지도.
+- **일관성**: 상태/Confidence와 서술 내용이 충돌하면 정렬 방안 제시.
+- **사실 충실**: 추정·창작 금지. 증거 링크가 없으면 "추가 필요"만 지시.
+
+## 출력 형식 (섹션 제목 고정, 점수/등급 금지)
+1) 부족/누락 항목
+   - 각 항목에 대해: **무엇이 부족한지 → 왜 중요한지 → 어떻게 보완할지(한 문장 지시)**
+
+2) 모호·비구체 항목과 개선안
+   - 각 필드별로 `원문 → 더 구체적인 예시` 형식 (가능하면 수치/단위/대상/범위 포함)
+
+3) 다시 작성 가이드 (사용자에게 직접 지시)
+   - 불릿 3–6개: **필수 기재 요소**(KR 1개, Baseline/Today/Target+단위, 증거 URL, 다음 액션을 행동 단위로 등)
+   - "이렇게 쓰면 좋다" 형식의 간단 규칙
+
+4) 다시 작성 템플릿 (복붙용, Markdown)
+   - KR / 오늘 한 일 / 수치(B→T/Target + 단위) / 증거 링크 / 배운 점 / 내일 할 일(24–48h) /
+     Blocker / 상태 / Confidence / 시간 / 협업자 / 실험ID
+
+5) 확인 질문(필요 시, 최대 5개)
+   - 모호 지점만 겨냥한 **예/아니오 또는 짧은 수치로 답할 질문**
+
+## 금지 사항
+- 점수/등급/평가어(예: 우수/부족/점수)를 사용 금지.
+- 사용자가 쓰지 않은 데이터·링크를 상상해서 추가 금지.
+- JSON을 출력할 경우 **한 개**만, 섹션 6에서만.
+(끝)"""
+    return run_validation(objective, key_results, progress_notes, user_prompt, model, temperature).text
+
+
+class _Request:
+    """run_validation / run_validation_async / validate_okr_stream이 함께 쓰는 요청 준비·캐시 조회·성공 처리"""
+
+    def __init__(
+        self,
+        objective: str,
+        key_results: List[str],
+        progress_notes: str,
+        user_prompt: str,
+        model: Optional[str],
+        temperature: float,
+        structured: Optional[bool],
+        stream: bool = False,
+    ) -> None:
+        self.model = model or DEFAULT_MODEL
+        self.structured = settings.ai_structured_output if structured is None else structured
+        self.temperature = temperature
+        self.progress_notes = progress_notes
+        self.prompt = build_user_content(objective, key_results, progress_notes, user_prompt, model=self.model)
+        self.timer = LLMCallTimer(self.model, stream=stream)
+        self.timer.call.prompt_tokens_saved = self.prompt.tokens_saved
+        self.cache = get_response_cache()
+        system_prompt = STRUCTURED_SYSTEM_PROMPT if self.structured else SYSTEM_PROMPT
+        self.cache_key = make_cache_key(self.model, system_prompt, self.prompt.user_content, temperature)
+        self.near_index = get_near_duplicate_index()
+        self.scope = scope_key(
+            self.model, objective, key_results, progress_notes, user_prompt, temperature, self.structured,
+        )
+
+    def reuse(self) -> Optional[ValidationResult]:
+        """캐시나 비슷한 이전 수행내역의 결과가 있으면 반환한다 (네트워크 호출 없음)."""
+        tokens_saved = self.prompt.tokens_saved
+        if self.timer.call.stream:
+            # 스트리밍은 재사용한 결과 전체가 첫 조각
+            self.timer.first_token()
+        # 동일한 요청은 캐시에서 바로 반환
+        if self.cache is not None:
+            cached = self.cache.get(self.cache_key)
+            if cached is not None:
+                self.timer.finish(ok=True, cached=True)
+                return _result(cached, self.structured, cached=True, tokens_saved=tokens_saved)
+
+        # 띄어쓰기·문장부호·숫자만 다른 수행내역은 이전 결과를 재사용
+        if self.near_index is not None:
+            match = self.near_index.lookup(self.scope, self.progress_notes)
+            if match is not None:
+                self.timer.finish(ok=True, cached=True, near_duplicate=True)
+                reused = _result(
+                    match.response, self.structured, cached=True, tokens_saved=tokens_saved,
+                    similarity=match.similarity,
+                )
+                return replace(reused, text=_reused_feedback(reused.text, match.similarity))
+        return None
+
+    def completion_kwargs(self, model: str, stream: bool = False) -> dict:
+        return _completion_kwargs(
+            model, self.prompt.user_content, self.temperature, stream=stream, structured=self.structured,
+        )
+
+    def succeed(self, resp, used_model: str) -> ValidationResult:
+        """응답을 결과로 만들고 캐시에 저장한다."""
+        self.timer.usage(getattr(resp, "usage", None))
+        return self.complete(resp.choices[0].message.content or "", used_model)
+
+    def complete(self, content: str, used_model: str) -> ValidationResult:
+        """모델 응답 본문으로 결과를 만들고 캐시·유사 수행내역 색인에 저장한다 (빈 응답, 형식이 틀린 구조화 응답 제외)."""
+        model_registry.mark_available(used_model, _client_key())
+        result = _result(content, self.structured, model=used_model, tokens_saved=self.prompt.tokens_saved)
+        if result.ok and content:
+            if self.cache is not None:
+                self.cache.set(self.cache_key, content)
+            if self.near_index is not None:
+                self.near_index.add(self.scope, self.progress_notes, content)
+        self.timer.finish(ok=result.ok, model=used_model)
+        return result
+
+    def fail(self, text: str, model: Optional[str] = None) -> ValidationResult:
+        self.timer.finish(ok=False, model=model)
+        return ValidationResult(text=text, ok=False, model=model)
+
+
+def run_validation(
+    objective: str,
+    key_results: List[str],
+    progress_notes: str,
+    user_prompt: str = "",
+    model: Optional[str] = None,
+    temperature: float = 0.2,
+    structured: Optional[bool] = None,
+) -> ValidationResult:
+    """validate_okr과 같은 검증을 수행하고 성공 여부·사용 모델을 함께 반환한다.
+
+    structured=True(기본: AI_STRUCTURED_OUTPUT)면 짧은 JSON으로 받아 result.feedback에 파싱해 둔다.
+    """
+    request = _Request(objective, key_results, progress_notes, user_prompt, model, temperature, structured)
+    reused = request.reuse()
+    if reused is not None:
+        return reused
+    
+    # 모델 접근 가능성 확인을 위한 fallback 모델 리스트 (GPT-5 계열만)
+    fallback_models = _candidate_models(request.model)
+    
+    client = _client()
+    if client is None:
+        return request.fail(_CONFIG_ERROR_FEEDBACK)
+
+    # 모델별 fallback 시도 (접근 불가로 기록된 모델은 요청 없이 건너뜀)
+    # 일시 오류는 백오프 후 같은 모델로 재시도하고, 느린 요청은 다음 모델로 헤지할 수 있다.
+    limiter = shared_limiter()
+    candidates = model_registry.filter_available(fallback_models, _client_key())
+    for index, current_model in enumerate(candidates):
+        if index > 0 and not model_registry.is_available(current_model, _client_key()):
+            continue  # 앞선 헤지 요청에서 접근 불가로 확인된 모델
+        hedge_model = candidates[index + 1] if index + 1 < len(candidates) else None
+        action = "next"
+        for attempt in range(settings.openai_max_retries + 1):
+            if limiter is not None:
+                limiter.acquire()
+            request.timer.call.attempts += 1
+            try:
+                # Chat Completions API 사용 (가장 안정적)
+                resp, used_model = hedging.call(
+                    lambda m: client.chat.completions.create(**request.completion_kwargs(m)),
+                    current_model, hedge_model, limiter, on_hedge_error=_note_access_error,
+                )
+                return request.succeed(resp, used_model)
+
+            except Exception as e:
+                action = _handle_error(e, current_model, attempt, limiter)
+                if action != "retry":
+                    break
+        if action == "stop":
+            break
+    
+    # 모든 모델이 실패한 경우 - 최종 에러 처리
+    return request.fail(_all_models_failed_feedback(fallback_models))
+
+
+async def run_validation_async(
+    objective: str,
+    key_results: List[str],
+    progress_notes: str,
+    user_prompt: str = "",
+    model: Optional[str] = None,
+    temperature: float = 0.2,
+    structured: Optional[bool] = None,
+) -> ValidationResult:
+    """run_validation의 비동기 버전 (AsyncOpenAI). 한 이벤트 루프에서 DB 조회·저장과 함께 돌릴 때 쓴다.
+
+    캐시, fallback 모델 순서, 재시도/백오프, 공용 리미터는 run_validation과 같다.
+    헤지는 하지 않는다 (여러 요청을 동시에 띄워 두는 호출자가 이미 느린 요청을 가려 줌).
+    응답 캐시·유사 수행내역 색인은 SQLite 파일을 동기로 읽고 쓰므로 이벤트 루프를 막지 않게 스레드에서 처리한다.
+    """
+    request = _Request(objective, key_results, progress_notes, user_prompt, model, temperature, structured)
+    reused = await asyncio.to_thread(request.reuse)
+    if reused is not None:
+        return reused
+
+    fallback_models = _candidate_models(request.model)
+    client = _async_client()
+    if client is None:
+        return request.fail(_CONFIG_ERROR_FEEDBACK)
+
+    limiter = shared_limiter()
+    for current_model in model_registry.filter_available(fallback_models, _client_key()):
+        action = "next"
+        for attempt in range(settings.openai_max_retries + 1):
+            if limiter is not None:
+                await limiter.acquire_async()
+            request.timer.call.attempts += 1
+            try:
+                resp = await client.chat.completions.create(**request.completion_kwargs(current_model))
+                return await asyncio.to_thread(request.succeed, resp, current_model)
+            except Exception as e:
+                action, delay = _next_action(e, current_model, attempt, limiter)
+                if action != "retry":
+                    break
+                await asyncio.sleep(delay)
+        if action == "stop":
+            break
+
+    return request.fail(_all_models_failed_feedback(fallback_models))
+
+
+def validate_okr_stream(
+    objective: str,
+    key_results: List[str],
+    progress_notes: str,
+    user_prompt: str = "",
+    model: Optional[str] = None,
+    temperature: float = 0.2,
+    structured: Optional[bool] = None,
+) -> Generator[str, None, ValidationResult]:
+    """validate_okr의 스트리밍 버전. 응답 텍스트 조각을 도착하는 대로 yield 한다.
+
+    fallback 모델 순서, 캐시(유사 수행내역 재사용 포함), 최종 텍스트는 validate_okr과 동일하다.
+    제너레이터의 반환값(StopIteration.value)은 run_validation과 같은 ValidationResult이다.
+    """
+    if settings.ai_structured_output if structured is None else structured:
+        # JSON 조각은 그대로 보여줄 수 없으므로 한 번에 받아 Markdown으로 내보낸다 (응답이 짧아 지연이 작음)
+        result = run_validation(objective, key_results, progress_notes, user_prompt, model, temperature, True)
+        yield result.text
+        return result
+    request = _Request(objective, key_results, progress_notes, user_prompt, model, temperature, False, stream=True)
+    reused = request.reuse()
+    if reused is not None:
+        yield reused.text
+        return reused
+
+    fallback_models = _candidate_models(request.model)
+
+    client = _client()
+    if client is None:
+        result = request.fail(_CONFIG_ERROR_FEEDBACK)
+        yield result.text
+        return result
+
+    # 스트리밍은 헤지하지 않고, 첫 조각을 받기 전의 일시 오류만 재시도한다
+    limiter = shared_limiter()
+    for current_model in model_registry.filter_available(fallback_models, _client_key()):
+        action = "next"
+        for attempt in range(settings.openai_max_retries + 1):
+            if limiter is not None:
+                limiter.acquire()
+            chunks: List[str] = []
+            request.timer.call.attempts += 1
+            try:
+                stream = client.chat.completions.create(**request.completion_kwargs(current_model, stream=True))
+                for event in stream:
+                    if getattr(event, "usage", None) is not None:
+                        request.timer.usage(event.usage)
+                    if not event.choices:
+                        continue
+                    delta = event.choices[0].delta.content
+                    if delta:
+                        request.timer.first_token()
+                        chunks.append(delta)
+                        yield delta
+                return request.complete("".join(chunks), current_model)
+
+            except Exception as e:
+                # 이미 일부를 내보낸 뒤의 오류는 다른 모델로 이어 쓸 수 없으므로 중단
+                if chunks:
+                    return request.fail("".join(chunks), model=current_model)
+                action = _handle_error(e, current_model, attempt, limiter)
+                if action != "retry":
+                    break
+        if action == "stop":
+            break
+
+    result = request.fail(_all_models_failed_feedback(fallback_models))
+    yield result.text
+    return result
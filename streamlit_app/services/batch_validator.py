@@ -0,0 +1,255 @@
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from typing import List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from db import repository
+from services.ai_validator import ValidationResult, progress_review_prompt, run_validation, run_validation_async
+from services.rate_limit import set_shared_rate
+
+
+@dataclass
+class BatchReport:
+    """일괄 검증 실행 결과 요약"""
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    cached: int = 0
+    near_duplicates: int = 0  # cached 중 비슷한 이전 수행내역의 결과를 재사용한 건수
+    written: int = 0
+    tokens_saved: int = 0
+    elapsed_seconds: float = 0.0
+    latencies: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def throughput_per_minute(self) -> float:
+        return self.total / self.elapsed_seconds * 60 if self.elapsed_seconds else 0.0
+
+    def latency_percentile(self, p: float) -> float:
+        """요청 지연시간의 p 백분위수(초)"""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, round(p / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data.pop("latencies")
+        data.update(
+            elapsed_seconds=round(self.elapsed_seconds, 3),
+            throughput_per_minute=round(self.throughput_per_minute, 2),
+            latency_p50=round(self.latency_percentile(50), 3),
+            latency_p95=round(self.latency_percentile(95), 3),
+            latency_max=round(max(self.latencies, default=0.0), 3),
+        )
+        return data
+
+    def record(self, latency: float, result: ValidationResult) -> bool:
+        """결과 한 건을 집계한다. 저장할 결과면 True (오류 안내문은 저장하지 않고 다음 실행에서 다시 시도)"""
+        self.latencies.append(latency)
+        if not result.ok:
+            self.failed += 1
+            return False
+        self.succeeded += 1
+        self.cached += int(result.cached)
+        self.near_duplicates += int(result.similarity is not None)
+        self.tokens_saved += result.tokens_saved
+        return True
+
+
+def _apply_rate(rate_per_second: float) -> None:
+    # 요청 속도는 run_validation이 재시도까지 포함해 공용 리미터로 제한한다 (AI_RATE_LIMIT_PER_SECOND=0이어도)
+    if rate_per_second > 0:
+        set_shared_rate(rate_per_second)
+
+
+def _unexpected_error(error: Exception) -> ValidationResult:
+    """검증 함수 밖으로 나온 예상하지 못한 오류도 그 한 건의 실패로 집계한다 (나머지는 계속 진행)."""
+    return ValidationResult(text=f"검증 중 오류가 발생했습니다: {error}", ok=False)
+
+
+def validate_pending(
+    cycle_id: Optional[int] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    concurrency: int = settings.ai_batch_concurrency,
+    rate_per_second: float = settings.ai_rate_limit_per_second,
+    commit_every: int = 50,
+    limit: Optional[int] = None,
+    model: Optional[str] = None,
+) -> BatchReport:
+    """AI 검증이 없는 DailyProgress를 동시에 검증하고 결과를 묶어서 저장한다."""
+    pending = repository.list_unvalidated_daily_progress(cycle_id, start, end, limit)
+    krs_by_objective = repository.kr_texts_by_objective(obj.id for _, obj in pending)
+    _apply_rate(rate_per_second)
+    report = BatchReport(total=len(pending))
+
+    def _validate(dp, obj):
+        started = time.perf_counter()
+        try:
+            result = run_validation(
+                obj.text,
+                krs_by_objective.get(obj.id, []),
+                dp.content,
+                progress_review_prompt(dp.content),
+                model=model,
+            )
+        except Exception as e:
+            result = _unexpected_error(e)
+        return dp.id, result, time.perf_counter() - started
+
+    buffer: List[tuple[int, str, Optional[str]]] = []
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            futures = {pool.submit(_validate, dp, obj): dp.id for dp, obj in pending}
+            for future in as_completed(futures):
+                try:
+                    dp_id, result, latency = future.result()
+                except Exception as e:
+                    dp_id, result, latency = futures[future], _unexpected_error(e), 0.0
+                if not report.record(latency, result):
+                    continue
+                buffer.append((dp_id, *result.stored()))
+                if len(buffer) >= commit_every:
+                    report.written += repository.save_validations(buffer)
+                    buffer.clear()
+    finally:
+        # 중간에 중단되어도 이미 받은 결과는 저장
+        report.written += repository.save_validations(buffer)
+        report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+async def validate_pending_async(
+    cycle_id: Optional[int] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    concurrency: int = settings.ai_batch_concurrency,
+    rate_per_second: float = settings.ai_rate_limit_per_second,
+    commit_every: int = 50,
+    limit: Optional[int] = None,
+    model: Optional[str] = None,
+) -> BatchReport:
+    """validate_pending의 비동기 버전: DB 조회, 모델 호출(AsyncOpenAI), 저장을 한 이벤트 루프에서 겹쳐 실행한다.
+
+    동시 요청 수만큼 스레드를 두는 대신 세마포어로 제한하고, commit_every건씩의 저장은
+    다음 응답을 기다리는 동안 진행한다 (저장은 한 번에 하나씩).
+    """
+    from db import async_repository
+
+    pending = await async_repository.list_unvalidated_daily_progress(cycle_id, start, end, limit)
+    krs_by_objective = await async_repository.kr_texts_by_objective(obj.id for _, obj in pending)
+    _apply_rate(rate_per_second)
+    report = BatchReport(total=len(pending))
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _validate(dp, obj):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await run_validation_async(
+                    obj.text,
+                    krs_by_objective.get(obj.id, []),
+                    dp.content,
+                    progress_review_prompt(dp.content),
+                    model=model,
+                )
+            except Exception as e:
+                result = _unexpected_error(e)
+            return dp.id, result, time.perf_counter() - started
+
+    writer: Optional[asyncio.Task] = None
+
+    async def _save(rows: List[tuple[int, str, Optional[str]]]) -> None:
+        nonlocal writer
+        if writer is not None:
+            report.written += await writer
+        writer = asyncio.create_task(async_repository.save_validations(rows))
+
+    buffer: List[tuple[int, str, Optional[str]]] = []
+    started = time.perf_counter()
+    try:
+        for future in asyncio.as_completed([_validate(dp, obj) for dp, obj in pending]):
+            dp_id, result, latency = await future
+            if not report.record(latency, result):
+                continue
+            buffer.append((dp_id, *result.stored()))
+            if len(buffer) >= commit_every:
+                await _save(buffer)
+                buffer = []
+    finally:
+        # 중간에 중단되어도 이미 받은 결과는 저장
+        await _save(buffer)
+        report.written += await writer
+        report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+async def _main_async(args: argparse.Namespace) -> BatchReport:
+    from db import async_repository
+
+    try:
+        await async_repository.init_db()
+        return await validate_pending_async(
+            cycle_id=args.cycle,
+            start=args.start,
+            end=args.end,
+            concurrency=args.concurrency,
+            rate_per_second=args.rate,
+            commit_every=args.commit_every,
+            limit=args.limit,
+            model=args.model,
+        )
+    finally:
+        await async_repository.dispose_engine()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: python streamlit_app/services/batch_validator.py --cycle 1 --start 2025-01-01"""
+    parser = argparse.ArgumentParser(description="미검증 수행내역(DailyProgress) 일괄 AI 검증")
+    parser.add_argument("--cycle", type=int, help="OKR 사이클 ID")
+    parser.add_argument("--start", type=date.fromisoformat, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="종료일 (YYYY-MM-DD)")
+    parser.add_argument("--concurrency", type=int, default=settings.ai_batch_concurrency, help="동시 요청 수")
+    parser.add_argument("--rate", type=float, default=settings.ai_rate_limit_per_second, help="초당 최대 요청 수")
+    parser.add_argument("--commit-every", type=int, default=50, help="몇 건마다 저장할지")
+    parser.add_argument("--limit", type=int, help="최대 처리 건수")
+    parser.add_argument("--model", help="사용할 모델 (기본: OPENAI_MODEL)")
+    parser.add_argument(
+        "--async", dest="use_async", action="store_true",
+        help="스레드 대신 asyncio로 실행 (AsyncOpenAI + 비동기 저장소, aiosqlite/asyncpg 필요)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.use_async:
+        report = asyncio.run(_main_async(args))
+    else:
+        repository.init_db()
+        report = validate_pending(
+            cycle_id=args.cycle,
+            start=args.start,
+            end=args.end,
+            concurrency=args.concurrency,
+            rate_per_second=args.rate,
+            commit_every=args.commit_every,
+            limit=args.limit,
+            model=args.model,
+        )
+    print(json.dumps(report.as_dict(), ensure_ascii=False, indent=2))
+    return 0 if report.failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+from __future__ import annotations
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.metrics import registry
+
+# 수행내역 초안 write-behind 버퍼
+# rerun마다 들어오는 입력은 (세션, 날짜)별 최신 값만 메모리에 남기고, 백그라운드 스레드가
+# 입력이 멈춘 뒤(debounce) 모인 초안을 한 트랜잭션으로 저장한다. DB 쓰기는 rerun 수가 아니라 flush 수만큼 생긴다.
+MAX_REMEMBERED = 10_000  # 변경 여부 비교용으로 기억하는 마지막 값 수
+
+
+@dataclass(frozen=True)
+class Draft:
+    """저장할 초안 하나 (좌측 패널의 OKR + 선택한 날짜의 수행내역)"""
+    objective: str
+    key_results: Tuple[str, ...]
+    start_date: date
+    end_date: date
+    day: date
+    content: str
+
+    def same_target(self, objective: str, start_date: date, end_date: date, day: date) -> bool:
+        return (self.objective, self.start_date, self.end_date, self.day) == (objective, start_date, end_date, day)
+
+
+@dataclass
+class DraftStats:
+    puts: int = 0  # 실제로 바뀐 입력 수 (같은 값으로 rerun 된 경우 제외)
+    coalesced: int = 0  # 저장 전에 더 새 값으로 덮어써진 수
+    flushes: int = 0  # DB 트랜잭션 수
+    rows_written: int = 0
+    errors: int = 0
+
+
+class DraftWriteBehind:
+    """(세션, 날짜)별 최신 초안을 모아 두었다가 writer([(세션, 초안)])로 한 번에 저장한다.
+
+    마지막 변경 후 debounce_seconds가 지났거나, 첫 변경 후 max_delay_seconds가 지난 초안만 저장한다.
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[List[Tuple[str, Draft]]], int],
+        debounce_seconds: float,
+        max_delay_seconds: float,
+    ) -> None:
+        self.writer = writer
+        self.debounce_seconds = max(0.0, debounce_seconds)
+        self.max_delay_seconds = max(self.debounce_seconds, max_delay_seconds)
+        self.stats = DraftStats()
+        self._pending: Dict[Tuple[str, date], Tuple[Draft, float, float]] = {}  # (초안, 첫 변경, 마지막 변경)
+        self._last: OrderedDict[Tuple[str, date], Draft] = OrderedDict()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # flush와 discard가 엇갈려 전환된 초안이 되살아나지 않도록
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _remember(self, key: Tuple[str, date], draft: Draft) -> None:
+        self._last[key] = draft
+        self._last.move_to_end(key)
+        while len(self._last) > MAX_REMEMBERED:
+            self._last.popitem(last=False)
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="draft-autosave", daemon=True)
+            self._thread.start()
+            # 프로세스가 끝날 때 남은 초안을 저장
+            atexit.register(self.flush, True)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.debounce_seconds or 0.5)
+            self._wake.clear()
+            self.flush()
+
+    def put(self, session_id: str, draft: Draft) -> bool:
+        """rerun마다 호출한다. 이전 값과 같으면 아무것도 하지 않고 False."""
+        key = (session_id, draft.day)
+        now = time.monotonic()
+        with self._lock:
+            previous = self._last.get(key)
+            if previous == draft or (previous is None and not draft.content.strip()):
+                return False
+            self._remember(key, draft)
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.stats.coalesced += 1
+            self._pending[key] = (draft, pending[1] if pending else now, now)
+            self.stats.puts += 1
+            self._start()
+        return True
+
+    def seen(self, session_id: str, draft: Draft) -> None:
+        """DB에서 다시 불러온 값은 변경으로 보지 않도록 기억한다."""
+        with self._lock:
+            self._remember((session_id, draft.day), draft)
+
+    def pending(self, session_id: str, objective: str, start_date: date, end_date: date, day: date) -> Optional[Draft]:
+        """세션이 아직 저장하지 않은 같은 Objective·날짜의 초안"""
+        with self._lock:
+            entry = self._pending.get((session_id, day))
+        if entry is None or not entry[0].same_target(objective, start_date, end_date, day):
+            return None
+        return entry[0]
+
+    def discard(self, session_id: str, day: date) -> None:
+        """검증을 요청해 수행내역으로 저장했으면 대기 중인 초안을 버린다 (진행 중인 flush는 끝날 때까지 기다림)."""
+        with self._flush_lock, self._lock:
+            self._pending.pop((session_id, day), None)
+
+    def flush(self, force: bool = False) -> int:
+        """저장할 때가 된 초안(force면 전부)을 한 트랜잭션으로 저장하고 건수를 반환한다."""
+        with self._flush_lock:
+            now = time.monotonic()
+            with self._lock:
+                ready = [
+                    key for key, (_, first, last) in self._pending.items()
+                    if force or now - last >= self.debounce_seconds or now - first >= self.max_delay_seconds
+                ]
+                batch = {key: self._pending.pop(key) for key in ready}
+            if not batch:
+                return 0
+            try:
+                written = self.writer([(key[0], draft) for key, (draft, _, _) in batch.items()])
+            except Exception:
+                # 다음 주기에 다시 시도 (그 사이 더 새 값이 들어왔으면 그 값을 저장)
+                with self._lock:
+                    for key, entry in batch.items():
+                        self._pending.setdefault(key, entry)
+                    self.stats.errors += 1
+                registry.inc("okr_draft_flush_errors_total")
+                return 0
+            with self._lock:
+                self.stats.flushes += 1
+                self.stats.rows_written += written
+            registry.inc("okr_draft_flushes_total")
+            registry.inc("okr_draft_rows_written_total", written)
+            return written
@@ -0,0 +1,154 @@
+from __future__ import annotations
+import os
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db import repository
+
+TARGET_PROGRESS = 100.0  # KRUpdate.progress는 목표 대비 % 로 기록
+Z_95 = 1.96
+# 종료일 이후 이 기간 안에 도달하지 못하는 추세는 "도달 불가"(nan)로 본다 (거의 평평한 추세의 날짜 오버플로 방지)
+COMPLETION_HORIZON_DAYS = 365.0 * 5
+
+
+@dataclass(frozen=True)
+class ForecastArrays:
+    """KR별 추세/예측 결과 (각 배열은 kr_ids와 같은 순서)"""
+    kr_ids: np.ndarray
+    points: np.ndarray
+    current: np.ndarray
+    slope_per_day: np.ndarray
+    projected_at_end: np.ndarray
+    band_low: np.ndarray
+    band_high: np.ndarray
+    completion_day: np.ndarray  # 시작일 기준 경과일, 도달 불가면 nan
+
+
+@dataclass(frozen=True)
+class KRForecast:
+    kr_id: int
+    text: str
+    points: int
+    current: float
+    slope_per_day: float
+    projected_at_end: float
+    band_low: float
+    band_high: float
+    completion_date: Optional[date]
+    on_track: bool
+
+
+@dataclass(frozen=True)
+class ObjectiveForecast:
+    objective_id: int
+    text: str
+    projected_at_end: float
+    on_track_ratio: float
+    krs: List[KRForecast]
+
+
+def to_columns(history: Sequence[tuple], start: date) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(kr_id, epoch 초, progress) 행 목록을 열 배열(kr_id, 시작일 기준 경과일, 진행률)로 바꾼다."""
+    if not history:
+        empty = np.empty(0)
+        return empty.astype(np.int64), empty, empty
+    kr_ids, seconds, progress = zip(*history)
+    # created_at은 naive UTC로 저장되므로 시작일도 UTC 자정 기준으로 맞춘다
+    origin = datetime.combine(start, datetime.min.time(), tzinfo=timezone.utc).timestamp()
+    days = (np.asarray(seconds, dtype=np.float64) - origin) / 86400.0
+    return np.asarray(kr_ids, dtype=np.int64), days, np.asarray(progress, dtype=np.float64)
+
+
+def forecast_columns(
+    kr_ids: np.ndarray,
+    days: np.ndarray,
+    progress: np.ndarray,
+    end_day: float,
+    target: float = TARGET_PROGRESS,
+) -> ForecastArrays:
+    """KR별 최소제곱 직선으로 기울기, 종료일 예상치(95% 구간), 목표 도달일을 한 번에 계산한다.
+
+    입력은 kr_id, 시간 순으로 정렬되어 있어야 한다.
+    """
+    unique_ids, start_idx, group = np.unique(kr_ids, return_index=True, return_inverse=True)
+    n = np.bincount(group).astype(np.float64)
+    mean_x = np.bincount(group, weights=days) / n
+    mean_y = np.bincount(group, weights=progress) / n
+    dx = days - mean_x[group]
+    sxx = np.bincount(group, weights=dx * dx)
+    sxy = np.bincount(group, weights=dx * (progress - mean_y[group]))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(sxx > 0, sxy / sxx, 0.0)
+        intercept = mean_y - slope * mean_x
+        residual = progress - (intercept[group] + slope[group] * days)
+        sse = np.bincount(group, weights=residual * residual)
+        sigma2 = np.where(n > 2, sse / (n - 2), np.nan)
+        projected = intercept + slope * end_day
+        se = np.sqrt(sigma2 * (1.0 / n + np.where(sxx > 0, (end_day - mean_x) ** 2 / sxx, np.inf)))
+        margin = np.nan_to_num(Z_95 * se, nan=np.inf)
+        completion = np.where(slope > 0, (target - intercept) / slope, np.nan)
+        completion = np.where(completion <= end_day + COMPLETION_HORIZON_DAYS, completion, np.nan)
+
+    last_idx = start_idx + n.astype(np.int64) - 1
+    current = progress[last_idx]
+    # 이미 목표에 도달한 KR은 마지막 기록일을 달성일로 본다
+    completion = np.where(current >= target, days[last_idx], completion)
+    return ForecastArrays(
+        kr_ids=unique_ids,
+        points=n.astype(np.int64),
+        current=current,
+        slope_per_day=slope,
+        projected_at_end=np.clip(projected, 0.0, None),
+        band_low=np.clip(projected - margin, 0.0, None),
+        band_high=projected + margin,
+        completion_day=completion,
+    )
+
+
+def cycle_forecast(cycle_id: int) -> List[ObjectiveForecast]:
+    """사이클의 모든 KR에 대해 종료일 달성 여부를 예측한다 (DB 쿼리 5회)."""
+    tree = repository.load_cycle_tree(cycle_id)
+    if tree is None:
+        return []
+    start, end = tree.start_date, tree.end_date
+    kr_ids, days, progress = to_columns(repository.kr_progress_history(cycle_id), start)
+    end_day = float((end - start).days)
+    arrays = forecast_columns(kr_ids, days, progress, end_day)
+
+    by_kr: Dict[int, int] = {int(kr_id): i for i, kr_id in enumerate(arrays.kr_ids)}
+    result: List[ObjectiveForecast] = []
+    for obj in tree.objectives:
+        krs: List[KRForecast] = []
+        for kr in obj.krs:
+            i = by_kr.get(kr.id)
+            if i is None:
+                krs.append(KRForecast(kr.id, kr.text, 0, 0.0, 0.0, 0.0, 0.0, 0.0, None, False))
+                continue
+            day = arrays.completion_day[i]
+            completion = (
+                start + timedelta(days=float(day))
+                if np.isfinite(day) and day < (date.max - start).days else None
+            )
+            krs.append(KRForecast(
+                kr_id=kr.id,
+                text=kr.text,
+                points=int(arrays.points[i]),
+                current=float(arrays.current[i]),
+                slope_per_day=float(arrays.slope_per_day[i]),
+                projected_at_end=float(arrays.projected_at_end[i]),
+                band_low=float(arrays.band_low[i]),
+                band_high=float(arrays.band_high[i]),
+                completion_date=completion,
+                on_track=completion is not None and completion <= end,
+            ))
+        projected = float(np.mean([k.projected_at_end for k in krs])) if krs else 0.0
+        on_track = sum(k.on_track for k in krs) / len(krs) if krs else 0.0
+        result.append(ObjectiveForecast(obj.id, obj.text, min(projected, TARGET_PROGRESS), on_track, krs))
+    return result
@@ -0,0 +1,359 @@
+from __future__ import annotations
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+
+MAX_BUFFERED_EVENTS = 1_000  # 이만큼 쌓이면 주기를 기다리지 않고 바로 flush
+
+@dataclass
+class LLMCallMetrics:
+    """OpenAI 호출 1회의 측정값"""
+    requested_model: str
+    model: Optional[str]  # fallback 후 실제로 응답한 모델
+    ok: bool
+    cached: bool
+    stream: bool
+    latency_seconds: float
+    ttft_seconds: Optional[float] = None  # 첫 토큰까지 걸린 시간 (스트리밍)
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    prompt_tokens_saved: int = 0  # 프롬프트 빌더가 줄인 입력 토큰 수
+    attempts: int = 0
+    near_duplicate: bool = False  # 비슷한 이전 수행내역의 결과를 재사용함 (cached=True)
+
+
+@dataclass
+class RerunMetrics:
+    """Streamlit 스크립트 실행(rerun) 1회의 구간별 시간, 쿼리 수, LLM 호출"""
+    script: str
+    started_at: float = field(default_factory=time.time)
+    phases: Dict[str, float] = field(default_factory=dict)
+    query_count: int = 0
+    query_seconds: float = 0.0
+    llm_calls: List[LLMCallMetrics] = field(default_factory=list)
+    total_seconds: Optional[float] = None
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data.pop("_started")
+        return data
+
+
+class MetricsRegistry:
+    """누적 카운터를 보관하고 JSONL/Prometheus 텍스트로 내보낸다.
+
+    rerun 경로에서 파일을 쓰지 않도록 이벤트는 메모리에 모아 두고, 백그라운드 스레드가
+    flush_seconds마다 JSONL에 한꺼번에 덧붙이고 Prometheus 파일은 값이 바뀌었을 때만 다시 쓴다.
+    JSONL이 jsonl_max_bytes를 넘으면 <경로>.1 로 옮기고 새 파일에 쓴다 (0이면 회전 안 함).
+    """
+
+    def __init__(
+        self,
+        jsonl_path: Optional[str],
+        prometheus_path: Optional[str],
+        flush_seconds: float = 5.0,
+        jsonl_max_bytes: int = 0,
+    ) -> None:
+        self.jsonl_path = jsonl_path
+        self.prometheus_path = prometheus_path
+        self.flush_seconds = max(0.1, flush_seconds)
+        self.jsonl_max_bytes = jsonl_max_bytes
+        self._values: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+        self._dirty = False  # 마지막으로 Prometheus 파일을 쓴 뒤 카운터가 바뀌었는지
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _start(self) -> None:
+        """파일 싱크가 켜져 있으면 flush 스레드를 한 번만 띄운다 (self._lock 안에서 호출)."""
+        if self._thread is None and (self.jsonl_path or self.prometheus_path):
+            self._thread = threading.Thread(target=self._run, name="metrics-flush", daemon=True)
+            self._thread.start()
+            # 프로세스가 끝날 때 남은 이벤트를 기록
+            atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            self.flush()
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+            self._dirty = True
+            self._start()
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition 형식 (모든 값은 counter)"""
+        with self._lock:
+            items = sorted(self._values.items())
+        lines: List[str] = []
+        declared = set()
+        for (name, labels), value in items:
+            if name not in declared:
+                lines.append(f"# TYPE {name} counter")
+                declared.add(name)
+            label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+            lines.append(f"{name}{{{label_text}}} {value:g}" if label_text else f"{name} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def emit(self, record_type: str, data: dict) -> None:
+        """이벤트 1건을 JSONL 버퍼에 넣는다 (파일은 flush에서 씀)."""
+        if not self.jsonl_path:
+            return
+        line = json.dumps({"type": record_type, **data}, ensure_ascii=False, default=str)
+        with self._lock:
+            self._buffer.append(line)
+            full = len(self._buffer) >= MAX_BUFFERED_EVENTS
+            self._start()
+        if full:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """버퍼의 이벤트를 JSONL에 덧붙이고, 카운터가 바뀌었으면 Prometheus 파일을 다시 쓴다. 기록한 이벤트 수를 반환한다."""
+        with self._flush_lock:
+            with self._lock:
+                lines, self._buffer = self._buffer, []
+                dirty, self._dirty = self._dirty, False
+            if lines and self.jsonl_path:
+                self._append_jsonl(lines)
+            if dirty and self.prometheus_path:
+                self._write_prometheus()
+            return len(lines)
+
+    def _append_jsonl(self, lines: List[str]) -> None:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.jsonl_path)), exist_ok=True)
+            if self.jsonl_max_bytes > 0 and os.path.exists(self.jsonl_path) \
+                    and os.path.getsize(self.jsonl_path) >= self.jsonl_max_bytes:
+                os.replace(self.jsonl_path, f"{self.jsonl_path}.1")
+            with open(self.jsonl_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError:
+            pass
+
+    def _write_prometheus(self) -> None:
+        text = self.render_prometheus()
+        tmp_path = f"{self.prometheus_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.prometheus_path)), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            # node_exporter textfile collector가 쓰다 만 파일을 읽지 않도록 교체
+            os.replace(tmp_path, self.prometheus_path)
+        except OSError:
+            pass
+
+
+registry = MetricsRegistry(
+    jsonl_path=settings.metrics_jsonl_path if settings.metrics_enabled else None,
+    prometheus_path=settings.metrics_prometheus_path if settings.metrics_enabled else None,
+    flush_seconds=settings.metrics_flush_seconds,
+    jsonl_max_bytes=settings.metrics_jsonl_max_bytes,
+)
+
+# 현재 스레드에서 실행 중인 rerun (Streamlit은 세션마다 별도 스크립트 스레드에서 실행)
+_local = threading.local()
+
+
+def current_rerun() -> Optional[RerunMetrics]:
+    return getattr(_local, "rerun", None)
+
+
+@contextmanager
+def collect_llm_calls() -> Iterator[List[LLMCallMetrics]]:
+    """rerun 밖(작업 큐 워커 스레드 등)의 LLM 호출 측정값을 모은다.
+
+    모은 값은 결과를 가져가는 rerun에서 attach_llm_calls로 붙인다.
+    """
+    calls: List[LLMCallMetrics] = []
+    previous = getattr(_local, "llm_calls", None)
+    _local.llm_calls = calls
+    try:
+        yield calls
+    finally:
+        _local.llm_calls = previous
+
+
+def attach_llm_calls(run: Optional[RerunMetrics], calls: List[LLMCallMetrics]) -> None:
+    """다른 스레드에서 모은 LLM 호출 측정값을 rerun에 붙인다 (디버그 패널/rerun 기록용)."""
+    if run is not None:
+        run.llm_calls.extend(calls)
+
+
+def start_rerun(script: str) -> RerunMetrics:
+    """스크립트 시작 시 호출. 이후 이 스레드의 구간/쿼리/LLM 측정값이 여기에 모인다."""
+    run = RerunMetrics(script=script)
+    _local.rerun = run
+    return run
+
+
+def finish_rerun(run: RerunMetrics) -> RerunMetrics:
+    """스크립트 끝에서 호출. 총 소요 시간을 기록하고 싱크로 내보낸다."""
+    run.total_seconds = time.perf_counter() - run._started
+    if getattr(_local, "rerun", None) is run:
+        _local.rerun = None
+    registry.inc("okr_reruns_total", script=run.script)
+    registry.inc("okr_rerun_seconds_total", run.total_seconds, script=run.script)
+    for name, seconds in run.phases.items():
+        registry.inc("okr_phase_seconds_total", seconds, script=run.script, phase=name)
+        registry.inc("okr_phase_runs_total", script=run.script, phase=name)
+    registry.emit("rerun", run.as_dict())
+    return run
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """rerun 안의 한 구간(left_panel, right_panel, validation ...)의 시간을 잰다."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        run = current_rerun()
+        if run is not None:
+            run.phases[name] = run.phases.get(name, 0.0) + time.perf_counter() - started
+
+
+def record_llm_call(call: LLMCallMetrics) -> None:
+    """LLM 호출 측정값을 현재 rerun과 누적 카운터, JSONL에 기록한다."""
+    run = current_rerun()
+    if run is not None:
+        run.llm_calls.append(call)
+    else:
+        collected = getattr(_local, "llm_calls", None)
+        if collected is not None:
+            collected.append(call)
+    labels = {"model": call.model or "none", "ok": str(call.ok).lower(), "cached": str(call.cached).lower()}
+    registry.inc("okr_llm_calls_total", **labels)
+    registry.inc("okr_llm_latency_seconds_total", call.latency_seconds, **labels)
+    if call.cached:
+        # 캐시/유사 재사용으로 생략한 모델 호출 수
+        registry.inc("okr_llm_calls_avoided_total", reason="near_duplicate" if call.near_duplicate else "cache")
+    if call.ttft_seconds is not None:
+        registry.inc("okr_llm_ttft_seconds_total", call.ttft_seconds, model=labels["model"])
+        registry.inc("okr_llm_ttft_observations_total", model=labels["model"])
+    if call.prompt_tokens:
+        registry.inc("okr_llm_prompt_tokens_total", call.prompt_tokens, model=labels["model"])
+    if call.completion_tokens:
+        registry.inc("okr_llm_completion_tokens_total", call.completion_tokens, model=labels["model"])
+    if call.prompt_tokens_saved:
+        registry.inc("okr_prompt_tokens_saved_total", call.prompt_tokens_saved)
+    registry.emit("llm_call", asdict(call))
+
+
+class LLMCallTimer:
+    """검증 함수 안에서 LLM 호출 시간/첫 토큰/토큰 수를 모으는 도우미"""
+
+    def __init__(self, requested_model: str, stream: bool = False) -> None:
+        self.call = LLMCallMetrics(
+            requested_model=requested_model, model=None, ok=False, cached=False,
+            stream=stream, latency_seconds=0.0,
+        )
+        self._started = time.perf_counter()
+
+    def first_token(self) -> None:
+        if self.call.ttft_seconds is None:
+            self.call.ttft_seconds = time.perf_counter() - self._started
+
+    def usage(self, usage) -> None:
+        """응답의 usage 객체(prompt_tokens/completion_tokens)를 기록한다."""
+        if usage is not None:
+            self.call.prompt_tokens = getattr(usage, "prompt_tokens", None)
+            self.call.completion_tokens = getattr(usage, "completion_tokens", None)
+
+    def finish(self, ok: bool, model: Optional[str] = None, cached: bool = False, near_duplicate: bool = False) -> None:
+        self.call.ok = ok
+        self.call.model = model
+        self.call.cached = cached
+        self.call.near_duplicate = near_duplicate
+        self.call.latency_seconds = time.perf_counter() - self._started
+        record_llm_call(self.call)
+
+
+# SQLAlchemy: 모든 엔진의 쿼리 수/시간을 현재 rerun과 누적 카운터에 기록
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("_metrics_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("_metrics_query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    registry.inc("okr_db_queries_total")
+    registry.inc("okr_db_query_seconds_total", elapsed)
+    run = current_rerun()
+    if run is not None:
+        run.query_count += 1
+        run.query_seconds += elapsed
+
+
+_engines_instrumented = False
+
+
+def instrument_engines() -> None:
+    """쿼리 계측 리스너를 등록한다. SQLAlchemy를 앱 시작 때 불러오지 않도록 엔진을 처음 만들 때 호출한다."""
+    global _engines_instrumented
+    if _engines_instrumented:
+        return
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _engines_instrumented = True
+
+
+class _PrometheusHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802 (http.server 규약)
+        body = registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+def start_prometheus_server(
+    port: int = settings.metrics_prometheus_port, host: str = settings.metrics_host,
+) -> Optional[ThreadingHTTPServer]:
+    """/metrics 요청에 누적 카운터를 응답하는 HTTP 서버를 백그라운드로 한 번만 띄운다 (port=0이면 끔).
+
+    기본은 127.0.0.1에만 바인딩한다 (METRICS_HOST로 변경).
+    """
+    global _server
+    if not port or not settings.metrics_enabled:
+        return None
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), _PrometheusHandler)
+            except OSError:
+                # 다른 프로세스가 이미 포트를 사용 중이면 파일 싱크만 사용
+                return None
+            threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
+        return _server
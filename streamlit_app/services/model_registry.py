@@ -0,0 +1,62 @@
+from __future__ import annotations
+import threading
+import time
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class ModelRegistry:
+    """모델 접근 가능 여부를 만료 시간과 함께 기억하는 프로세스 공용 레지스트리
+
+    접근 권한은 API 키·엔드포인트마다 다르므로 client(예: (api_key, base_url))별로 따로 기억한다.
+    """
+
+    def __init__(self, unavailable_ttl_seconds: float) -> None:
+        self.unavailable_ttl_seconds = unavailable_ttl_seconds
+        self._unavailable_until: Dict[Tuple[Optional[Hashable], str], float] = {}
+        self._lock = threading.Lock()
+
+    def mark_unavailable(self, model: str, client: Optional[Hashable] = None) -> None:
+        """모델을 TTL 동안 접근 불가로 표시한다."""
+        with self._lock:
+            self._unavailable_until[(client, model)] = time.monotonic() + self.unavailable_ttl_seconds
+
+    def mark_available(self, model: str, client: Optional[Hashable] = None) -> None:
+        """모델 호출이 성공하면 접근 불가 표시를 지운다."""
+        with self._lock:
+            self._unavailable_until.pop((client, model), None)
+
+    def is_available(self, model: str, client: Optional[Hashable] = None) -> bool:
+        """접근 불가로 표시되지 않았거나 표시가 만료되었으면 True."""
+        with self._lock:
+            until = self._unavailable_until.get((client, model))
+            if until is None:
+                return True
+            if time.monotonic() >= until:
+                del self._unavailable_until[(client, model)]
+                return True
+            return False
+
+    def filter_available(self, models: Iterable[str], client: Optional[Hashable] = None) -> List[str]:
+        """순서를 유지한 채 접근 가능한 모델만 남긴다.
+
+        모두 접근 불가로 표시되어 있으면 가장 오래전에 실패한 모델 하나는 남긴다
+        (표시가 잘못되었거나 권한이 바뀌었어도 TTL 내내 요청이 막히지 않게).
+        """
+        models = list(models)
+        available = [m for m in models if self.is_available(m, client)]
+        if available or not models:
+            return available
+        with self._lock:
+            oldest = min(models, key=lambda m: self._unavailable_until.get((client, m), 0.0))
+        return [oldest]
+
+    def unavailable_models(self, client: Optional[Hashable] = None) -> List[str]:
+        """현재 접근 불가로 표시된 모델 목록"""
+        now = time.monotonic()
+        with self._lock:
+            return [m for (c, m), until in self._unavailable_until.items() if c == client and until > now]
+
+    def clear(self) -> None:
+        """모든 접근 불가 표시를 지운다."""
+        with self._lock:
+            self._unavailable_until.clear()
@@ -0,0 +1,291 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import unicodedata
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+
+# 거의 같은 수행내역(띄어쓰기·문장부호·숫자만 다른 글)을 찾는 로컬 유사도 색인
+# SimHash(64비트) 지문을 LSH 밴드로 나눠 버킷에 넣고, 후보만 해밍 거리로 확인한다.
+FINGERPRINT_BITS = 64
+SHINGLE_CHARS = 3
+MIN_NORMALIZED_CHARS = 12  # 너무 짧은 글은 지문이 불안정하므로 재사용하지 않음
+
+_NON_WORD = re.compile(r"[\W_]+")
+_DIGITS = re.compile(r"\d+")
+
+
+def normalize_notes(text: str) -> str:
+    """비교용 정규화: 유니코드 NFKC, 소문자, 숫자는 0으로, 공백·문장부호 제거"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return _NON_WORD.sub("", _DIGITS.sub("0", text))
+
+
+def simhash(normalized: str) -> int:
+    """문자 3-gram(빈도 가중)으로 만든 64비트 SimHash 지문"""
+    shingles = Counter(
+        normalized[i:i + SHINGLE_CHARS] for i in range(max(1, len(normalized) - SHINGLE_CHARS + 1))
+    )
+    weights = [0] * FINGERPRINT_BITS
+    for shingle, count in shingles.items():
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += count if h >> bit & 1 else -count
+    return sum(1 << bit for bit, w in enumerate(weights) if w > 0)
+
+
+def similarity(a: int, b: int) -> float:
+    """두 지문의 유사도 (1 - 해밍 거리 / 64)"""
+    return 1.0 - bin(a ^ b).count("1") / FINGERPRINT_BITS
+
+
+def _bands(max_distance: int) -> List[Tuple[int, int]]:
+    """(시작 비트, 폭) 목록. 밴드 수 = 허용 거리 + 1 이면 그 거리 이내의 지문은 한 밴드 이상이 같다(비둘기집)."""
+    count = min(FINGERPRINT_BITS, max_distance + 1)
+    widths = [FINGERPRINT_BITS // count + (1 if i < FINGERPRINT_BITS % count else 0) for i in range(count)]
+    bands, start = [], 0
+    for width in widths:
+        bands.append((start, width))
+        start += width
+    return bands
+
+
+def scope_key(
+    model: str,
+    objective: str,
+    key_results: List[str],
+    progress_notes: str,
+    user_prompt: str,
+    temperature: float,
+    structured: bool = False,
+) -> str:
+    """재사용 범위: 같은 모델·Objective·KR·추가 요청·응답 형식일 때만 결과를 재사용한다.
+
+    추가 요청 안에 수행내역이 그대로 들어 있으면(progress_review_prompt) 그 부분은 빼고 비교한다.
+    """
+    prompt_template = user_prompt.replace(progress_notes, "") if progress_notes else user_prompt
+    payload = json.dumps(
+        [model, objective, list(key_results), prompt_template, round(float(temperature), 4), structured],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class NearDuplicateMatch:
+    """유사 수행내역 검색 결과"""
+    response: str
+    similarity: float
+
+
+@dataclass
+class NearDuplicateStats:
+    lookups: int = 0
+    hits: int = 0
+    skipped_short: int = 0
+    writes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+@dataclass
+class _ScopeIndex:
+    """한 범위(Objective)의 지문 목록과 LSH 버킷"""
+    entries: List[Tuple[int, str, float]] = field(default_factory=list)  # (지문, 응답, 저장 시각)
+    buckets: Dict[Tuple[int, int], List[int]] = field(default_factory=dict)
+
+
+def _to_signed(fingerprint: int) -> int:
+    # SQLite INTEGER는 부호 있는 64비트
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+
+class NearDuplicateIndex:
+    """Objective별로 검증을 마친 수행내역의 SimHash 지문과 응답을 보관한다 (메모리 + SQLite 파일).
+
+    threshold 이상으로 비슷한 수행내역이 있으면 그 응답을 재사용해 모델 호출을 생략한다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        threshold: float,
+        ttl_seconds: int,
+        max_per_scope: int,
+        memory_scopes: int = 256,
+    ) -> None:
+        self.threshold = threshold
+        self.max_distance = max(0, int((1.0 - threshold) * FINGERPRINT_BITS))
+        self.bands = _bands(self.max_distance)
+        self.ttl_seconds = ttl_seconds
+        self.max_per_scope = max(1, max_per_scope)
+        self.memory_scopes = memory_scopes
+        self.stats = NearDuplicateStats()
+        self._scopes: OrderedDict[str, _ScopeIndex] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            self._conn = self._open(path)
+
+    @staticmethod
+    def _open(path: str) -> Optional[sqlite3.Connection]:
+        try:
+            if path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ai_near_duplicates ("
+                " id INTEGER PRIMARY KEY,"
+                " scope TEXT NOT NULL,"
+                " fingerprint INTEGER NOT NULL,"
+                " response TEXT NOT NULL,"
+                " created_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_ai_near_duplicates_scope ON ai_near_duplicates (scope, id)")
+            conn.commit()
+            return conn
+        except sqlite3.Error:
+            # 파일 저장소를 쓸 수 없으면 메모리 색인만 사용
+            return None
+
+    def _band_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        return [(i, fingerprint >> start & ((1 << width) - 1)) for i, (start, width) in enumerate(self.bands)]
+
+    def _insert(self, index: _ScopeIndex, fingerprint: int, response: str, created_at: float) -> None:
+        position = len(index.entries)
+        index.entries.append((fingerprint, response, created_at))
+        for key in self._band_keys(fingerprint):
+            index.buckets.setdefault(key, []).append(position)
+
+    def _rebuild(self, index: _ScopeIndex, now: float) -> None:
+        """만료/초과 항목을 빼고 버킷을 다시 만든다 (최근 max_per_scope건 유지)."""
+        live = [e for e in index.entries if now - e[2] <= self.ttl_seconds][-self.max_per_scope:]
+        index.entries, index.buckets = [], {}
+        for fingerprint, response, created_at in live:
+            self._insert(index, fingerprint, response, created_at)
+
+    def _scope(self, scope: str, now: float) -> _ScopeIndex:
+        index = self._scopes.get(scope)
+        if index is not None:
+            self._scopes.move_to_end(scope)
+            return index
+        index = _ScopeIndex()
+        if self._conn is not None:
+            try:
+                rows = self._conn.execute(
+                    "SELECT fingerprint, response, created_at FROM ai_near_duplicates"
+                    " WHERE scope = ? AND created_at >= ? ORDER BY id DESC LIMIT ?",
+                    (scope, now - self.ttl_seconds, self.max_per_scope),
+                ).fetchall()
+                for fingerprint, response, created_at in reversed(rows):
+                    self._insert(index, fingerprint & ((1 << 64) - 1), response, created_at)
+            except sqlite3.Error:
+                pass
+        self._scopes[scope] = index
+        while len(self._scopes) > self.memory_scopes:
+            self._scopes.popitem(last=False)
+        return index
+
+    def lookup(self, scope: str, progress_notes: str) -> Optional[NearDuplicateMatch]:
+        """threshold 이상으로 가장 비슷한 이전 수행내역의 응답을 찾는다. 없으면 None."""
+        normalized = normalize_notes(progress_notes)
+        now = time.time()
+        with self._lock:
+            self.stats.lookups += 1
+            if len(normalized) < MIN_NORMALIZED_CHARS:
+                self.stats.skipped_short += 1
+                return None
+            fingerprint = simhash(normalized)
+            index = self._scope(scope, now)
+            best: Optional[NearDuplicateMatch] = None
+            seen = set()
+            for key in self._band_keys(fingerprint):
+                for position in index.buckets.get(key, ()):
+                    if position in seen:
+                        continue
+                    seen.add(position)
+                    candidate, response, created_at = index.entries[position]
+                    if now - created_at > self.ttl_seconds:
+                        continue
+                    score = similarity(fingerprint, candidate)
+                    if score >= self.threshold and (best is None or score > best.similarity):
+                        best = NearDuplicateMatch(response=response, similarity=score)
+            if best is not None:
+                self.stats.hits += 1
+            return best
+
+    def add(self, scope: str, progress_notes: str, response: str) -> None:
+        """모델이 검증한 수행내역의 지문과 응답을 기록한다."""
+        normalized = normalize_notes(progress_notes)
+        if len(normalized) < MIN_NORMALIZED_CHARS or not response:
+            return
+        fingerprint = simhash(normalized)
+        now = time.time()
+        with self._lock:
+            index = self._scope(scope, now)
+            self._insert(index, fingerprint, response, now)
+            if len(index.entries) > self.max_per_scope * 2:
+                self._rebuild(index, now)
+            self.stats.writes += 1
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT INTO ai_near_duplicates (scope, fingerprint, response, created_at) VALUES (?, ?, ?, ?)",
+                    (scope, _to_signed(fingerprint), response, now),
+                )
+                # 범위별 최근 max_per_scope건과 TTL 이내 항목만 남김
+                self._conn.execute(
+                    "DELETE FROM ai_near_duplicates WHERE scope = ? AND id NOT IN ("
+                    " SELECT id FROM ai_near_duplicates WHERE scope = ? ORDER BY id DESC LIMIT ?)",
+                    (scope, scope, self.max_per_scope),
+                )
+                self._conn.execute(
+                    "DELETE FROM ai_near_duplicates WHERE created_at < ?", (now - self.ttl_seconds,)
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scopes.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM ai_near_duplicates")
+                self._conn.commit()
+
+
+_index: Optional[NearDuplicateIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_near_duplicate_index() -> Optional[NearDuplicateIndex]:
+    """프로세스 공용 유사 수행내역 색인을 반환한다. 비활성화된 경우 None."""
+    global _index
+    if not settings.ai_near_dup_enabled:
+        return None
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = NearDuplicateIndex(
+                    path=settings.ai_cache_path,
+                    threshold=settings.ai_near_dup_threshold,
+                    ttl_seconds=settings.ai_cache_ttl_seconds,
+                    max_per_scope=settings.ai_near_dup_max_per_objective,
+                )
+    return _index
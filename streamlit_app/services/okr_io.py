@@ -0,0 +1,427 @@
+from __future__ import annotations
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.exc import DataError, IntegrityError
+
+from db import repository
+
+FORMATS = ("csv", "jsonl", "parquet")
+DEFAULT_CHUNK_SIZE = 5000
+MAX_REPORTED_ERRORS = 100
+
+
+def _text(value: Any) -> str:
+    return str(value)
+
+
+def _int(value: Any) -> int:
+    return int(value)
+
+
+def _float(value: Any) -> float:
+    return float(value)
+
+
+def _bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "t", "yes")
+    return bool(value)
+
+
+def _date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+def _datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """가져오기 대상 테이블: 필수/선택 컬럼 변환기, 부모 참조, 저장 함수"""
+    required: Dict[str, Callable[[Any], Any]]
+    optional: Dict[str, Callable[[Any], Any]]
+    parents: Dict[str, str]  # 컬럼 → 참조 테이블
+    insert: Callable[[List[Dict[str, Any]], int], Any]  # (rows, chunk_size)
+
+
+# 부모 → 자식 순서 (cycles → objectives → key_results → kr_updates/daily_progress)
+TABLES: Dict[str, TableSpec] = {
+    "cycles": TableSpec(
+        required={"company_id": _int, "name": _text, "start_date": _date, "end_date": _date},
+        optional={"id": _int},
+        parents={"company_id": "companies"},
+        insert=repository.bulk_add_cycles,
+    ),
+    "objectives": TableSpec(
+        required={"cycle_id": _int, "owner": _text, "text": _text},
+        optional={"id": _int},
+        parents={"cycle_id": "okr_cycles"},
+        insert=repository.bulk_add_objectives,
+    ),
+    "key_results": TableSpec(
+        required={"objective_id": _int, "text": _text},
+        optional={"id": _int, "target": _float, "unit": _text, "current": _float, "confidence": _int},
+        parents={"objective_id": "objectives"},
+        insert=repository.bulk_add_key_results,
+    ),
+    "kr_updates": TableSpec(
+        required={"kr_id": _int, "note": _text},
+        optional={"id": _int, "progress": _float, "created_at": _datetime},
+        parents={"kr_id": "key_results"},
+        insert=repository.bulk_add_kr_updates,
+    ),
+    "daily_progress": TableSpec(
+        required={"objective_id": _int, "date": _date, "content": _text},
+        optional={
+            "id": _int, "ai_validation": _text, "ai_comment": _text, "is_draft": _bool, "draft_owner": _text,
+            "created_at": _datetime,
+        },
+        parents={"objective_id": "objectives"},
+        insert=repository.bulk_add_daily_progress,
+    ),
+}
+
+# 내보내기 테이블 이름 → DB 테이블 이름
+EXPORT_TABLES = {
+    "companies": "companies",
+    "cycles": "okr_cycles",
+    "objectives": "objectives",
+    "key_results": "key_results",
+    "kr_updates": "kr_updates",
+    "daily_progress": "daily_progress",
+}
+
+
+@dataclass
+class RowError:
+    line: int  # 파일 안의 레코드 번호 (1부터, CSV 헤더 제외)
+    message: str
+
+
+@dataclass
+class ImportReport:
+    """가져오기 실행 결과 요약. errors에는 앞쪽 MAX_REPORTED_ERRORS건만 보관한다."""
+    table: str
+    total: int = 0
+    inserted: int = 0
+    failed: int = 0
+    chunks: int = 0
+    elapsed_seconds: float = 0.0
+    errors: List[RowError] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.total / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def add_error(self, line: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(RowError(line, message))
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data.update(
+            elapsed_seconds=round(self.elapsed_seconds, 3),
+            rows_per_second=round(self.rows_per_second, 1),
+        )
+        return data
+
+
+@dataclass
+class ExportReport:
+    table: str
+    rows: int = 0
+    elapsed_seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "table": self.table,
+            "rows": self.rows,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.rows / self.elapsed_seconds, 1) if self.elapsed_seconds else 0.0,
+        }
+
+
+def detect_format(path: str, fmt: Optional[str] = None) -> str:
+    """--format 또는 확장자(.csv/.jsonl/.ndjson/.parquet)로 형식을 정한다."""
+    if fmt:
+        return fmt
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    if ext == "ndjson":
+        return "jsonl"
+    if ext in FORMATS:
+        return ext
+    raise ValueError(f"파일 형식을 알 수 없습니다: {path} (--format {'/'.join(FORMATS)})")
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise RuntimeError("Parquet을 쓰려면 pyarrow를 설치하세요: pip install pyarrow") from e
+    return pyarrow
+
+
+# Readers: 레코드를 하나씩 흘려보내는 제너레이터 (파일 전체를 메모리에 올리지 않음)
+
+def _read_csv(path: str, chunk_size: int) -> Iterator[Dict[str, Any]]:
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def _read_jsonl(path: str, chunk_size: int) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                # 잘못된 줄도 레코드 하나로 세어 오류로 보고
+                record = {"__error__": f"JSON 파싱 실패: {e.msg}"}
+            yield record if isinstance(record, dict) else {"__error__": "객체(JSON object)가 아닙니다"}
+
+
+def _read_parquet(path: str, chunk_size: int) -> Iterator[Dict[str, Any]]:
+    pa = _require_pyarrow()
+    parquet_file = pa.parquet.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_size):
+        yield from batch.to_pylist()
+
+
+_READERS = {"csv": _read_csv, "jsonl": _read_jsonl, "parquet": _read_parquet}
+
+
+def _parse_row(spec: TableSpec, record: Dict[str, Any]) -> Dict[str, Any]:
+    """레코드를 컬럼 타입에 맞게 변환한다. 빈 문자열은 값 없음으로 본다."""
+    if "__error__" in record:
+        raise ValueError(record["__error__"])
+    row: Dict[str, Any] = {}
+    for name, convert in spec.required.items():
+        value = record.get(name)
+        if value is None or value == "":
+            raise ValueError(f"필수 컬럼 누락: {name}")
+        row[name] = convert(value)
+    for name, convert in spec.optional.items():
+        value = record.get(name)
+        if value is None or value == "":
+            if name != "id":
+                row[name] = None
+            continue
+        row[name] = convert(value)
+    return row
+
+
+def _insert_chunk(
+    spec: TableSpec,
+    rows: List[Tuple[int, Dict[str, Any]]],
+    report: ImportReport,
+    error: Callable[[int, str], None],
+) -> None:
+    """한 묶음을 한 트랜잭션으로 저장한다. 행 데이터 때문에 실패하면 묶음을 반으로 나눠 문제 행만 보고한다.
+
+    OperationalError(잠금, 연결 끊김 등)는 행 문제가 아니므로 그대로 올린다.
+    """
+    if not rows:
+        return
+    try:
+        # 묶음 전체를 한 번에 넣어 롤업 갱신도 묶음당 한 번만 수행
+        spec.insert([row for _, row in rows], len(rows))
+        report.inserted += len(rows)
+        return
+    except (IntegrityError, DataError) as e:
+        if len(rows) == 1:
+            error(rows[0][0], str(e).splitlines()[0])
+            return
+    middle = len(rows) // 2
+    _insert_chunk(spec, rows[:middle], report, error)
+    _insert_chunk(spec, rows[middle:], report, error)
+
+
+def import_records(
+    table: str,
+    records: Iterable[Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_error: Optional[Callable[[RowError], None]] = None,
+) -> ImportReport:
+    """레코드 스트림을 chunk_size건씩 검증·저장한다. 잘못된 행은 건너뛰고 보고서에 남긴다.
+
+    on_error: 행 오류마다 호출 (오류 파일에 바로 기록할 때, 보고서 보관 한도와 무관)
+    """
+    spec = TABLES[table]
+    report = ImportReport(table=table)
+
+    def _error(line: int, message: str) -> None:
+        report.add_error(line, message)
+        if on_error is not None:
+            on_error(RowError(line, message))
+
+    started = time.perf_counter()
+    numbered = enumerate(records, start=1)
+    while chunk := list(islice(numbered, chunk_size)):
+        report.total += len(chunk)
+        report.chunks += 1
+        parsed: List[Tuple[int, Dict[str, Any]]] = []
+        for line, record in chunk:
+            try:
+                parsed.append((line, _parse_row(spec, record)))
+            except (TypeError, ValueError) as e:
+                _error(line, str(e))
+        # 참조하는 부모 행이 없는 레코드 제외 (SQLite는 외래키를 강제하지 않음)
+        for column, parent in spec.parents.items():
+            found = repository.existing_ids(parent, (row[column] for _, row in parsed))
+            missing = [(line, row) for line, row in parsed if row[column] not in found]
+            for line, row in missing:
+                _error(line, f"{column}={row[column]} 이(가) {parent}에 없습니다")
+            if missing:
+                parsed = [(line, row) for line, row in parsed if row[column] in found]
+        _insert_chunk(spec, parsed, report, _error)
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+def import_file(
+    table: str,
+    path: str,
+    fmt: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    errors_path: Optional[str] = None,
+) -> ImportReport:
+    """CSV/JSONL/Parquet 파일을 스트리밍으로 읽어 table에 추가한다.
+
+    errors_path를 주면 행 오류를 JSONL로 모두 기록한다 (보고서에는 앞쪽 일부만).
+    """
+    repository.init_db()
+    reader = _READERS[detect_format(path, fmt)]
+    if errors_path is None:
+        return import_records(table, reader(path, chunk_size), chunk_size)
+    with open(errors_path, "w", encoding="utf-8") as errors:
+        def _write(error: RowError) -> None:
+            errors.write(json.dumps(asdict(error), ensure_ascii=False) + "\n")
+
+        return import_records(table, reader(path, chunk_size), chunk_size, on_error=_write)
+
+
+# Writers: 조회 결과를 묶음 단위로 바로 파일에 씀
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"JSON으로 쓸 수 없는 값: {type(value).__name__}")
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return "" if value is None else value
+
+
+def _write_csv(path: str, columns: List[str], chunks: Iterable[List[Dict[str, Any]]]) -> int:
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for chunk in chunks:
+            writer.writerows([_csv_value(row[c]) for c in columns] for row in chunk)
+            count += len(chunk)
+    return count
+
+
+def _write_jsonl(path: str, columns: List[str], chunks: Iterable[List[Dict[str, Any]]]) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for chunk in chunks:
+            f.write("".join(
+                json.dumps({c: row[c] for c in columns}, ensure_ascii=False, default=_json_default) + "\n"
+                for row in chunk
+            ))
+            count += len(chunk)
+    return count
+
+
+def _arrow_schema(pa, table: str, columns: List[str]):
+    """DB 컬럼 타입 → Arrow 타입 (첫 묶음이 전부 NULL이어도 스키마가 고정되도록)"""
+    types = {bool: pa.bool_(), int: pa.int64(), float: pa.float64(), str: pa.string(), date: pa.date32(), datetime: pa.timestamp("us")}
+    python_types = repository.column_python_types(table)
+    return pa.schema([(c, types.get(python_types[c], pa.string())) for c in columns])
+
+
+def _write_parquet(path: str, columns: List[str], chunks: Iterable[List[Dict[str, Any]]], table: str) -> int:
+    pa = _require_pyarrow()
+    schema = _arrow_schema(pa, table, columns)
+    count = 0
+    with pa.parquet.ParquetWriter(path, schema) as writer:
+        for chunk in chunks:
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+            count += len(chunk)
+    return count
+
+
+def export_file(table: str, path: str, fmt: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ExportReport:
+    """테이블을 id 순으로 chunk_size행씩 읽어 바로 파일에 쓴다 (메모리 사용량 일정)."""
+    repository.init_db()
+    db_table = EXPORT_TABLES[table]
+    columns = repository.table_columns(db_table)
+    chunks = repository.iter_table_rows(db_table, chunk_size)
+    fmt = detect_format(path, fmt)
+    report = ExportReport(table=table)
+    started = time.perf_counter()
+    if fmt == "parquet":
+        report.rows = _write_parquet(path, columns, chunks, db_table)
+    elif fmt == "jsonl":
+        report.rows = _write_jsonl(path, columns, chunks)
+    else:
+        report.rows = _write_csv(path, columns, chunks)
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: python streamlit_app/services/okr_io.py import kr_updates updates.csv --errors errors.jsonl"""
+    parser = argparse.ArgumentParser(description="OKR 데이터 일괄 가져오기/내보내기 (CSV/JSONL/Parquet)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="파일 → DB (부모 테이블부터: cycles → objectives → key_results → ...)")
+    imp.add_argument("table", choices=list(TABLES))
+    imp.add_argument("path")
+    imp.add_argument("--errors", help="행 오류를 모두 기록할 JSONL 파일")
+
+    exp = sub.add_parser("export", help="DB → 파일")
+    exp.add_argument("table", choices=list(EXPORT_TABLES))
+    exp.add_argument("path")
+
+    for p in (imp, exp):
+        p.add_argument("--format", choices=FORMATS, help="기본: 확장자로 판단")
+        p.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="트랜잭션/읽기 묶음 크기")
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        report = import_file(args.table, args.path, args.format, args.chunk_size, args.errors)
+        print(json.dumps(report.as_dict(), ensure_ascii=False, indent=2))
+        return 0 if report.failed == 0 else 1
+    report = export_file(args.table, args.path, args.format, args.chunk_size)
+    print(json.dumps(report.as_dict(), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
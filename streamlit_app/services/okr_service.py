@@ -0,0 +1,189 @@
+from __future__ import annotations
+import os
+import sys
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db import repository
+from db.snapshots import CycleProgressRow, CycleRow, LogSearchHit, ObjectiveProgressRow
+from config.settings import settings
+from services.draft_autosave import Draft, DraftWriteBehind
+from services.structured_feedback import stored_markdown
+
+# 메인 화면(좌측 패널)의 OKR을 저장할 때 쓰는 기본 회사/담당자
+DEFAULT_COMPANY = "default"
+DEFAULT_OWNER = "me"
+
+
+def list_cycles() -> List[CycleRow]:
+    """대시보드에서 선택할 OKR 사이클 목록"""
+    repository.init_db()
+    return repository.list_cycle_rows()
+
+
+def cycle_progress(cycle_id: int) -> tuple[Optional[CycleProgressRow], Dict[int, ObjectiveProgressRow]]:
+    """사이클 진행률과 Objective별 진행률(롤업)을 반환한다."""
+    objectives = {row.objective_id: row for row in repository.get_objective_progress(cycle_id)}
+    return repository.get_cycle_progress(cycle_id), objectives
+
+
+def objective_progress(objective: str, start_date: date, end_date: date) -> Optional[ObjectiveProgressRow]:
+    """좌측 패널 OKR의 저장된 진행률 롤업. 아직 저장되지 않았거나 KR이 없으면 None"""
+    repository.init_db()
+    company_id = _company_id(create=False)
+    cycle_id = repository.find_cycle_id(company_id, start_date, end_date) if company_id is not None else None
+    if cycle_id is None:
+        return None
+    objective_id = repository.find_objective_id(cycle_id, objective)
+    for row in repository.get_objective_progress(cycle_id):
+        if row.objective_id == objective_id and row.kr_count:
+            return row
+    return None
+
+
+def search_logs(query: str, cycle_id: Optional[int] = None, limit: int = 50) -> List[LogSearchHit]:
+    """수행내역/KR 노트 검색 (사이클 지정 시 그 사이클만)"""
+    if not query.strip():
+        return []
+    return repository.search_logs(query, cycle_id=cycle_id, limit=limit)
+
+
+def read_cache_stats() -> dict:
+    """조회 캐시 적중률/경과 시간 (디버깅 패널용)"""
+    return repository.read_cache_stats()
+
+
+def _company_id(create: bool = True) -> Optional[int]:
+    """기본 회사 ID. 조회 캐시를 거치므로 rerun마다 DB를 읽지 않는다."""
+    company_id = repository.find_company_id(DEFAULT_COMPANY)
+    if company_id is None and create:
+        company_id = repository.upsert_company(DEFAULT_COMPANY).id
+    return company_id
+
+
+def _objective_id(
+    objective: str,
+    key_results: List[str],
+    start_date: date,
+    end_date: date,
+    create: bool = True,
+) -> Optional[int]:
+    """좌측 패널의 OKR(사이클/Objective/KR)을 찾는다. create면 없을 때 만든다."""
+    repository.init_db()
+    company_id = _company_id(create)
+    if company_id is None:
+        return None
+    cycle_id = repository.find_cycle_id(company_id, start_date, end_date)
+    if cycle_id is None:
+        if not create:
+            return None
+        cycle_id = repository.create_cycle(company_id, f"{start_date} ~ {end_date}", start_date, end_date).id
+    objective_id = repository.find_objective_id(cycle_id, objective)
+    if objective_id is None and create:
+        objective_id, _ = repository.create_objective_with_krs(
+            cycle_id, DEFAULT_OWNER, objective, [kr for kr in key_results if kr.strip()],
+        )
+    return objective_id
+
+
+def record_daily_progress(
+    objective: str,
+    key_results: List[str],
+    start_date: date,
+    end_date: date,
+    day: date,
+    content: str,
+    session_id: Optional[str] = None,
+) -> int:
+    """좌측 패널의 OKR(사이클/Objective/KR)을 찾거나 만들고 수행내역을 저장해 ID를 반환한다.
+
+    그날 자동 저장된 초안은 이 수행내역으로 전환된다.
+    """
+    if session_id is not None:
+        _drafts.discard(session_id, day)
+    objective_id = _objective_id(objective, key_results, start_date, end_date)
+    return repository.add_daily_progress(objective_id, day, content, draft_owner=session_id)
+
+
+def _save_drafts(drafts: List[Tuple[str, Draft]]) -> int:
+    """(세션, 초안) 목록을 한 트랜잭션으로 저장한다 (write-behind 버퍼의 flush에서 호출)."""
+    rows = []
+    objective_ids: Dict[tuple, Optional[int]] = {}
+    for session_id, draft in drafts:
+        if not draft.objective.strip():
+            continue
+        target = (draft.objective, draft.key_results, draft.start_date, draft.end_date)
+        if target not in objective_ids:
+            # 내용을 지우는 경우에는 OKR을 새로 만들지 않음
+            objective_ids[target] = _objective_id(
+                draft.objective, list(draft.key_results), draft.start_date, draft.end_date,
+                create=bool(draft.content.strip()),
+            )
+        if objective_ids[target] is not None:
+            rows.append((session_id, objective_ids[target], draft.day, draft.content))
+    return repository.save_drafts(rows)
+
+
+_drafts = DraftWriteBehind(_save_drafts, settings.draft_flush_seconds, settings.draft_max_delay_seconds)
+
+
+def autosave_draft(
+    session_id: str,
+    objective: str,
+    key_results: List[str],
+    start_date: date,
+    end_date: date,
+    day: date,
+    content: str,
+) -> None:
+    """rerun마다 현재 입력을 초안 버퍼에 넣는다 (DB에는 쓰지 않음, 백그라운드에서 모아서 저장)."""
+    if settings.draft_autosave_enabled:
+        _drafts.put(session_id, Draft(objective, tuple(key_results), start_date, end_date, day, content))
+
+
+def load_draft(
+    session_id: str,
+    objective: str,
+    key_results: List[str],
+    start_date: date,
+    end_date: date,
+    day: date,
+) -> Optional[str]:
+    """이 세션이 쓴 그날의 초안 (아직 저장 전인 버퍼의 값이 우선). 없으면 None.
+
+    같은 기본 Objective를 쓰는 다른 세션의 초안은 읽지 않는다.
+    """
+    if not settings.draft_autosave_enabled:
+        return None
+    pending = _drafts.pending(session_id, objective, start_date, end_date, day)
+    if pending is not None:
+        content = pending.content
+    else:
+        repository.init_db()
+        content = repository.find_draft(DEFAULT_COMPANY, start_date, end_date, objective, day, session_id)
+    if content:
+        _drafts.seen(session_id, Draft(objective, tuple(key_results), start_date, end_date, day, content))
+    return content
+
+
+def flush_drafts() -> int:
+    """대기 중인 초안을 바로 저장한다 (테스트/종료 시)."""
+    return _drafts.flush(force=True)
+
+
+def draft_stats() -> dict:
+    """초안 버퍼 통계 (디버깅 패널용)"""
+    return vars(_drafts.stats).copy()
+
+
+def daily_feedback(objective: str, start_date: date, end_date: date, day: date) -> List[tuple[str, str]]:
+    """그날 저장된 수행내역과 AI 검증 결과(Markdown) 목록. 저장된 결과를 그대로 그리며 모델은 호출하지 않는다."""
+    repository.init_db()
+    return [
+        (content, stored_markdown(ai_validation))
+        for content, ai_validation in repository.find_daily_progress(
+            DEFAULT_COMPANY, start_date, end_date, objective, day,
+        )
+    ]
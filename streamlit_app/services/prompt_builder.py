@@ -0,0 +1,198 @@
+from __future__ import annotations
+import os
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional
+
+# tiktoken이 있으면 정확히 세고, 없으면 보수적인 근사치를 사용
+try:
+    import tiktoken
+except Exception:  # 선택 의존성
+    tiktoken = None  # type: ignore
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+
+NOTES_OMITTED = "\n…(중략)…\n"
+PROMPT_NOTES_REFERENCE = "(위 Progress Notes 참고)"
+
+# 예산 초과 시 각 부분의 최대 비율 (나머지는 수행내역에 배정)
+OBJECTIVE_SHARE = 0.15
+KR_SHARE = 0.05
+USER_PROMPT_SHARE = 0.10
+MIN_PART_TOKENS = 32
+# 토큰 1개가 덮는 최대 글자 수 추정치. 탐색 범위를 줄여 붙여넣은 길이와 무관하게 빠르게 자른다
+MAX_CHARS_PER_TOKEN = 16
+
+
+@dataclass(frozen=True)
+class BuiltPrompt:
+    """예산에 맞춰 구성한 사용자 메시지와 절감량"""
+    user_content: str
+    tokens: int
+    original_tokens: int
+    trimmed: bool  # 중복 제거 외에 잘라낸 부분이 있는지 (예산 안이면 원문 그대로)
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.original_tokens - self.tokens)
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        try:
+            return tiktoken.get_encoding("o200k_base")
+        except Exception:
+            # 인코딩 파일을 받을 수 없는 환경
+            return None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """텍스트의 토큰 수. tiktoken이 없으면 ASCII 4자당 1, 그 외(한글 등) 1자당 1로 넉넉하게 센다."""
+    encoding = _encoding(model or settings.openai_model)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return (len(text) - non_ascii + 3) // 4 + non_ascii
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _dedupe_krs(key_results: List[str]) -> List[str]:
+    """빈 KR과 공백/대소문자만 다른 중복 KR을 제거한다 (순서 유지)."""
+    seen = set()
+    result: List[str] = []
+    for kr in key_results:
+        text = _normalize(kr)
+        if text and text.casefold() not in seen:
+            seen.add(text.casefold())
+            result.append(text)
+    return result
+
+
+def _dedupe_notes(notes: str) -> str:
+    """바로 앞과 같은 블록(빈 줄로 나뉜 문단)과 연속으로 반복된 같은 줄을 한 번만 남긴다.
+
+    떨어져 있는 같은 줄(반복 일과 등)은 그대로 둔다. 예산을 넘을 때만 사용한다.
+    """
+    blocks: List[List[str]] = []
+    previous_key = None
+    for block in re.split(r"\n\s*\n", notes.strip()):
+        lines: List[str] = []
+        for line in block.splitlines():
+            line = line.rstrip()
+            if not lines or _normalize(line).casefold() != _normalize(lines[-1]).casefold():
+                lines.append(line)
+        key = _normalize("\n".join(lines)).casefold()
+        if key and key != previous_key:
+            blocks.append(lines)
+            previous_key = key
+    return "\n\n".join("\n".join(lines) for lines in blocks)
+
+
+def _prefix(text: str, max_tokens: int, model: Optional[str]) -> str:
+    """max_tokens 이하가 되는 가장 긴 앞부분 (이진 탐색)"""
+    lo, hi = 0, min(len(text), max_tokens * MAX_CHARS_PER_TOKEN)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if count_tokens(text[:mid], model) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo]
+
+
+def _suffix(text: str, max_tokens: int, model: Optional[str]) -> str:
+    """max_tokens 이하가 되는 가장 긴 뒷부분"""
+    lo, hi = 0, min(len(text), max_tokens * MAX_CHARS_PER_TOKEN)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if count_tokens(text[len(text) - mid:], model) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[len(text) - lo:]
+
+
+def _truncate(text: str, max_tokens: int, model: Optional[str]) -> str:
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    return _prefix(text, max(0, max_tokens - 1), model).rstrip() + "…"
+
+
+def _truncate_middle(text: str, max_tokens: int, model: Optional[str]) -> str:
+    """앞부분과 최근(뒷부분) 내용을 남기고 가운데를 생략한다."""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    available = max_tokens - count_tokens(NOTES_OMITTED, model)
+    if available <= 0:
+        return ""
+    head = _prefix(text, available // 2, model)
+    tail = _suffix(text, available - count_tokens(head, model), model)
+    return head.rstrip() + NOTES_OMITTED + tail.lstrip()
+
+
+def render_user_content(objective: str, key_results: List[str], progress_notes: str, user_prompt: str = "") -> str:
+    """Objective/KR/수행내역/추가 요구사항으로 사용자 메시지를 구성한다.
+
+    호출마다 같은 시스템 프롬프트 → Objective → KR 순으로 두고 자주 바뀌는 수행내역과
+    추가 요구사항을 뒤에 배치해, 앞부분이 제공자 측 prompt caching 대상이 되도록 한다.
+    """
+    return (
+        "# Objective\n" + objective.strip() + "\n\n" +
+        "# Key Results\n- " + "\n- ".join(kr.strip() for kr in key_results if kr.strip()) + "\n\n" +
+        "# Progress Notes (최근 수행내역)\n" + progress_notes.strip() + "\n\n" +
+        (f"# 추가 요구사항\n{user_prompt.strip()}\n" if user_prompt.strip() else "")
+    )
+
+
+def build_user_content(
+    objective: str,
+    key_results: List[str],
+    progress_notes: str,
+    user_prompt: str = "",
+    budget_tokens: int = settings.openai_prompt_token_budget,
+    model: Optional[str] = None,
+) -> BuiltPrompt:
+    """토큰 예산(budget_tokens)에 맞춰 사용자 메시지를 만든다.
+
+    예산 안이면 입력을 그대로 보낸다. 넘으면 먼저 중복을 제거하고, 그래도 넘으면
+    Objective/KR/추가 요구사항은 각자 상한까지 줄이고 남는 예산을 수행내역에 배정해
+    앞부분과 최근 내용을 남긴다.
+    """
+    content = render_user_content(objective, key_results, progress_notes, user_prompt)
+    original_tokens = count_tokens(content, model)
+    if original_tokens <= budget_tokens:
+        return BuiltPrompt(content, original_tokens, original_tokens, trimmed=False)
+
+    krs = _dedupe_krs(key_results)
+    notes = _dedupe_notes(progress_notes)
+    prompt = user_prompt.strip()
+    # 추가 요구사항에 수행내역 원문이 그대로 들어 있으면 한 번만 보낸다
+    if len(progress_notes.strip()) > len(PROMPT_NOTES_REFERENCE) and progress_notes.strip() in prompt:
+        prompt = prompt.replace(progress_notes.strip(), PROMPT_NOTES_REFERENCE)
+
+    content = render_user_content(objective, krs, notes, prompt)
+    tokens = count_tokens(content, model)
+    if tokens <= budget_tokens:
+        return BuiltPrompt(content, tokens, original_tokens, trimmed=False)
+
+    objective = _truncate(objective.strip(), max(MIN_PART_TOKENS, int(budget_tokens * OBJECTIVE_SHARE)), model)
+    kr_cap = max(MIN_PART_TOKENS, int(budget_tokens * KR_SHARE))
+    krs = [_truncate(kr, kr_cap, model) for kr in krs]
+    prompt = _truncate(prompt, max(MIN_PART_TOKENS, int(budget_tokens * USER_PROMPT_SHARE)), model)
+    fixed = count_tokens(render_user_content(objective, krs, "", prompt), model)
+    notes = _truncate_middle(notes, budget_tokens - fixed, model)
+
+    content = render_user_content(objective, krs, notes, prompt)
+    return BuiltPrompt(content, count_tokens(content, model), original_tokens, trimmed=True)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+import asyncio
+import os
+import sys
+import threading
+import time
+from typing import Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+
+
+class TokenBucket:
+    """스레드 안전한 토큰 버킷 레이트 리미터 (초당 rate개, 최대 capacity개까지 누적)"""
+
+    def __init__(self, rate_per_second: float, capacity: float | None = None) -> None:
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.rate = rate_per_second
+        self.capacity = capacity if capacity is not None else max(1.0, rate_per_second)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        # pause() 중에는 _updated가 미래 시각이므로 채우지 않음
+        if now <= self._updated:
+            return
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 얻으면 0, 아니면 기다려야 할 시간(초)을 반환한다."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self._updated and self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return max(0.0, self._updated - now) + (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """토큰을 얻을 때까지 대기한다."""
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """acquire의 비동기 버전 (이벤트 루프를 막지 않고 기다림, 같은 버킷을 스레드와 공유)"""
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """서버가 429(Retry-After)를 보내면 그 시간 동안 모든 호출자의 요청을 멈춘다."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = 0.0
+            self._updated = max(self._updated, now + seconds)
+
+    def set_rate(self, rate_per_second: float, capacity: float | None = None) -> None:
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate_per_second
+            self.capacity = capacity if capacity is not None else max(1.0, rate_per_second)
+            self._tokens = min(self._tokens, self.capacity)
+
+
+_shared: Optional[TokenBucket] = None
+_shared_lock = threading.Lock()
+
+
+def shared_limiter() -> Optional[TokenBucket]:
+    """프로세스 전체(모든 세션·일괄 검증)가 함께 쓰는 OpenAI 요청 리미터.
+
+    AI_RATE_LIMIT_PER_SECOND가 0 이하이고 set_shared_rate로 만든 적도 없으면 None(제한 없음).
+    """
+    global _shared
+    if _shared is None:
+        if settings.ai_rate_limit_per_second <= 0:
+            return None
+        with _shared_lock:
+            if _shared is None:
+                _shared = TokenBucket(settings.ai_rate_limit_per_second)
+    return _shared
+
+
+def set_shared_rate(rate_per_second: float) -> TokenBucket:
+    """공용 리미터의 속도를 바꾼다. 설정으로 꺼져 있으면 이 속도로 새로 만든다 (일괄 검증 --rate)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = TokenBucket(rate_per_second)
+        else:
+            _shared.set_rate(rate_per_second)
+        return _shared
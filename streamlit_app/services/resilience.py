@@ -0,0 +1,181 @@
+from __future__ import annotations
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeout
+from email.utils import parsedate_to_datetime
+from typing import Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from services.metrics import registry
+from services.rate_limit import TokenBucket
+
+T = TypeVar("T")
+
+# 재시도할 일시 오류: 타임아웃/충돌/429/5xx (그 외 4xx는 다시 보내도 같은 결과)
+TRANSIENT_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+_TRANSIENT_ERROR_NAMES = frozenset({"APITimeoutError", "APIConnectionError", "TimeoutError", "ConnectionError"})
+HEDGE_WORKERS = 32
+
+
+def status_code(error: Exception) -> Optional[int]:
+    return getattr(error, "status_code", None)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """다시 시도하면 성공할 수 있는 오류(429, 5xx, 타임아웃, 연결 오류)인지"""
+    code = status_code(error)
+    if code is not None:
+        return code in TRANSIENT_STATUS_CODES
+    return any(cls.__name__ in _TRANSIENT_ERROR_NAMES for cls in type(error).__mro__)
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """응답 헤더의 Retry-After(-ms)를 초 단위로 읽는다. 없으면 None."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after-ms")
+        if value:
+            return max(0.0, float(value) / 1000)
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            # HTTP 날짜 형식
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """attempt번째(0부터) 재시도 전 대기 시간: 지수 백오프 + full jitter, Retry-After가 있으면 그 이상"""
+    cap = settings.openai_backoff_max_seconds
+    delay = random.uniform(0, min(cap, settings.openai_backoff_base_seconds * 2 ** attempt))
+    if retry_after is not None:
+        # 여러 요청이 같은 시각에 몰리지 않도록 약간 흩뜨림
+        delay = max(delay, retry_after * random.uniform(1.0, 1.1))
+    return min(cap, delay)
+
+
+def retry_delay(error: Exception, attempt: int, limiter: Optional[TokenBucket] = None) -> Optional[float]:
+    """재시도할 오류면 대기 시간(초), 재시도하지 않을 오류이거나 횟수를 다 썼으면 None.
+
+    429면 공용 리미터를 그 시간 동안 멈춰 다른 세션의 요청까지 함께 늦추고 0을 반환한다
+    (재시도 전 acquire가 멈춘 시간만큼 기다리므로 따로 잠들면 두 번 기다리게 됨).
+    """
+    if not is_transient_error(error) or attempt >= settings.openai_max_retries:
+        return None
+    registry.inc("okr_llm_retries_total", reason=str(status_code(error) or type(error).__name__))
+    delay = backoff_delay(attempt, retry_after_seconds(error))
+    if status_code(error) == 429 and limiter is not None:
+        limiter.pause(delay)
+        return 0.0
+    return delay
+
+
+class LatencyTracker:
+    """모델별 최근 성공 응답 시간으로 백분위수를 계산한다 (헤지 시점 결정용)."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20) -> None:
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, model: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(model, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, model: str, p: float) -> Optional[float]:
+        """표본이 min_samples보다 적으면 None"""
+        with self._lock:
+            samples = sorted(self._samples.get(model, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, max(0, round(p / 100 * (len(samples) - 1))))]
+
+
+class HedgePolicy:
+    """느린 요청 헤지: 첫 요청이 p95 시간 안에 끝나지 않으면 다음 모델로 한 번 더 보내고 먼저 끝난 쪽을 쓴다.
+
+    늦게 끝난 쪽은 취소할 수 없어(동기 HTTP) 백그라운드에서 끝까지 돌고 결과는 버린다.
+    """
+
+    def __init__(self, enabled: bool, percentile: float, default_delay: float) -> None:
+        self.enabled = enabled
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self.latencies = LatencyTracker()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix="llm-hedge")
+        return self._executor
+
+    def delay(self, model: str) -> float:
+        """헤지 요청을 보내기까지 기다릴 시간 (표본이 모이기 전에는 기본값)"""
+        observed = self.latencies.percentile(model, self.percentile)
+        return observed if observed is not None else self.default_delay
+
+    def _timed(self, call: Callable[[str], T], model: str) -> T:
+        started = time.perf_counter()
+        result = call(model)
+        self.latencies.observe(model, time.perf_counter() - started)
+        return result
+
+    def call(
+        self,
+        call: Callable[[str], T],
+        model: str,
+        hedge_model: Optional[str] = None,
+        limiter: Optional[TokenBucket] = None,
+        on_hedge_error: Optional[Callable[[str, BaseException], None]] = None,
+    ) -> Tuple[T, str]:
+        """call(model)을 실행해 (결과, 응답한 모델)을 반환한다. 둘 다 실패하면 첫 요청의 오류를 올린다.
+
+        on_hedge_error(hedge_model, 오류): 헤지 요청이 실패하면 (먼저 끝난 쪽과 관계없이) 호출된다.
+        """
+        if not self.enabled or hedge_model is None:
+            return self._timed(call, model), model
+        primary = self._pool().submit(self._timed, call, model)
+        try:
+            return primary.result(timeout=self.delay(model)), model
+        except FuturesTimeout:
+            pass
+        # 요청 한도가 남아 있을 때만 헤지 (429를 자초하지 않도록)
+        if limiter is not None and limiter.try_acquire() > 0:
+            return primary.result(), model
+        registry.inc("okr_llm_hedged_total", model=model)
+        hedge = self._pool().submit(self._timed, call, hedge_model)
+        if on_hedge_error is not None:
+            hedge.add_done_callback(
+                lambda f: on_hedge_error(hedge_model, f.exception()) if f.exception() is not None else None
+            )
+        models = {primary: model, hedge: hedge_model}
+        pending = set(models)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        registry.inc("okr_llm_hedge_wins_total", model=hedge_model)
+                    return future.result(), models[future]
+        raise primary.exception()  # type: ignore[misc]
+
+
+hedging = HedgePolicy(settings.ai_hedge_enabled, settings.ai_hedge_percentile, settings.ai_hedge_delay_seconds)
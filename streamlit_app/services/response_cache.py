@@ -0,0 +1,184 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+
+
+def make_cache_key(model: str, system_prompt: str, user_content: str, temperature: float) -> str:
+    """요청 내용(모델·시스템 프롬프트·사용자 입력·온도)으로 캐시 키(sha256)를 만든다."""
+    payload = json.dumps(
+        [model, system_prompt, user_content, round(float(temperature), 4)],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """캐시 적중/미스 카운터"""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / total if total else 0.0
+
+
+class ResponseCache:
+    """AI 응답 캐시: 프로세스 내 LRU + SQLite 영구 저장소(TTL, 최대 건수 기반 정리)"""
+
+    def __init__(
+        self,
+        path: Optional[str],
+        ttl_seconds: int,
+        max_entries: int,
+        memory_entries: int,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.stats = CacheStats()
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            self._conn = self._open(path)
+
+    @staticmethod
+    def _open(path: str) -> Optional[sqlite3.Connection]:
+        try:
+            if path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ai_responses ("
+                " key TEXT PRIMARY KEY,"
+                " response TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_ai_responses_accessed ON ai_responses (accessed_at)")
+            conn.commit()
+            return conn
+        except sqlite3.Error:
+            # 파일 저장소를 쓸 수 없으면 메모리 캐시만 사용
+            return None
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답을 반환한다. 만료되었거나 없으면 None."""
+        now = time.time()
+        with self._lock:
+            item = self._memory.get(key)
+            if item is not None:
+                created_at, response = item
+                if now - created_at <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    return response
+                del self._memory[key]
+
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT response, created_at FROM ai_responses WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None and now - row[1] <= self.ttl_seconds:
+                        self._conn.execute("UPDATE ai_responses SET accessed_at = ? WHERE key = ?", (now, key))
+                        self._conn.commit()
+                        self._remember(key, row[1], row[0])
+                        self.stats.disk_hits += 1
+                        return row[0]
+                    if row is not None:
+                        self._conn.execute("DELETE FROM ai_responses WHERE key = ?", (key,))
+                        self._conn.commit()
+                except sqlite3.Error:
+                    pass
+
+            self.stats.misses += 1
+            return None
+
+    def set(self, key: str, response: str) -> None:
+        """응답을 두 저장소에 기록하고 필요 시 오래된 항목을 정리한다."""
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, response)
+            self.stats.writes += 1
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO ai_responses (key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, response, now, now),
+                )
+                self._evict(now)
+                self._conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 삭제한다."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM ai_responses")
+                self._conn.commit()
+
+    def _remember(self, key: str, created_at: float, response: str) -> None:
+        self._memory[key] = (created_at, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self, now: float) -> None:
+        assert self._conn is not None
+        expired = self._conn.execute(
+            "DELETE FROM ai_responses WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM ai_responses").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            # 가장 오래 사용되지 않은 항목부터 삭제
+            self._conn.execute(
+                "DELETE FROM ai_responses WHERE key IN ("
+                " SELECT key FROM ai_responses ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+        self.stats.evictions += max(expired, 0) + max(overflow, 0)
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """프로세스 공용 응답 캐시를 반환한다. 비활성화된 경우 None."""
+    global _cache
+    if not settings.ai_cache_enabled:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache(
+                    path=settings.ai_cache_path,
+                    ttl_seconds=settings.ai_cache_ttl_seconds,
+                    max_entries=settings.ai_cache_max_entries,
+                    memory_entries=settings.ai_cache_memory_entries,
+                )
+    return _cache
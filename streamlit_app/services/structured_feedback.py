@@ -0,0 +1,134 @@
+from __future__ import annotations
+import json
+import re
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+# 구조화 출력 모드: 긴 Markdown 대신 짧은 JSON으로 받아 파싱한 필드를 DailyProgress.ai_validation에 저장한다.
+FEEDBACK_FORMAT = "okr_feedback.v1"
+
+STRUCTURED_SYSTEM_PROMPT = """
+You are a gap-finding coach for daily OKR logs. Judge only what the user wrote; never invent data or links
+and never give scores or grades. Answer in Korean, as short phrases, using the JSON schema provided:
+- missing_items: what is missing (item), why it matters (why), one-line fix (fix). At most 4.
+- rewrites: vague phrases from the log (original) and a concrete rewrite with numbers/units (improved). At most 3.
+- next_actions: actions doable within 24–48h. At most 3.
+- questions: yes/no or short-number questions about ambiguous points. At most 3.
+"""
+
+
+class _Strict(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+class MissingItem(_Strict):
+    item: str = Field(description="부족/누락 항목")
+    why: str = Field(description="왜 중요한지")
+    fix: str = Field(description="어떻게 보완할지 (한 문장)")
+
+
+class Rewrite(_Strict):
+    original: str = Field(description="원문 표현")
+    improved: str = Field(description="수치/단위/대상을 넣은 구체적인 예시")
+
+
+class StructuredFeedback(_Strict):
+    """구조화된 AI 검증 결과"""
+    missing_items: List[MissingItem] = Field(default_factory=list)
+    rewrites: List[Rewrite] = Field(default_factory=list)
+    next_actions: List[str] = Field(default_factory=list)
+    questions: List[str] = Field(default_factory=list)
+
+    def to_markdown(self) -> str:
+        """화면 표시용 Markdown (모델을 다시 호출하지 않고 저장된 구조에서 만든다)"""
+        lines: List[str] = []
+        if self.missing_items:
+            lines.append("**1) 부족/누락 항목**")
+            lines += [f"- **{m.item}** → {m.why} → {m.fix}" for m in self.missing_items]
+        if self.rewrites:
+            lines.append("\n**2) 모호·비구체 항목과 개선안**")
+            lines += [f"- '{r.original}' → '{r.improved}'" for r in self.rewrites]
+        if self.next_actions:
+            lines.append("\n**3) 다음 행동 (24–48시간)**")
+            lines += [f"{i}. {a}" for i, a in enumerate(self.next_actions, 1)]
+        if self.questions:
+            lines.append("\n**4) 확인 질문**")
+            lines += [f"- {q}" for q in self.questions]
+        return "\n".join(lines) or "보완할 항목이 없습니다."
+
+    def summary(self) -> str:
+        """목록/검색용 한 줄 요약 (ai_comment에 저장)"""
+        counts = f"누락 {len(self.missing_items)} · 개선 {len(self.rewrites)} · 질문 {len(self.questions)}"
+        return f"{counts} | 다음: {self.next_actions[0]}" if self.next_actions else counts
+
+    def to_stored(self) -> str:
+        """ai_validation 컬럼에 저장할 JSON (형식 버전 포함)"""
+        return json.dumps({"format": FEEDBACK_FORMAT, **self.model_dump()}, ensure_ascii=False, separators=(",", ":"))
+
+
+def _strict_schema(schema: dict) -> dict:
+    """OpenAI strict json_schema 규칙: 모든 객체는 추가 속성 금지, 모든 속성 필수"""
+    if schema.get("type") == "object" and "properties" in schema:
+        schema["additionalProperties"] = False
+        schema["required"] = list(schema["properties"])
+    for value in schema.values():
+        if isinstance(value, dict):
+            _strict_schema(value)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    _strict_schema(item)
+    # strict 모드는 default를 허용하지 않음
+    schema.pop("default", None)
+    return schema
+
+
+def response_format() -> dict:
+    """Chat Completions response_format 인자 (JSON Schema, strict)"""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "okr_feedback",
+            "strict": True,
+            "schema": _strict_schema(StructuredFeedback.model_json_schema()),
+        },
+    }
+
+
+_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+def parse_feedback(content: str) -> Optional[StructuredFeedback]:
+    """모델 응답(JSON, 코드 블록으로 감싼 경우 포함)을 검증해 파싱한다. 형식이 틀리면 None."""
+    try:
+        return StructuredFeedback.model_validate_json(_FENCE.sub("", content.strip()))
+    except ValidationError:
+        return None
+
+
+def load_stored(ai_validation: Optional[str]) -> Optional[StructuredFeedback]:
+    """저장된 ai_validation이 구조화 결과(JSON)면 파싱하고, 예전 Markdown 결과면 None"""
+    if not ai_validation or not ai_validation.lstrip().startswith("{"):
+        return None
+    try:
+        data = json.loads(ai_validation)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or data.pop("format", None) != FEEDBACK_FORMAT:
+        return None
+    try:
+        return StructuredFeedback.model_validate(data)
+    except ValidationError:
+        return None
+
+
+def stored_markdown(ai_validation: Optional[str]) -> str:
+    """저장된 검증 결과를 표시용 Markdown으로 (구조화 결과는 다시 그리고, 예전 결과는 그대로)"""
+    feedback = load_stored(ai_validation)
+    return feedback.to_markdown() if feedback is not None else (ai_validation or "")
+
+
+def stored_fields(feedback: StructuredFeedback) -> Tuple[str, str]:
+    """(ai_validation, ai_comment)"""
+    return feedback.to_stored(), feedback.summary()
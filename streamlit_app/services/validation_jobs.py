@@ -0,0 +1,184 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from db import repository
+from services.ai_validator import DEFAULT_MODEL, ValidationResult, validate_okr_stream
+from services.metrics import LLMCallMetrics, collect_llm_calls, registry
+
+
+@dataclass
+class ValidationJob:
+    """백그라운드 검증 작업 하나. text는 스트리밍으로 받는 중인 응답(버퍼)이다."""
+    id: str
+    key: str
+    status: str = "queued"  # queued → running → done
+    text: str = ""
+    result: Optional[ValidationResult] = None
+    daily_progress_ids: List[int] = field(default_factory=list)
+    subscribers: int = 1  # 이 작업을 기다리는 요청 수 (중복 요청이 합쳐진 만큼 증가)
+    created_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+    # 워커 스레드에는 rerun이 없으므로 LLM 호출 측정값을 모아 두었다가 결과를 가져가는 rerun에 붙인다
+    llm_calls: List[LLMCallMetrics] = field(default_factory=list)
+
+    @property
+    def done(self) -> bool:
+        return self.status == "done"
+
+
+def job_key(
+    objective: str,
+    key_results: List[str],
+    progress_notes: str,
+    user_prompt: str = "",
+    model: Optional[str] = None,
+) -> str:
+    """같은 입력이면 같은 키 (진행 중인 동일 요청을 하나로 합치는 기준)"""
+    payload = json.dumps(
+        [model or DEFAULT_MODEL, objective, list(key_results), progress_notes, user_prompt], ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ValidationJobQueue:
+    """프로세스 전체에서 공유하는 검증 작업 큐 (스레드 풀 + single-flight)
+
+    진행 중인 작업과 입력이 같은 요청은 새로 호출하지 않고 기존 작업에 합친다.
+    끝난 작업은 retention_seconds 동안 보관해 각 세션이 결과를 가져갈 수 있게 한다.
+    """
+
+    def __init__(self, max_workers: int, retention_seconds: float) -> None:
+        self.max_workers = max(1, max_workers)
+        self.retention_seconds = retention_seconds
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: Dict[str, ValidationJob] = {}
+        self._inflight: Dict[str, ValidationJob] = {}
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._coalesced = 0
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="validation-job")
+        return self._executor
+
+    def _prune(self, now: float) -> None:
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at > self.retention_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def submit(
+        self,
+        objective: str,
+        key_results: List[str],
+        progress_notes: str,
+        user_prompt: str = "",
+        model: Optional[str] = None,
+        daily_progress_id: Optional[int] = None,
+    ) -> ValidationJob:
+        """검증 작업을 큐에 넣고 바로 반환한다. 같은 요청이 진행 중이면 그 작업을 돌려준다.
+
+        daily_progress_id를 주면 검증이 성공했을 때 그 수행내역에 결과를 저장한다.
+        """
+        key = job_key(objective, key_results, progress_notes, user_prompt, model)
+        with self._lock:
+            self._prune(time.monotonic())
+            job = self._inflight.get(key)
+            if job is not None:
+                job.subscribers += 1
+                if daily_progress_id is not None:
+                    job.daily_progress_ids.append(daily_progress_id)
+                self._coalesced += 1
+                registry.inc("okr_validation_jobs_coalesced_total")
+                return job
+            job = ValidationJob(id=uuid.uuid4().hex, key=key)
+            if daily_progress_id is not None:
+                job.daily_progress_ids.append(daily_progress_id)
+            self._jobs[job.id] = job
+            self._inflight[key] = job
+            self._submitted += 1
+        registry.inc("okr_validation_jobs_submitted_total")
+        self._pool().submit(self._run, job, objective, list(key_results), progress_notes, user_prompt, model)
+        return job
+
+    def get(self, job_id: str) -> Optional[ValidationJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(
+        self,
+        job: ValidationJob,
+        objective: str,
+        key_results: List[str],
+        progress_notes: str,
+        user_prompt: str,
+        model: Optional[str],
+    ) -> None:
+        job.status = "running"
+        result: Optional[ValidationResult] = None
+        try:
+            with collect_llm_calls() as calls:
+                job.llm_calls = calls
+                stream = validate_okr_stream(objective, key_results, progress_notes, user_prompt, model=model)
+                while True:
+                    try:
+                        job.text += next(stream)
+                    except StopIteration as stop:
+                        result = stop.value
+                        break
+        except Exception as e:
+            result = ValidationResult(text=f"검증 중 오류가 발생했습니다: {e}", ok=False)
+        finally:
+            with self._lock:
+                self._inflight.pop(job.key, None)
+                # 마지막 조각 이후 합쳐진 요청까지 포함해 저장 대상을 확정
+                daily_progress_ids = list(job.daily_progress_ids)
+            job.result = result or ValidationResult(text=job.text, ok=False)
+            job.text = job.result.text
+            self._persist(job, daily_progress_ids)
+            job.finished_at = time.monotonic()
+            job.status = "done"
+            registry.inc("okr_validation_jobs_total", ok=str(job.result.ok).lower())
+
+    @staticmethod
+    def _persist(job: ValidationJob, daily_progress_ids: List[int]) -> None:
+        # 오류 안내문은 저장하지 않음 (일괄 검증과 같은 규칙)
+        if not job.result.ok or not daily_progress_ids:
+            return
+        try:
+            validation, comment = job.result.stored()
+            repository.save_validations((dp_id, validation, comment) for dp_id in daily_progress_ids)
+        except Exception:
+            registry.inc("okr_validation_jobs_persist_errors_total")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "submitted": self._submitted,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._inflight),
+                "retained": len(self._jobs),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+job_queue = ValidationJobQueue(settings.ai_job_workers, settings.ai_job_retention_seconds)
@@ -1,9 +1,25 @@
 from __future__ import annotations
+import html
+import os
 import streamlit as st
-from typing import List, Optional
+from functools import lru_cache
+from typing import Callable, List, Optional
 from datetime import datetime, date, timedelta
 
 PRIMARY_BTN = {"use_container_width": True}
+STYLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles.css")
+
+
+@lru_cache(maxsize=1)
+def _styles_html() -> str:
+    """styles.css는 프로세스당 한 번만 읽는다."""
+    with open(STYLES_PATH, "r", encoding="utf-8") as f:
+        return f"<style>{f.read()}</style>"
+
+
+def inject_styles():
+    """공통 CSS 적용 (rerun마다 호출해야 하지만 파일은 다시 읽지 않음)"""
+    st.markdown(_styles_html(), unsafe_allow_html=True)
 
 
 def page_header():
@@ -60,8 +76,15 @@ def left_panel() -> tuple[str, List[str], date, date, float]:
     return objective, krs, start_date, end_date, progress_percentage
 
 
-def right_panel(selected_date: Optional[date] = None, ai_feedback: str = ""):
-    """우측 패널: 달력 및 수행내역"""
+def right_panel(
+    selected_date: Optional[date] = None,
+    ai_feedback: str = "",
+    load_draft: Optional[Callable[[date], Optional[str]]] = None,
+):
+    """우측 패널: 달력 및 수행내역
+
+    load_draft: 날짜를 고르면 그날 자동 저장된 초안을 불러오는 함수(선택)
+    """
     st.subheader("📅 달력")
     
     # 달력 표시
@@ -72,12 +95,17 @@ def right_panel(selected_date: Optional[date] = None, ai_feedback: str = ""):
     # 선택된 날짜의 수행내역
     st.subheader(f"📝 {calendar_date} 수행내역")
     
-    # 수행내역 입력/수정
+    # 수행내역 입력/수정 (이 날짜를 처음 그릴 때만 저장된 초안으로 채움)
+    progress_key = f"progress_{calendar_date}"
+    if load_draft is not None and progress_key not in st.session_state:
+        draft = load_draft(calendar_date)
+        if draft:
+            st.session_state[progress_key] = draft
     progress_content = st.text_area(
         "오늘의 수행내역", 
         placeholder="오늘 진행한 작업과 성과를 입력하세요...",
         height=150,
-        key=f"progress_{calendar_date}"
+        key=progress_key
     )
     
     # AI 검증 버튼
@@ -88,26 +116,61 @@ def right_panel(selected_date: Optional[date] = None, ai_feedback: str = ""):
         else:
             st.warning("수행내역을 입력해주세요.")
     
-    # 기존 수행내역 표시 (임시 데이터)
-    if calendar_date == date.today():
-        st.markdown("""
+    # 기존 수행내역 표시 (저장된 기록은 saved_progress로 이 자리에 채움)
+    history_slot = st.container()
+    
+    # AI 검증 결과 표시 (스트리밍 결과도 같은 자리에 갱신)
+    feedback_slot = st.empty()
+    if ai_feedback:
+        _render_ai_feedback(feedback_slot, ai_feedback)
+    
+    return calendar_date, progress_content, should_validate, feedback_slot, history_slot
+
+
+def saved_progress(entries: List[tuple[str, str]]):
+    """선택한 날짜에 저장된 수행내역과 AI 검증 결과 (content, 검증 결과 Markdown)"""
+    for content, feedback in entries:
+        st.markdown(f"""
         <div class="progress-card">
-            <h4>오늘의 수행내역</h4>
-            <p>AI관련 오픈채팅방 리서치를 진행했습니다. 총 15개 채팅방을 조사하고, 
-            대학생들이 많이 활동하는 채널 3개를 식별했습니다.</p>
+            <p>{html.escape(content)}</p>
         </div>
         """, unsafe_allow_html=True)
-    
-    # AI 검증 결과 표시
-    if ai_feedback:
+        if feedback:
+            with st.expander("🤖 저장된 AI 검증 결과"):
+                st.markdown(feedback)
+
+
+def _render_ai_feedback(slot, text: str):
+    """AI 검증 결과를 지정한 자리(st.empty)에 그린다."""
+    with slot.container():
         st.subheader("🤖 AI 검증 결과")
         st.markdown(f"""
         <div class="ai-feedback">
-            {ai_feedback}
+            {text}
         </div>
         """, unsafe_allow_html=True)
-    
-    return calendar_date, progress_content, should_validate
+
+
+def _poll_ai_feedback(get_job: Callable[[], object], on_done: Callable[[object], None]):
+    job = get_job()
+    if job is None:
+        return
+    if job.done:
+        # 끝나면 결과를 세션에 넘기고 fragment 안에서 최종 결과를 그린다 (전체 rerun 없음)
+        on_done(job)
+    _render_ai_feedback(st.empty(), job.text or "AI가 수행내역을 검증 중입니다...")
+
+
+def poll_ai_feedback(
+    slot, get_job: Callable[[], object], on_done: Callable[[object], None], interval: float = 0.5,
+):
+    """백그라운드 검증 작업의 응답 버퍼를 interval초마다 다시 그린다 (fragment만 rerun).
+
+    get_job: services.validation_jobs.ValidationJob(또는 None)을 돌려주는 함수
+    on_done: 작업이 끝났을 때 결과를 세션에 옮기는 함수. 다음 전체 rerun부터는 fragment를 등록하지 않으므로 폴링이 멈춘다.
+    """
+    with slot.container():
+        st.fragment(_poll_ai_feedback, run_every=interval)(get_job, on_done)
 
 
 def show_ai_feedback(text: str):
@@ -120,30 +183,139 @@ def show_ai_feedback(text: str):
     """, unsafe_allow_html=True)
 
 
-def show_okr_evaluation(objective: str, krs: List[str], progress_percentage: float):
-    """OKR 목표 대비 현재 진행 상황 AI 평가"""
+STATUS_VIEW = {
+    "green": ("🟢 우수", "목표 달성을 위한 진행이 매우 좋습니다!"),
+    "yellow": ("🟡 보통", "목표 달성을 위해 더 집중이 필요합니다."),
+    "red": ("🔴 주의", "목표 달성을 위해 전략 재검토가 필요합니다."),
+}
+
+
+def show_okr_evaluation(
+    objective: str,
+    krs: List[str],
+    progress_percentage: float,
+    status_code: Optional[str] = None,
+    forecast=None,
+):
+    """OKR 목표 대비 현재 진행 상황 AI 평가
+
+    status_code: 진행률 롤업에 저장된 상태(green/yellow/red). 없으면 진행률로 판정한다.
+    forecast: services.kr_forecast.ObjectiveForecast (선택) - 종료일 예상 진행률 표시
+    """
     st.subheader("📊 OKR 진행 평가")
     
     # 간단한 평가 로직 (실제로는 AI를 통해 평가)
-    if progress_percentage >= 80:
-        status = "🟢 우수"
-        message = "목표 달성을 위한 진행이 매우 좋습니다!"
-    elif progress_percentage >= 50:
-        status = "🟡 보통"
-        message = "목표 달성을 위해 더 집중이 필요합니다."
-    else:
-        status = "🔴 주의"
-        message = "목표 달성을 위해 전략 재검토가 필요합니다."
+    if status_code is None:
+        if progress_percentage >= 80:
+            status_code = "green"
+        elif progress_percentage >= 50:
+            status_code = "yellow"
+        else:
+            status_code = "red"
+    status, message = STATUS_VIEW[status_code]
+    
+    forecast_html = ""
+    if forecast is not None:
+        forecast_html = (
+            f"<p><strong>종료일 예상 진행률:</strong> {forecast.projected_at_end:.0f}% · "
+            f"기간 내 달성 예상 KR {forecast.on_track_ratio:.0%}</p>"
+        )
     
     st.markdown(f"""
     <div class="progress-card">
         <h4>현재 상태: {status}</h4>
         <p>{message}</p>
         <p><strong>전체 진행률:</strong> {progress_percentage}%</p>
+        {forecast_html}
     </div>
     """, unsafe_allow_html=True)
 
 
+def cycle_dashboard(cycle_name: str, cycle_progress, objective_progress: dict, forecasts: list):
+    """사이클 대시보드: 사이클 진행률, Objective별 상태, KR별 추세/예측 표
+
+    cycle_progress: CycleProgressRow 또는 None, objective_progress: objective_id → ObjectiveProgressRow,
+    forecasts: List[ObjectiveForecast]
+    """
+    st.subheader(f"📈 {cycle_name}")
+    if cycle_progress is not None:
+        st.metric("사이클 진행률", f"{cycle_progress.progress:.0f}%", help=f"Objective {cycle_progress.objective_count}개 평균")
+    if not forecasts:
+        st.info("이 사이클에는 아직 Objective가 없습니다.")
+        return
+
+    for obj in forecasts:
+        rollup = objective_progress.get(obj.objective_id)
+        show_okr_evaluation(
+            obj.text,
+            [kr.text for kr in obj.krs],
+            round(rollup.progress, 1) if rollup else 0.0,
+            status_code=rollup.status if rollup else None,
+            forecast=obj,
+        )
+        st.dataframe(
+            [
+                {
+                    "KR": kr.text,
+                    "현재(%)": round(kr.current, 1),
+                    "일일 증가(%p)": round(kr.slope_per_day, 2),
+                    "종료일 예상(%)": round(kr.projected_at_end, 1),
+                    "95% 구간": (
+                        f"{kr.band_low:.0f}–{kr.band_high:.0f}" if kr.points > 2 else "-"
+                    ),
+                    "예상 달성일": kr.completion_date.isoformat() if kr.completion_date else "-",
+                    "기간 내 달성": "✅" if kr.on_track else "⚠️",
+                }
+                for kr in obj.krs
+            ],
+            use_container_width=True,
+            hide_index=True,
+        )
+
+
+def log_search_results(hits: list):
+    """수행내역/KR 노트 검색 결과 (hits: List[LogSearchHit], snippet의 **검색어** 강조 표시)"""
+    if not hits:
+        st.info("검색 결과가 없습니다.")
+        return
+    st.caption(f"{len(hits)}건 · 최신순")
+    for hit in hits:
+        label = "📝 수행내역" if hit.kind == "daily_progress" else "📊 KR 노트"
+        st.markdown(f"**{hit.day}** · {label} — {hit.snippet}")
+
+
+def debug_panel(rerun, read_cache: Optional[dict] = None, drafts: Optional[dict] = None):
+    """성능 디버그 패널: 이번 rerun의 구간별 시간, 쿼리 수, LLM 호출 측정값
+
+    rerun: services.metrics.RerunMetrics, read_cache: 조회 캐시 통계(선택), drafts: 초안 자동 저장 통계(선택)
+    """
+    with st.expander("🛠️ 성능 디버그", expanded=False):
+        total = f"{rerun.total_seconds * 1000:.0f} ms" if rerun.total_seconds is not None else "-"
+        cols = st.columns(3)
+        cols[0].metric("rerun", total)
+        cols[1].metric("DB 쿼리", f"{rerun.query_count}회", help=f"{rerun.query_seconds * 1000:.1f} ms")
+        cols[2].metric("LLM 호출", f"{len(rerun.llm_calls)}회")
+        st.dataframe(
+            [{"구간": name, "ms": round(seconds * 1000, 1)} for name, seconds in rerun.phases.items()],
+            use_container_width=True,
+            hide_index=True,
+        )
+        for call in rerun.llm_calls:
+            st.json({
+                "model": call.model,
+                "cached": call.cached,
+                "latency_ms": round(call.latency_seconds * 1000),
+                "ttft_ms": round(call.ttft_seconds * 1000) if call.ttft_seconds is not None else None,
+                "prompt_tokens": call.prompt_tokens,
+                "completion_tokens": call.completion_tokens,
+                "prompt_tokens_saved": call.prompt_tokens_saved,
+            })
+        if read_cache is not None:
+            st.caption(f"조회 캐시 적중률 {read_cache['hit_ratio']:.0%} · 항목 {read_cache['entries']}개")
+        if drafts is not None:
+            st.caption(f"초안 자동 저장: 변경 {drafts['puts']}회 → 저장 {drafts['flushes']}회 ({drafts['rows_written']}건)")
+
+
 # 기존 함수들 (호환성 유지)
 def objective_form() -> tuple[str, List[str], str, str]:
     """기존 함수 - 호환성 유지용"""
@@ -0,0 +1,18 @@
+"""앱 시작 예산 회귀 테스트: bench/startup_profile.py의 측정과 예산을 그대로 사용한다."""
+from __future__ import annotations
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "streamlit_app"))
+
+from bench.startup_profile import APP_MODULES, build_parser, build_report, profile_imports
+
+
+def test_openai_not_imported_at_startup():
+    assert profile_imports(APP_MODULES)["lazy_loaded"] == []
+
+
+def test_startup_within_budget():
+    report = build_report(build_parser().parse_args([]))
+    assert report["app"]["lazy_loaded"] == []
+    assert report["violations"] == []